@@ -0,0 +1,168 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class UserSnapshot:
+    """Compact stand-in for ``User`` with only what the permission classes read"""
+    __slots__ = ('id', 'role', 'is_staff', 'is_active')
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, id, role, is_staff, is_active):
+        self.id = id
+        self.role = role
+        self.is_staff = is_staff
+        self.is_active = is_active
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(user.id, user.role, user.is_staff, user.is_active)
+
+    @property
+    def pk(self):
+        return self.id
+
+    def as_tuple(self):
+        return self.id, self.role, self.is_staff, self.is_active
+
+    def __repr__(self):
+        return f'<UserSnapshot {self.id} ({self.role})>'
+
+
+def generation_key(user_id):
+    return f'auth:user:{user_id}:generation'
+
+
+def snapshot_key(user_id, jti):
+    return f'auth:user:{user_id}:{jti}'
+
+
+def invalidate_user_snapshots(user_id):
+    """Make every cached snapshot of the user stale, whatever token it was cached under.
+
+    Called by the ``User`` save and delete signals; ``QuerySet.update()`` sends
+    none, so code updating users in bulk must call it for each of them.
+    """
+    # Toujours une nouvelle génération : même absente, un snapshot en cours d'écriture ne la retrouvera pas
+    caches[settings.AUTH_USER_CACHE_ALIAS].set(generation_key(user_id), time.time_ns(), timeout=None)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that caches a ``UserSnapshot`` per user id and token ``jti``.
+
+    A snapshot is stored along with the user's generation, which
+    ``invalidate_user_snapshots`` renews whenever the user is saved or deleted
+    (see api/signals.py), so role changes and deactivations apply on the next
+    request. Both keys are read in one round trip.
+
+    ``AUTH_USER_CACHE_ALIAS`` must be shared by every worker (Redis,
+    Memcached): with a per-process cache the other workers keep their
+    snapshots for up to ``AUTH_USER_CACHE_TIMEOUT``. ``QuerySet.update()``
+    bypasses the signals; call ``invalidate_user_snapshots`` after it.
+
+    ``aauthenticate`` is the same step for async views: the cache is read and
+    written through its async API, and only a cache miss touches the
+    database, through the async ORM.
+    """
+
+    def get_user(self, validated_token):
+        user_id, generation, snapshot = self.read_snapshot(validated_token)
+        if snapshot is not None:
+            return snapshot
+
+        # Checks existence, is_active and revocation like the parent class
+        user = super().get_user(validated_token)
+        self.write_snapshot(validated_token, user_id, generation, user)
+        return user
+
+    async def aauthenticate(self, request):
+        """Async twin of ``authenticate``, returns ``(user, token)`` or None without a JWT"""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id, generation, snapshot = await self.aread_snapshot(validated_token)
+        if snapshot is not None:
+            return snapshot
+
+        user = await self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).afirst()
+        self.check_user(validated_token, user)
+        await self.awrite_snapshot(validated_token, user_id, generation, user)
+        return user
+
+    def check_user(self, validated_token, user):
+        """The checks of ``JWTAuthentication.get_user`` on an already fetched user (None if missing)"""
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        if api_settings.CHECK_REVOKE_TOKEN and (
+            validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password)
+        ):
+            raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+
+    def snapshot_keys(self, validated_token):
+        """Return ``(user_id, generation key, snapshot key)`` of the token"""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+        return user_id, generation_key(user_id), snapshot_key(user_id, validated_token.get(api_settings.JTI_CLAIM))
+
+    def read_snapshot(self, validated_token):
+        """Return ``(user_id, generation, snapshot)``, the snapshot being None unless it is still valid"""
+        user_id, gen_key, snap_key = self.snapshot_keys(validated_token)
+        cached = caches[settings.AUTH_USER_CACHE_ALIAS].get_many([gen_key, snap_key])
+        return (user_id, *self.valid_snapshot(cached.get(gen_key), cached.get(snap_key)))
+
+    async def aread_snapshot(self, validated_token):
+        user_id, gen_key, snap_key = self.snapshot_keys(validated_token)
+        cached = await caches[settings.AUTH_USER_CACHE_ALIAS].aget_many([gen_key, snap_key])
+        return (user_id, *self.valid_snapshot(cached.get(gen_key), cached.get(snap_key)))
+
+    @staticmethod
+    def valid_snapshot(generation, snapshot):
+        if generation is not None and snapshot is not None and snapshot[0] == generation:
+            return generation, UserSnapshot(*snapshot[1:])
+        return generation, None
+
+    def write_snapshot(self, validated_token, user_id, generation, user):
+        cache = caches[settings.AUTH_USER_CACHE_ALIAS]
+        if generation is None:
+            # Seeded from the clock so that an evicted generation never comes back. If one
+            # appeared since read_snapshot, the user may have changed after we loaded it
+            generation = time.time_ns()
+            if not cache.add(generation_key(user_id), generation, timeout=None):
+                return
+        cache.set(*self.snapshot_entry(validated_token, user_id, generation, user),
+                  timeout=settings.AUTH_USER_CACHE_TIMEOUT)
+
+    async def awrite_snapshot(self, validated_token, user_id, generation, user):
+        cache = caches[settings.AUTH_USER_CACHE_ALIAS]
+        if generation is None:
+            generation = time.time_ns()
+            if not await cache.aadd(generation_key(user_id), generation, timeout=None):
+                return
+        await cache.aset(*self.snapshot_entry(validated_token, user_id, generation, user),
+                         timeout=settings.AUTH_USER_CACHE_TIMEOUT)
+
+    @staticmethod
+    def snapshot_entry(validated_token, user_id, generation, user):
+        return (
+            snapshot_key(user_id, validated_token.get(api_settings.JTI_CLAIM)),
+            (generation, *UserSnapshot.from_user(user).as_tuple()),
+        )
@@ -0,0 +1,122 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from api.replicas import reading_from_replica
+
+
+class VersionedCache:
+    """Read-through cache of serialized payloads, invalidated by bumping a version counter.
+
+    Every entry key embeds the current version of the namespace, so a single
+    ``bump()`` makes all the previous entries unreachable; they are then
+    dropped by the backend's own LRU/TTL eviction (see ``CACHES`` in settings).
+
+    A payload read from a replica shortly after a bump may predate the change
+    that caused it, so it is only kept for ``REPLICA_PIN_SECONDS``.
+
+    The ``a``-prefixed methods are the async twins, for the async views: they
+    go through the backend's async API instead of blocking the event loop.
+    """
+
+    def __init__(self, namespace, alias='default'):
+        self.namespace = namespace
+        self.alias = alias
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    @property
+    def version_key(self):
+        return f'{self.namespace}:version'
+
+    @property
+    def bumped_key(self):
+        return f'{self.namespace}:bumped'
+
+    def get_version(self):
+        version = self.backend.get(self.version_key)
+        if version is None:
+            # Seeded from the clock so that a version evicted from the cache
+            # never comes back to a value that older entries were stored under
+            self.backend.add(self.version_key, time.time_ns(), timeout=None)
+            version = self.backend.get(self.version_key)
+        return version
+
+    async def aget_version(self):
+        version = await self.backend.aget(self.version_key)
+        if version is None:
+            await self.backend.aadd(self.version_key, time.time_ns(), timeout=None)
+            version = await self.backend.aget(self.version_key)
+        return version
+
+    def bump(self):
+        """Invalidate every entry of the namespace"""
+        try:
+            self.backend.incr(self.version_key)
+        except ValueError:
+            self.backend.add(self.version_key, time.time_ns(), timeout=None)
+        if settings.REPLICA_DATABASES:
+            self.backend.set(self.bumped_key, True, timeout=settings.REPLICA_PIN_SECONDS)
+
+    async def abump(self):
+        try:
+            await self.backend.aincr(self.version_key)
+        except ValueError:
+            await self.backend.aadd(self.version_key, time.time_ns(), timeout=None)
+        if settings.REPLICA_DATABASES:
+            await self.backend.aset(self.bumped_key, True, timeout=settings.REPLICA_PIN_SECONDS)
+
+    def make_key(self, part, version=None):
+        digest = hashlib.md5(part.encode()).hexdigest()
+        return f'{self.namespace}:{self.get_version() if version is None else version}:{digest}'
+
+    async def amake_key(self, part):
+        return self.make_key(part, await self.aget_version())
+
+    def count(self, payload):
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    def get(self, part):
+        return self.count(self.backend.get(self.make_key(part)))
+
+    async def aget(self, part):
+        return self.count(await self.backend.aget(await self.amake_key(part)))
+
+    def set(self, part, payload):
+        timeout = DEFAULT_TIMEOUT
+        if reading_from_replica() and self.backend.get(self.bumped_key):
+            # Le réplica n'a peut-être pas encore reçu le changement qui a invalidé le cache
+            timeout = settings.REPLICA_PIN_SECONDS
+        self.backend.set(self.make_key(part), payload, timeout)
+
+    async def aset(self, part, payload):
+        timeout = DEFAULT_TIMEOUT
+        if reading_from_replica() and await self.backend.aget(self.bumped_key):
+            timeout = settings.REPLICA_PIN_SECONDS
+        await self.backend.aset(await self.amake_key(part), payload, timeout)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'version': self.get_version()}
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+webtoon_cache = VersionedCache('webtoon', alias='webtoons')
+feed_cache = VersionedCache('feed', alias='webtoons')
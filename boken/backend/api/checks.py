@@ -0,0 +1,37 @@
+"""System checks for caches that must be shared by every worker process."""
+from django.conf import settings
+from django.core import checks
+
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_local_cache(alias):
+    return settings.CACHES.get(alias, {}).get('BACKEND') in LOCAL_CACHE_BACKENDS
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_auth_user_cache(app_configs, **kwargs):
+    if not is_local_cache(settings.AUTH_USER_CACHE_ALIAS):
+        return []
+    return [checks.Warning(
+        f'AUTH_USER_CACHE_ALIAS "{settings.AUTH_USER_CACHE_ALIAS}" is a per-process cache.',
+        hint='With several workers, deactivations and role changes only invalidate the cached '
+             'users of the process that saved them. Point the alias at Redis or Memcached.',
+        id='api.W001',
+    )]
+
+
+@checks.register(checks.Tags.caches, checks.Tags.database)
+def check_replica_pin_cache(app_configs, **kwargs):
+    if not settings.REPLICA_DATABASES or not is_local_cache(settings.REPLICA_PIN_CACHE_ALIAS):
+        return []
+    return [checks.Error(
+        f'REPLICA_PIN_CACHE_ALIAS "{settings.REPLICA_PIN_CACHE_ALIAS}" is a per-process cache.',
+        hint='A write pins its client to the primary in this cache; the other workers would not see '
+             'the pin and could serve the next read from a lagging replica. Point the alias at '
+             'Redis or Memcached.',
+        id='api.E001',
+    )]
@@ -0,0 +1,106 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def latest_timestamp(values):
+    """Most recent of the given datetimes as a whole POSIX timestamp, as HTTP dates have no sub-second part"""
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    return int(max(values).timestamp())
+
+
+def get_response_validators(response):
+    """Read back the ``(etag, last_modified)`` pair set by ``set_validators``"""
+    last_modified = response.headers.get('Last-Modified')
+    return response.headers.get('ETag'), last_modified and parse_http_date_safe(last_modified)
+
+
+def set_validators(response, validators):
+    etag, last_modified = validators
+    response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def conditional_response(request, validators):
+    """Return the 304 (or 412) response the request's preconditions call for, or None"""
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+class ConditionalGetMixin:
+    """ETag / Last-Modified support for the ``retrieve`` and ``list`` actions.
+
+    Validators come from ``update_at``: the object's own for a detail. A list
+    page hashes the ids and timestamps of its own rows, read along with the
+    page by ``RowListMixin``, plus whether it has neighbours, so a deletion
+    that moves rows in or out of the page changes them too and no query runs
+    over the rest of the table. ``validator_fields`` lists every timestamp
+    the representation depends on (e.g. a nested relation). Matching
+    ``If-None-Match`` or ``If-Modified-Since`` headers get a 304 before the
+    serializer runs.
+    """
+    validator_fields = ('update_at',)
+
+    def get_validator_fields(self):
+        return self.validator_fields
+
+    def get_detail_validators(self, instance):
+        values = []
+        for field in self.get_validator_fields():
+            value = instance
+            for name in field.split('__'):
+                value = getattr(value, name, None) if value is not None else None
+            values.append(value)
+        return (
+            make_etag(self.request.get_full_path(), instance.pk, *(value and value.isoformat() for value in values)),
+            latest_timestamp(values),
+        )
+
+    def get_list_validators(self, rows):
+        """Validators of a list page from its ``.values()`` rows"""
+        fields = self.get_validator_fields()
+        pk = self.get_queryset().model._meta.pk.name
+        values = [row[field] for row in rows for field in fields]
+        paginator = self.paginator
+        return (
+            make_etag(
+                self.request.get_full_path(),
+                getattr(paginator, 'has_next', None), getattr(paginator, 'has_previous', None),
+                *(row[pk] for row in rows), *(value and value.isoformat() for value in values),
+            ),
+            latest_timestamp(values),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        validators = self.get_detail_validators(instance)
+        response = conditional_response(request, validators)
+        if response is None:
+            serializer = self.get_serializer(instance)
+            response = set_validators(Response(serializer.data), validators)
+        return response
+
+    def get_row_lookups(self):
+        pk = self.get_queryset().model._meta.pk.name
+        return [*super().get_row_lookups(), pk, *self.get_validator_fields()]
+
+    def get_rows_response(self, row_serializer, rows, paginated):
+        validators = self.get_list_validators(rows)
+        response = conditional_response(self.request, validators)
+        if response is None:
+            response = set_validators(super().get_rows_response(row_serializer, rows, paginated), validators)
+        return response
@@ -0,0 +1,66 @@
+import csv
+import datetime
+import json
+import uuid
+
+from api.streams import chunked
+
+# (nom de colonne, lookup ORM)
+EXPORT_FIELDS = (
+    ('id', 'id'),
+    ('title', 'title'),
+    ('authors', 'authors'),
+    ('status', 'status'),
+    ('is_public', 'is_public'),
+    ('rating', 'rating'),
+    ('rating_count', 'rating_count'),
+    ('release_date', 'release_date'),
+    ('waiting_review', 'waiting_review'),
+    ('add_by', 'add_by__username'),
+    ('create_at', 'create_at'),
+    ('update_at', 'update_at'),
+)
+
+
+def export_rows(queryset, chunk_size):
+    """Stream plain tuples with a server-side cursor, without building model instances"""
+    lookups = [lookup for _, lookup in EXPORT_FIELDS]
+    return queryset.order_by().values_list(*lookups).iterator(chunk_size=chunk_size)
+
+
+def plain(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def ndjson_export(rows, batch_size):
+    names = [name for name, _ in EXPORT_FIELDS]
+    for batch in chunked(rows, batch_size):
+        yield ''.join(
+            json.dumps(dict(zip(names, map(plain, row))), ensure_ascii=False) + '\n' for row in batch
+        )
+
+
+class Echo:
+    """File-like object handing back what csv.writer writes to it"""
+
+    def write(self, value):
+        return value
+
+
+def csv_export(rows, batch_size):
+    writer = csv.writer(Echo())
+    yield writer.writerow([name for name, _ in EXPORT_FIELDS])
+    for batch in chunked(rows, batch_size):
+        yield ''.join(
+            writer.writerow(['' if value is None else plain(value) for value in row]) for row in batch
+        )
+
+
+EXPORT_FORMATS = {
+    'ndjson': (ndjson_export, 'application/x-ndjson'),
+    'csv': (csv_export, 'text/csv'),
+}
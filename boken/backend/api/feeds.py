@@ -0,0 +1,153 @@
+"""Home feeds materialized as ``FeedSnapshot`` rows.
+
+A feed is the first ``FEED_SIZE`` webtoons of an indexed ordering, rendered
+once to JSON bytes by ``refresh_feed``. ``FeedView`` checks the snapshot's
+ETag with one query on the unique ``name`` index and serves the bytes cached
+under that ETag, reading the body only on a miss, so a home page costs the
+same whatever the catalogue size and the traffic. Since the check is in the
+database, a refresh made by another process is served at once.
+
+Feeds are refreshed by ``manage.py refresh_feeds`` (``--every`` keeps a
+``FeedScheduler`` running), or by the web process itself when
+``FEED_REFRESH_INTERVAL`` is positive. A snapshot not refreshed for
+``FEED_MAX_AGE`` seconds is rendered again by the first request that finds
+it; the others keep serving the previous body meanwhile.
+"""
+import datetime
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+from django.utils.http import quote_etag
+from api.cache import feed_cache
+from api.models.feed_snapshot import FeedSnapshot
+from api.models.webtoon import Webtoon
+from api.renderers import FastJSONRenderer
+from api.rows import RowSerializer
+from api.serializers import WebtoonSerializer
+
+logger = logging.getLogger(__name__)
+
+# nom du flux -> ordre, chacun couvert par un index de Webtoon.Meta
+FEEDS = {
+    'latest': ('-update_at', '-id'),
+    'top_rated': ('-rating', '-rating_count', '-id'),
+}
+
+
+def render_feed(name, size):
+    """``(body, count)`` of a feed, in the representation of the webtoon list"""
+    row_serializer = RowSerializer(WebtoonSerializer())
+    rows = row_serializer.rows(Webtoon.objects.order_by(*FEEDS[name]))[:size]
+    results = row_serializer.serialize(rows)
+    return FastJSONRenderer().render({'name': name, 'results': results}), len(results)
+
+
+def refresh_feed(name, size=None):
+    """Render a feed and store it when it changed, returning its snapshot.
+
+    Rendering happens outside the transaction: the snapshot row is only
+    locked for the write, and readers keep the previous body until the
+    commit. An unchanged feed keeps its ETag and the cached body.
+    """
+    body, count = render_feed(name, size or settings.FEED_SIZE)
+    etag = quote_etag(hashlib.md5(body).hexdigest())
+    now = timezone.now()
+    with transaction.atomic():
+        snapshot, created = FeedSnapshot.objects.defer('body').select_for_update().get_or_create(
+            name=name, defaults={'body': body, 'etag': etag, 'size': count, 'refreshed_at': now},
+        )
+        if not created and snapshot.etag != etag:
+            snapshot.body, snapshot.etag, snapshot.size, snapshot.refreshed_at = body, etag, count, now
+            snapshot.save()
+        elif not created:
+            # Corps inchangé : ni update_at (Last-Modified) ni ETag ne bougent
+            snapshot.refreshed_at = now
+            FeedSnapshot.objects.filter(pk=snapshot.pk).update(refreshed_at=now)
+    return snapshot
+
+
+def refresh_feeds(names=None, size=None):
+    return [refresh_feed(name, size) for name in names or FEEDS]
+
+
+def claim_refresh(name, refreshed_at):
+    """Move a stale snapshot's ``refreshed_at`` to now, True only for the request that did it"""
+    return FeedSnapshot.objects.filter(name=name, refreshed_at=refreshed_at).update(refreshed_at=timezone.now()) == 1
+
+
+def get_feed(name):
+    """``(etag, last_modified, body)`` of a feed, rendered on first use and once older than ``FEED_MAX_AGE``"""
+    state = FeedSnapshot.objects.filter(name=name).values_list('etag', 'refreshed_at').first()
+    max_age = datetime.timedelta(seconds=settings.FEED_MAX_AGE)
+    if state is None:
+        state = (refresh_feed(name).etag, None)
+    elif state[1] < timezone.now() - max_age and claim_refresh(name, state[1]):
+        # Les requêtes concurrentes voient le nouveau refreshed_at et servent l'ancien corps pendant le rendu
+        state = (refresh_feed(name).etag, None)
+
+    # La clé porte l'ETag : un corps rafraîchi ailleurs n'est jamais servi depuis l'ancienne entrée
+    key = f'{name}:{state[0]}'
+    entry = feed_cache.get(key)
+    if entry is None:
+        snapshot = FeedSnapshot.objects.get(name=name)
+        entry = (snapshot.etag, int(snapshot.update_at.timestamp()), bytes(snapshot.body))
+        feed_cache.set(f'{name}:{snapshot.etag}', entry)
+    return entry
+
+
+class FeedScheduler(threading.Thread):
+    """Refresh the feeds every ``interval`` seconds until ``stop()``.
+
+    The interval is measured from the start of a refresh, so a slow refresh
+    does not push the next ones back. A failed refresh is logged and retried
+    at the next tick.
+    """
+
+    def __init__(self, interval, names=None, size=None):
+        super().__init__(name='feed-scheduler', daemon=True)
+        self.interval = interval
+        self.names = list(names or FEEDS)
+        self.size = size
+        self.stopped = threading.Event()
+        self.runs = 0
+
+    def run(self):
+        try:
+            while not self.stopped.is_set():
+                started = time.monotonic()
+                close_old_connections()
+                try:
+                    refresh_feeds(self.names, self.size)
+                except Exception:
+                    logger.exception('Feed refresh failed')
+                self.runs += 1
+                self.stopped.wait(max(0.0, self.interval - (time.monotonic() - started)))
+        finally:
+            # La connexion appartient à ce thread
+            connection.close()
+
+    def stop(self, timeout=None):
+        self.stopped.set()
+        self.join(timeout)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def start_scheduler():
+    """Start the process-wide scheduler once, when ``FEED_REFRESH_INTERVAL`` is positive"""
+    global _scheduler
+    interval = settings.FEED_REFRESH_INTERVAL
+    if interval <= 0:
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FeedScheduler(interval)
+            _scheduler.start()
+    return _scheduler
@@ -0,0 +1,106 @@
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def get_list_param(request, name):
+    raw = request.query_params.get(name)
+    if raw is None:
+        return None
+    return [part.strip() for part in raw.split(',') if part.strip()]
+
+
+def get_field_params(request):
+    """Return the ``(fields, expand)`` query parameters, ``fields`` is None when absent"""
+    return get_list_param(request, 'fields'), get_list_param(request, 'expand') or []
+
+
+def get_query_fields(serializer, prefix=''):
+    """Return the ``(only, select_related, prefetch_related)`` arguments covering what ``serializer`` reads"""
+    only = [prefix + serializer.Meta.model._meta.pk.name]
+    related, prefetch = [], []
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+        source = prefix + field.source.replace('.', '__')
+        if isinstance(field, (serializers.ManyRelatedField, serializers.ListSerializer)):
+            prefetch.append(source)
+        elif isinstance(field, serializers.BaseSerializer):
+            nested_only, nested_related, nested_prefetch = get_query_fields(field, f'{source}__')
+            only += [source, *nested_only]
+            related += [source, *nested_related]
+            prefetch += nested_prefetch
+        else:
+            only.append(source)
+    return only, related, prefetch
+
+
+class DynamicFieldsMixin:
+    """Shape read representations with the ``?fields=`` and ``?expand=`` query parameters.
+
+    Without ``fields`` the full representation is kept. With it only the
+    listed fields are returned, and the relations of ``Meta.expandable_fields``
+    collapse to their primary key unless they are named in ``expand``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return
+
+        requested, expand = get_field_params(request)
+        expandable = getattr(self.Meta, 'expandable_fields', ())
+        readable = [name for name, field in self.fields.items() if not field.write_only]
+
+        errors = {}
+        unknown = [name for name in requested or () if name not in readable]
+        if unknown:
+            errors['fields'] = [f'Champs inconnus : {", ".join(unknown)}.']
+        unknown = [name for name in expand if name not in expandable]
+        if unknown:
+            errors['expand'] = [f'Relations non extensibles : {", ".join(unknown)}.']
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        if requested is None:
+            return
+        for name in readable:
+            if name not in requested:
+                self.fields.pop(name)
+        for name in expandable:
+            if name in self.fields and name not in expand:
+                self.fields[name] = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
+class SparseFieldsMixin:
+    """Narrow the read querysets of a viewset to the fields its serializer will render.
+
+    ``read_actions`` load only the requested columns with ``.only()``, join
+    only the expanded relations and prefetch the many-to-many ones; other
+    actions keep full rows.
+    """
+    read_actions = ('list', 'retrieve')
+
+    def get_query_fields(self):
+        """``(only, select_related, prefetch_related)`` for the current action, None outside ``read_actions``"""
+        if self.action not in self.read_actions:
+            return None
+        if not hasattr(self, '_query_fields'):
+            self._query_fields = get_query_fields(self.get_serializer())
+        return self._query_fields
+
+    def get_validator_fields(self):
+        # Les timestamps d'une relation non rendue ne changent pas la représentation
+        query_fields = self.get_query_fields()
+        if query_fields is None:
+            return super().get_validator_fields()
+        only, related, prefetch = query_fields
+        return [
+            field for field in super().get_validator_fields()
+            if '__' not in field or field.rsplit('__', 1)[0] in related
+        ]
+
+    def get_read_fields(self):
+        """Columns, joins and prefetches a read action needs, validator timestamps included"""
+        only, related, prefetch = self.get_query_fields()
+        return [*only, *self.get_validator_fields()], related, prefetch
@@ -0,0 +1,136 @@
+"""Password hashers with settings-driven costs, hashing in a bounded worker pool.
+
+``PASSWORD_HASHERS`` lists the three of them, the ``PASSWORD_HASHER``
+strategy first: new passwords and logins of users whose hash uses another
+algorithm, or other costs, are (re)hashed with it. Django rehashes on a
+successful ``check_password``, so stored hashes move to the chosen strategy
+as users log in.
+
+Every hash, for a login, a signup or a password change, runs on one of the
+``PASSWORD_HASH_WORKERS`` threads of this process. scrypt, PBKDF2 and
+Argon2 release the GIL, so the pool bounds the cores a login storm can take
+and the other requests keep the rest. At most ``PASSWORD_HASH_QUEUE`` hashes
+wait for a worker; past that ``HashingUnavailable`` answers 503 with a
+Retry-After instead of piling up requests.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+_pool = None
+_pool_lock = threading.Lock()
+_worker = threading.local()
+
+
+class HashingUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Trop de connexions en cours, réessayez dans un instant.'
+    default_code = 'hashing_unavailable'
+    # Lu par le gestionnaire d'exceptions de DRF pour l'en-tête Retry-After
+    wait = 1
+
+
+class HashingPool:
+    """``workers`` threads hashing passwords, with at most ``queue`` calls waiting for one"""
+
+    def __init__(self, workers, queue):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self.slots = threading.BoundedSemaphore(workers + queue)
+
+    def run(self, func, *args, **kwargs):
+        if getattr(_worker, 'active', False):
+            # verify() de scrypt et PBKDF2 passe par encode() : déjà sur un worker
+            return func(*args, **kwargs)
+        if not self.slots.acquire(blocking=False):
+            raise HashingUnavailable
+        try:
+            return self.executor.submit(self.call, func, *args, **kwargs).result()
+        finally:
+            self.slots.release()
+
+    @staticmethod
+    def call(func, *args, **kwargs):
+        _worker.active = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _worker.active = False
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE)
+        return _pool
+
+
+@receiver(setting_changed)
+def reset_pool(*, setting, **kwargs):
+    global _pool
+    if setting in ('PASSWORD_HASH_WORKERS', 'PASSWORD_HASH_QUEUE'):
+        with _pool_lock:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = None
+
+
+class PooledHasherMixin:
+    """Run ``encode`` and ``verify`` on the hashing pool"""
+
+    def encode(self, password, salt, *args, **kwargs):
+        return get_pool().run(super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return get_pool().run(super().verify, password, encoded)
+
+
+class ScryptPasswordHasher(PooledHasherMixin, hashers.ScryptPasswordHasher):
+    """scrypt with the costs of ``PASSWORD_SCRYPT``"""
+    # Plafond et non allocation : les hachages d'un coût plus élevé, d'avant un réglage, se vérifient encore
+    maxmem = 1024 ** 3
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT['work_factor']
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT['block_size']
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT['parallelism']
+
+
+class Argon2PasswordHasher(PooledHasherMixin, hashers.Argon2PasswordHasher):
+    """Argon2id with the costs of ``PASSWORD_ARGON2``, needs argon2-cffi"""
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2['time_cost']
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2['memory_cost']
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2['parallelism']
+
+
+class PBKDF2PasswordHasher(PooledHasherMixin, hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with ``PASSWORD_PBKDF2_ITERATIONS``, and the verifier of the hashes stored before"""
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
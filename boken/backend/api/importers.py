@@ -0,0 +1,79 @@
+from django.utils import timezone
+from api.cache import webtoon_cache
+from api.models.webtoon import Webtoon
+from api.serializers import WebtoonImportSerializer
+from api.streams import chunked
+
+
+class WebtoonImporter:
+    """Bulk import of webtoons, one validation pass and one INSERT per chunk of rows.
+
+    ``run`` is a generator of per-row results so that neither the input nor
+    the report is ever held in memory as a whole. With ``on_conflict='skip'``
+    rows whose title already exists are left untouched; with ``'update'`` they
+    overwrite the existing webtoon (``INSERT ... ON CONFLICT (title) DO UPDATE``).
+    """
+    chunk_size = 500
+    conflict_modes = ('skip', 'update')
+
+    def __init__(self, user_id, on_conflict='skip', context=None):
+        self.user_id = user_id
+        self.on_conflict = on_conflict
+        self.serializer = WebtoonImportSerializer(many=True, context=context or {})
+        self.update_fields = [
+            name for name, field in self.serializer.child.fields.items()
+            if not field.read_only and name != 'title'
+        ] + ['update_at']
+        self.counts = {status: 0 for status in ('created', 'updated', 'skipped', 'duplicate', 'invalid')}
+
+    def run(self, rows):
+        start = 0
+        for chunk in chunked(rows, self.chunk_size):
+            yield from self.import_chunk(chunk, start)
+            start += len(chunk)
+
+    def import_chunk(self, rows, start):
+        results = [None] * len(rows)
+        valid = {}
+
+        for offset, (data, errors) in enumerate(self.serializer.validate_rows(rows)):
+            if errors:
+                results[offset] = self.result(start + offset, 'invalid', errors=errors)
+                continue
+            title = data['title']
+            if title in valid:
+                # Two rows with the same title in a chunk: the last one wins
+                previous = valid[title][0]
+                results[previous] = self.result(start + previous, 'duplicate', title=title)
+            valid[title] = (offset, data)
+
+        if valid:
+            existing = set(Webtoon.objects.filter(title__in=valid).values_list('title', flat=True))
+            self.write([data for _, data in valid.values()])
+            webtoon_cache.bump()
+
+            for title, (offset, _) in valid.items():
+                if title not in existing:
+                    status = 'created'
+                else:
+                    status = 'updated' if self.on_conflict == 'update' else 'skipped'
+                results[offset] = self.result(start + offset, status, title=title)
+
+        yield from results
+
+    def write(self, rows):
+        now = timezone.now()
+        webtoons = [Webtoon(**data, add_by_id=self.user_id, create_at=now, update_at=now) for data in rows]
+        if self.on_conflict == 'update':
+            Webtoon.objects.bulk_create(
+                webtoons,
+                update_conflicts=True,
+                unique_fields=['title'],
+                update_fields=self.update_fields,
+            )
+        else:
+            Webtoon.objects.bulk_create(webtoons, ignore_conflicts=True)
+
+    def result(self, row, status, **extra):
+        self.counts[status] += 1
+        return {'row': row, 'status': status, **extra}
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from api.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the delta sync tombstones older than SYNC_TOMBSTONE_TTL. Clients whose "
+        "watermark predates the retention are then asked for a full resync."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Tombstones deleted per DELETE (default: 1000)')
+
+    def handle(self, *args, batch_size, **options):
+        pruned = prune_tombstones(batch_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'{pruned} tombstone(s) supprimé(s), plus anciens que {settings.SYNC_TOMBSTONE_TTL} s.'
+        ))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from api.ratings import drifted_webtoons, reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare Webtoon.rating_sum/rating_count/rating with the votes stored in UserWebtoon "
+        "and report the drifted webtoons; --fix rewrites their aggregates from the votes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Rewrite the drifted aggregates')
+        parser.add_argument('--tolerance', type=float, default=1e-6,
+                            help='Largest accepted gap on rating_sum and rating (default: 1e-6)')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Webtoons fixed per UPDATE (default: 1000)')
+
+    def handle(self, *args, fix, tolerance, batch_size, **options):
+        drifted = drifted_webtoons(tolerance).values_list(
+            'id', 'title', 'rating_sum', 'rating_count', 'expected_sum', 'expected_count',
+        )
+        found = fixed = 0
+        batch = []
+        for pk, title, rating_sum, rating_count, expected_sum, expected_count in drifted.iterator(chunk_size=batch_size):
+            found += 1
+            self.stdout.write(
+                f'{pk} {title!r}: sum {rating_sum:g} -> {expected_sum:g}, count {rating_count} -> {expected_count}'
+            )
+            if fix:
+                batch.append(pk)
+                if len(batch) >= batch_size:
+                    fixed += reconcile(batch)
+                    batch = []
+        if batch:
+            fixed += reconcile(batch)
+
+        if not found:
+            self.stdout.write(self.style.SUCCESS('Aucune dérive.'))
+        elif fix:
+            self.stdout.write(self.style.SUCCESS(f'{fixed} webtoon(s) corrigé(s) sur {found}.'))
+        else:
+            self.stdout.write(self.style.WARNING(f'{found} webtoon(s) en dérive, relancer avec --fix pour corriger.'))
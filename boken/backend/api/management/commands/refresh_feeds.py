@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from api.feeds import FEEDS, FeedScheduler, refresh_feed
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the home feeds into their FeedSnapshot rows. With --every, keep "
+        "refreshing them on a fixed interval until interrupted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--feed', action='append', choices=sorted(FEEDS), dest='feeds',
+                            help='Feed to refresh, repeatable (default: all of them)')
+        parser.add_argument('--size', type=int, help='Webtoons per feed (default: FEED_SIZE)')
+        parser.add_argument('--every', type=float, metavar='SECONDS',
+                            help='Refresh interval; the command then runs until interrupted')
+
+    def handle(self, *args, feeds, size, every, **options):
+        names = feeds or list(FEEDS)
+        if every is None:
+            for name in names:
+                started = time.perf_counter()
+                snapshot = refresh_feed(name, size)
+                elapsed = (time.perf_counter() - started) * 1000
+                self.stdout.write(f'{name}: {snapshot.size} webtoons, {elapsed:.1f} ms')
+            return
+
+        if every <= 0:
+            raise CommandError('--every doit être positif.')
+        scheduler = FeedScheduler(every, names, size)
+        scheduler.start()
+        self.stdout.write(f'Rafraîchissement de {", ".join(names)} toutes les {every:g} s (Ctrl-C pour arrêter)')
+        try:
+            while scheduler.is_alive():
+                scheduler.join(1)
+        except KeyboardInterrupt:
+            scheduler.stop()
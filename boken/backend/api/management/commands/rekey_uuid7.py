@@ -0,0 +1,108 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Case, Q, UUIDField, Value, When
+from django.utils import timezone
+from api.cache import webtoon_cache
+from api.feeds import refresh_feeds
+from api.models import BaseModel, Tombstone, User, Webtoon
+from api.models.base_model import uuid7
+
+
+def references(model):
+    """Foreign keys pointing at ``model``, many-to-many through tables included"""
+    return [
+        field.field for field in model._meta.get_fields(include_hidden=True)
+        if (field.one_to_many or field.one_to_one) and field.auto_created and not field.concrete
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace the random (v4) primary keys of existing rows by time-ordered UUIDv7 keys "
+        "dated from their create_at, updating every foreign key in the same transaction. "
+        "Rekeyed ids are reported as deleted by the delta sync and their rows as changed. "
+        "Users are only rekeyed when named: their JWTs carry the old id."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', metavar='app_label.Model',
+                            help='Models to rekey (default: every BaseModel model but User)')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rows rekeyed per transaction (default: 1000)')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the rows to rekey')
+
+    def handle(self, *args, models, batch_size, dry_run, **options):
+        try:
+            targets = [apps.get_model(label) for label in models]
+        except (LookupError, ValueError) as exc:
+            raise CommandError(exc)
+        if not targets:
+            targets = [
+                model for model in apps.get_models()
+                if issubclass(model, BaseModel) and model is not User
+            ]
+        for model in targets:
+            if not issubclass(model, BaseModel):
+                raise CommandError(f"{model._meta.label} n'hérite pas de BaseModel.")
+
+        for model in targets:
+            rekeyed = self.rekey(model, batch_size, dry_run)
+            verb = 'à renouveler' if dry_run else 'renouvelées'
+            self.stdout.write(f'{model._meta.label}: {rekeyed} clé(s) {verb}')
+
+        if not dry_run:
+            webtoon_cache.bump()
+            if Webtoon in targets:
+                # Les flux pré-rendus contiennent les anciens ids
+                refresh_feeds()
+
+    def rekey(self, model, batch_size, dry_run):
+        """Walk ``model`` along ``(create_at, id)`` and rekey its v4 rows batch after batch"""
+        rows = model._base_manager.order_by('create_at', 'id').values_list('id', 'create_at')
+        position, total = None, 0
+        while True:
+            batch = rows
+            if position is not None:
+                pk, created = position
+                batch = batch.filter(Q(create_at__gt=created) | Q(create_at=created, id__gt=pk))
+            batch = list(batch[:batch_size])
+            if not batch:
+                return total
+            position = batch[-1]
+            # Les lignes déjà renouvelées (v7) sont ignorées : la commande peut être relancée
+            keys = {
+                pk: uuid7(int(created.timestamp() * 1000))
+                for pk, created in batch if pk.version != 7
+            }
+            total += len(keys)
+            if keys and not dry_run:
+                self.rekey_batch(model, keys)
+
+    def rekey_batch(self, model, keys):
+        """Move the primary keys and every reference to them in one transaction.
+
+        Foreign keys are created ``DEFERRABLE INITIALLY DEFERRED``, so they
+        are only checked at commit, once every reference has moved.
+        """
+        pk_field = model._meta.pk
+
+        def remap(lookup):
+            return Case(
+                *(When(**{lookup: old}, then=Value(new)) for old, new in keys.items()),
+                output_field=UUIDField(),
+            )
+
+        with transaction.atomic():
+            for field in references(model):
+                field.model._base_manager.filter(**{f'{field.attname}__in': keys}).update(
+                    **{field.attname: remap(field.attname)}
+                )
+            model._base_manager.filter(pk__in=keys).update(
+                **{pk_field.attname: remap(pk_field.attname)},
+                update_at=timezone.now(),
+            )
+            if model is not Tombstone:
+                Tombstone.objects.bulk_create(
+                    Tombstone(model=model._meta.label_lower, object_id=old) for old in keys
+                )
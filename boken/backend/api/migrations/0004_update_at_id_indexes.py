@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_webtoon_waiting_review'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-update_at', '-id'], name='user_update_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(fields=['-update_at', '-id'], name='webtoon_update_at_id_idx'),
+        ),
+    ]
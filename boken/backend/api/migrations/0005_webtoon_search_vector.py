@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:57
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+SEARCH_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION api_webtoon_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.authors, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER api_webtoon_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, authors, search_vector ON api_webtoon
+        FOR EACH ROW EXECUTE FUNCTION api_webtoon_search_vector_trigger()
+    """,
+    "UPDATE api_webtoon SET search_vector = NULL",
+    "CREATE INDEX api_webtoon_search_vector_gin ON api_webtoon USING gin (search_vector)",
+    "CREATE INDEX api_webtoon_title_trgm ON api_webtoon USING gin (title gin_trgm_ops)",
+    "CREATE INDEX api_webtoon_authors_trgm ON api_webtoon USING gin (authors gin_trgm_ops)",
+]
+
+DROP_SEARCH_SQL = [
+    "DROP INDEX IF EXISTS api_webtoon_authors_trgm",
+    "DROP INDEX IF EXISTS api_webtoon_title_trgm",
+    "DROP INDEX IF EXISTS api_webtoon_search_vector_gin",
+    "DROP TRIGGER IF EXISTS api_webtoon_search_vector_update ON api_webtoon",
+    "DROP FUNCTION IF EXISTS api_webtoon_search_vector_trigger()",
+]
+
+
+def run_postgresql(statements):
+    """The trigger and GIN indexes only exist on PostgreSQL, other backends use the fallback search"""
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement, params=None)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_update_at_id_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='webtoon',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(run_postgresql(SEARCH_SQL), run_postgresql(DROP_SEARCH_SQL)),
+    ]
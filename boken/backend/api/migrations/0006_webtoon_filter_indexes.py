@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_webtoon_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(fields=['status', 'rating'], name='webtoon_status_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(fields=['rating'], name='webtoon_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(fields=['release_date'], name='webtoon_release_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['-update_at', '-id'], name='webtoon_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(condition=models.Q(('waiting_review', True)), fields=['-update_at', '-id'], name='webtoon_review_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:27
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_webtoon_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserWebtoon',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('create_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('update_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('chapter_read', models.PositiveIntegerField(default=0)),
+                ('chapter_out', models.PositiveIntegerField(default=0)),
+                ('note', models.TextField(blank=True, default='')),
+                ('reading_status', models.CharField(choices=[('reading', 'Reading'), ('completed', 'Completed'), ('on_hold', 'On hold'), ('dropped', 'Dropped'), ('plan_to_read', 'Plan to read')], default='reading', max_length=20)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='library', to=settings.AUTH_USER_MODEL)),
+                ('webtoon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='readers', to='api.webtoon')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-update_at', '-id'], name='userwebtoon_user_update_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'webtoon'), name='userwebtoon_user_webtoon_uniq'), models.CheckConstraint(condition=models.Q(('chapter_read__lte', models.F('chapter_out'))), name='userwebtoon_chapter_read_lte_out')],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:32
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_userwebtoon'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Genre',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('create_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('update_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('name', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='WebtoonGenre',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('create_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('update_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('genre', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='webtoon_genres', to='api.genre')),
+                ('webtoon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='webtoon_genres', to='api.webtoon')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='webtoon',
+            name='genres',
+            field=models.ManyToManyField(blank=True, related_name='webtoons', through='api.WebtoonGenre', to='api.genre'),
+        ),
+        migrations.AddIndex(
+            model_name='webtoongenre',
+            index=models.Index(fields=['genre', 'webtoon'], name='webtoongenre_genre_webtoon_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='webtoongenre',
+            constraint=models.UniqueConstraint(fields=('webtoon', 'genre'), name='webtoongenre_webtoon_genre_uniq'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:43
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_genres'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Release',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('create_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('update_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('alt_title', models.CharField(blank=True, default='', max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('language', models.CharField(max_length=16)),
+                ('total_chapters', models.PositiveIntegerField(default=0)),
+                ('webtoon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='releases', to='api.webtoon')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['language'], name='release_language_idx'), models.Index(fields=['-update_at', '-id'], name='release_update_at_id_idx')],
+                'constraints': [models.UniqueConstraint(fields=('webtoon', 'language'), name='release_webtoon_language_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:51
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def legacy_ratings_to_votes(apps, schema_editor):
+    """The rating the creator used to write becomes their vote; ratings without a creator are reset"""
+    Webtoon = apps.get_model('api', 'Webtoon')
+    UserWebtoon = apps.get_model('api', 'UserWebtoon')
+    legacy = Webtoon.objects.filter(add_by__isnull=False, rating__gt=0, rating__lte=5)
+    votes = (
+        UserWebtoon(user_id=user_id, webtoon_id=webtoon_id, rating=rating)
+        for webtoon_id, user_id, rating in legacy.values_list('id', 'add_by_id', 'rating').iterator(chunk_size=2000)
+    )
+    # Le créateur a peut-être déjà le webtoon dans sa bibliothèque
+    UserWebtoon.objects.bulk_create(
+        votes, batch_size=2000, update_conflicts=True,
+        unique_fields=['user', 'webtoon'], update_fields=['rating'],
+    )
+    legacy.update(rating_sum=F('rating'), rating_count=1)
+    Webtoon.objects.filter(rating_count=0).exclude(rating=0).update(rating=0.0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_release'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userwebtoon',
+            name='rating',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='webtoon',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='webtoon',
+            name='rating_sum',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddIndex(
+            model_name='webtoon',
+            index=models.Index(fields=['-rating', '-rating_count', '-id'], name='webtoon_top_rated_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='userwebtoon',
+            constraint=models.CheckConstraint(condition=models.Q(('rating__isnull', True), models.Q(('rating__gte', 0), ('rating__lte', 5)), _connector='OR'), name='userwebtoon_rating_range'),
+        ),
+        migrations.RunPython(legacy_ratings_to_votes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:01
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_webtoon_ratings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('create_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('update_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('name', models.CharField(max_length=32, unique=True)),
+                ('body', models.BinaryField()),
+                ('etag', models.CharField(max_length=64)),
+                ('size', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:08
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_feed_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('create_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('update_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('model', models.CharField(max_length=64)),
+                ('object_id', models.UUIDField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['model', 'update_at', 'id'], name='tombstone_model_update_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:13
+
+import api.models.base_model
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_tombstone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='feedsnapshot',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='release',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='tombstone',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='userwebtoon',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='webtoon',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='webtoongenre',
+            name='id',
+            field=models.UUIDField(default=api.models.base_model.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
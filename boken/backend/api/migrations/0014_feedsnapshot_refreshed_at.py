@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:38
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedsnapshot',
+            name='refreshed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
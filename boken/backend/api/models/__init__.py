@@ -1,4 +1,10 @@
 from .user import User
 from .base_model import BaseModel
+from .webtoon import Webtoon
+from .user_webtoon import UserWebtoon
+from .genre import Genre, WebtoonGenre
+from .release import Release
+from .feed_snapshot import FeedSnapshot
+from .tombstone import Tombstone
 
-__all__ = ["User", "BaseModel"]
\ No newline at end of file
+__all__ = ["User", "BaseModel", "Webtoon", "UserWebtoon", "Genre", "WebtoonGenre", "Release", "FeedSnapshot", "Tombstone"]
\ No newline at end of file
@@ -1,15 +1,42 @@
 from django.db import models
+import os
+import threading
+import time
 import uuid
 from django import utils
 
+_uuid7_lock = threading.Lock()
+_uuid7_last = 0
+
+
+def uuid7(timestamp_ms=None):
+    """Time-ordered UUID (RFC 9562 version 7): a 48-bit Unix time in ms, then random bits.
+
+    New keys land at the right edge of the primary key B-tree instead of a
+    random page. Within a millisecond the 12 bits after the version are a
+    counter, so the keys of a process are strictly increasing. ``timestamp_ms``
+    dates a key in the past (see ``manage.py rekey_uuid7``) and skips the counter.
+    """
+    global _uuid7_last
+    if timestamp_ms is None:
+        with _uuid7_lock:
+            stamp = max((time.time_ns() // 1_000_000) << 12, _uuid7_last + 1)
+            _uuid7_last = stamp
+        timestamp_ms, counter = stamp >> 12, stamp & 0xFFF
+    else:
+        counter = int.from_bytes(os.urandom(2), 'big') & 0xFFF
+    random_bits = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    return uuid.UUID(int=(timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random_bits)
+
+
 class BaseModel(models.Model):
-    id = models.UUIDField(primary_key = True, default = uuid.uuid4, editable = False)
+    id = models.UUIDField(primary_key = True, default = uuid7, editable = False)
     create_at = models.DateTimeField(default = utils.timezone.now, editable = False)
     update_at = models.DateTimeField(default = utils.timezone.now)
 
     def SaveDate(self):
-        """Update the updated_at timestamp whenever the object is modified"""
-        self.updated_at = utils.timezone.now()
+        """Update the update_at timestamp whenever the object is modified"""
+        self.update_at = utils.timezone.now()
 
     def update(self, data):
         """Update the attributes of the object based on the provided dictionary"""
@@ -18,5 +45,14 @@ class BaseModel(models.Model):
                 setattr(self, key, value)
         self.SaveDate()
 
+    def save(self, *args, **kwargs):
+        """Refresh update_at on every update, it drives pagination, caching and ETags"""
+        if not self._state.adding:
+            self.SaveDate()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'update_at'}
+        super().save(*args, **kwargs)
+
     class Meta:
         abstract = True
\ No newline at end of file
@@ -0,0 +1,19 @@
+from django.db import models
+from django.utils import timezone
+from .base_model import BaseModel
+
+
+class FeedSnapshot(BaseModel):
+    """A home feed rendered ahead of time by ``api.feeds.refresh_feed``, served as is.
+
+    ``update_at`` is the time of the last refresh that changed ``body``,
+    ``refreshed_at`` the time of the last refresh, changed or not.
+    """
+    name = models.CharField(max_length=32, unique=True)
+    body = models.BinaryField()
+    etag = models.CharField(max_length=64)
+    size = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.name
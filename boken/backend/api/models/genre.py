@@ -0,0 +1,28 @@
+from django.db import models
+from .base_model import BaseModel
+from .webtoon import Webtoon
+
+
+class Genre(BaseModel):
+    name = models.CharField(max_length=64, unique=True, null=False, blank=False)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class WebtoonGenre(BaseModel):
+    """Through table of ``Webtoon.genres``, indexed both ways"""
+    webtoon = models.ForeignKey(Webtoon, on_delete=models.CASCADE, related_name='webtoon_genres')
+    genre = models.ForeignKey(Genre, on_delete=models.CASCADE, related_name='webtoon_genres')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['webtoon', 'genre'], name='webtoongenre_webtoon_genre_uniq'),
+        ]
+        indexes = [
+            # Le filtre par genre parcourt (genre, webtoon) sans lire la table
+            models.Index(fields=['genre', 'webtoon'], name='webtoongenre_genre_webtoon_idx'),
+        ]
@@ -0,0 +1,30 @@
+from django.db import models
+from .base_model import BaseModel
+from .webtoon import Webtoon
+
+
+class ReleaseQuerySet(models.QuerySet):
+    def summaries(self):
+        """Releases without their description, the only large column"""
+        return self.defer('description')
+
+
+class Release(BaseModel):
+    """A translation of a webtoon: alternative title, description and chapters in one language"""
+    webtoon = models.ForeignKey(Webtoon, on_delete=models.CASCADE, related_name='releases')
+    alt_title = models.CharField(max_length=255, blank=True, default='')
+    description = models.TextField(blank=True, default='')
+    language = models.CharField(max_length=16, null=False, blank=False)
+    total_chapters = models.PositiveIntegerField(default=0)
+
+    objects = ReleaseQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # Sert aussi d'index pour le détail filtré par langue (webtoon, language)
+            models.UniqueConstraint(fields=['webtoon', 'language'], name='release_webtoon_language_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['language'], name='release_language_idx'),
+            models.Index(fields=['-update_at', '-id'], name='release_update_at_id_idx'),
+        ]
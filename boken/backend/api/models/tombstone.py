@@ -0,0 +1,17 @@
+from django.db import models
+from .base_model import BaseModel
+
+
+class Tombstone(BaseModel):
+    """Id of a deleted row, kept for the delta sync of ``api.sync``.
+
+    ``update_at`` is the deletion time, so tombstones are paginated with the
+    same ``(update_at, id)`` keyset as the rows they replace.
+    """
+    model = models.CharField(max_length=64)
+    object_id = models.UUIDField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['model', 'update_at', 'id'], name='tombstone_model_update_idx'),
+        ]
@@ -43,3 +43,8 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-update_at', '-id'], name='user_update_at_id_idx'),
+        ]
@@ -0,0 +1,41 @@
+from django.db import models
+from django.db.models import F, Q
+from .base_model import BaseModel
+from .user import User
+from .webtoon import Webtoon
+
+
+class UserWebtoon(BaseModel):
+    """A webtoon in a user's library, with their reading progress"""
+    READING_STATUS_CHOICES = (
+        ("reading", "Reading"),
+        ("completed", "Completed"),
+        ("on_hold", "On hold"),
+        ("dropped", "Dropped"),
+        ("plan_to_read", "Plan to read"),
+    )
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='library')
+    webtoon = models.ForeignKey(Webtoon, on_delete=models.CASCADE, related_name='readers')
+    chapter_read = models.PositiveIntegerField(default=0)
+    chapter_out = models.PositiveIntegerField(default=0)
+    note = models.TextField(blank=True, default='')
+    reading_status = models.CharField(max_length=20, choices=READING_STATUS_CHOICES, default="reading")
+    # Vote de l'utilisateur, agrégé dans Webtoon.rating_sum/rating_count (voir api/ratings.py)
+    rating = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'webtoon'], name='userwebtoon_user_webtoon_uniq'),
+            models.CheckConstraint(
+                condition=Q(chapter_read__lte=F('chapter_out')),
+                name='userwebtoon_chapter_read_lte_out',
+            ),
+            models.CheckConstraint(
+                condition=Q(rating__isnull=True) | Q(rating__gte=0, rating__lte=5),
+                name='userwebtoon_rating_range',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-update_at', '-id'], name='userwebtoon_user_update_idx'),
+        ]
@@ -1,15 +1,96 @@
-from django.db import models
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
+from django.db import connections, models
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Q, Value, When
+from django.db.models.functions import Greatest
+from django.db.models.lookups import GreaterThan
+from django.utils import timezone
 from .base_model import BaseModel
 from .user import User
 
 
+class WebtoonQuerySet(models.QuerySet):
+    def for_action(self, action, only=(), related=(), prefetch=()):
+        """Load the ``only`` columns (all when empty), join ``related`` and prefetch ``prefetch`` for a viewset action"""
+        if action == 'destroy':
+            return self
+        queryset = self.select_related(*related).prefetch_related(*prefetch)
+        if only:
+            queryset = queryset.only(*only)
+        return queryset
+
+    def add_votes(self, sum_delta, count_delta):
+        """Shift ``rating_sum``/``rating_count`` and recompute ``rating`` in one UPDATE.
+
+        Every right-hand side reads the row as it was before the statement, so
+        concurrent votes never overwrite each other. ``sum_delta`` may be an
+        expression (e.g. a subquery on the votes being withdrawn).
+        """
+        rating_sum = F('rating_sum') + sum_delta
+        rating_count = F('rating_count') + count_delta
+        return self.update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            rating=Case(
+                When(
+                    GreaterThan(rating_count, 0),
+                    then=ExpressionWrapper(rating_sum / rating_count, output_field=FloatField()),
+                ),
+                default=Value(0.0),
+            ),
+            update_at=timezone.now(),
+        )
+
+    def search(self, query):
+        """Rank the webtoons whose title or authors match ``query``, tolerating typos"""
+        if connections[self.db].vendor == 'postgresql':
+            return self._search_postgresql(query)
+        return self._search_fallback(query)
+
+    def _search_postgresql(self, query):
+        # search_vector is kept up to date by a trigger, see migration 0005
+        search_query = SearchQuery(query, config='simple', search_type='websearch')
+        return self.annotate(
+            rank=SearchRank(F('search_vector'), search_query),
+            similarity=Greatest(
+                TrigramWordSimilarity(query, 'title'),
+                TrigramWordSimilarity(query, 'authors'),
+            ),
+        ).filter(
+            Q(search_vector=search_query)
+            | Q(title__trigram_word_similar=query)
+            | Q(authors__trigram_word_similar=query)
+        ).order_by('-rank', '-similarity', '-update_at')
+
+    def _search_fallback(self, query):
+        # Used on databases without tsvector/pg_trgm (SQLite in tests): no typo tolerance
+        condition = Q()
+        for term in query.split():
+            condition &= Q(title__icontains=term) | Q(authors__icontains=term)
+        return self.filter(condition).annotate(
+            rank=Case(
+                When(title__iexact=query, then=Value(3)),
+                When(title__istartswith=query, then=Value(2)),
+                When(title__icontains=query, then=Value(1)),
+                default=Value(0),
+            ),
+        ).order_by('-rank', '-update_at')
+
+
 class Webtoon(BaseModel):
     title = models.CharField(max_length=255, unique=True, null=False, blank=False)
     authors = models.CharField(max_length=255, null=False, blank=False)
     release_date = models.DateField(default='2000-01-01', null=False, blank=False)
     status = models.CharField(max_length=64, null=False, blank=False)
     is_public = models.BooleanField(default=False)
+    # Moyenne des votes de UserWebtoon.rating, maintenue par add_votes (voir api/ratings.py)
     rating = models.FloatField(default=0.0)
+    rating_sum = models.FloatField(default=0.0)
+    rating_count = models.PositiveIntegerField(default=0)
     add_by = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -18,3 +99,26 @@ class Webtoon(BaseModel):
         related_name='webtoons'
     )
     waiting_review = models.BooleanField(default=False)
+    genres = models.ManyToManyField('Genre', through='WebtoonGenre', related_name='webtoons', blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = WebtoonQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-update_at', '-id'], name='webtoon_update_at_id_idx'),
+            models.Index(fields=['status', 'rating'], name='webtoon_status_rating_idx'),
+            models.Index(fields=['rating'], name='webtoon_rating_idx'),
+            models.Index(fields=['release_date'], name='webtoon_release_date_idx'),
+            models.Index(fields=['-rating', '-rating_count', '-id'], name='webtoon_top_rated_idx'),
+            models.Index(
+                fields=['-update_at', '-id'],
+                condition=Q(is_public=True),
+                name='webtoon_public_idx',
+            ),
+            models.Index(
+                fields=['-update_at', '-id'],
+                condition=Q(waiting_review=True),
+                name='webtoon_review_idx',
+            ),
+        ]
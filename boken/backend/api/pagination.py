@@ -0,0 +1,171 @@
+import base64
+import binascii
+import json
+import uuid
+
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def encode_cursor(position, reverse=False):
+    """Encode an ``(update_at, id)`` position into an opaque url-safe token"""
+    update_at, pk = position
+    payload = {'u': update_at.isoformat(), 'i': str(pk)}
+    if reverse:
+        payload['r'] = 1
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(token):
+    """Decode a token built by ``encode_cursor`` into ``((update_at, id), reverse)``"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        update_at = parse_datetime(payload['u'])
+        pk = uuid.UUID(payload['i'])
+    except (TypeError, ValueError, KeyError, binascii.Error):
+        raise NotFound('Curseur invalide.')
+    if update_at is None:
+        raise NotFound('Curseur invalide.')
+    return (update_at, pk), bool(payload.get('r'))
+
+
+def keyset_filter(queryset, position, descending=True):
+    """Keep the rows strictly after ``position`` in the ``(update_at, id)`` ordering.
+
+    The leading ``update_at`` range stays sargable so the composite
+    ``(update_at, id)`` index is walked instead of counting skipped rows.
+    """
+    update_at, pk = position
+    if descending:
+        return queryset.filter(update_at__lte=update_at).exclude(update_at=update_at, id__gte=pk)
+    return queryset.filter(update_at__gte=update_at).exclude(update_at=update_at, id__lte=pk)
+
+
+def row_position(row):
+    """Return the ``(update_at, id)`` position of a model instance or a ``.values()`` row"""
+    if isinstance(row, dict):
+        return row['update_at'], row['id']
+    return row.update_at, row.id
+
+
+class KeysetCursorPagination(BasePagination):
+    """Cursor pagination on the stable ``(update_at, id)`` ordering, newest first.
+
+    Every page is a single index range scan whatever its depth, unlike
+    offset pagination whose cost grows with the number of skipped rows.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-update_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, position = self.page_queryset(queryset, request)
+        return self.set_page(list(queryset), position)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """``paginate_queryset`` for async views, the page is read with ``aiterator()``"""
+        queryset, position = self.page_queryset(queryset, request)
+        return self.set_page([row async for row in queryset.aiterator()], position)
+
+    def page_queryset(self, queryset, request):
+        """Slice of ``queryset`` holding the requested page plus one row, and the cursor position"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        token = request.query_params.get(self.cursor_query_param)
+        position, self.reverse = decode_cursor(token) if token else (None, False)
+
+        if self.reverse:
+            queryset = queryset.order_by('update_at', 'id')
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = keyset_filter(queryset, position, descending=not self.reverse)
+        return queryset[:self.page_size + 1], position
+
+    def set_page(self, rows, position):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw:
+            try:
+                size = int(raw)
+            except ValueError:
+                return self.page_size
+            if size > 0:
+                return min(size, self.max_page_size)
+        return self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._build_link(row_position(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+        return self._build_link(row_position(self.page[0]), reverse=True)
+
+    def _build_link(self, position, reverse=False):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(position, reverse))
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Curseur de pagination.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Nombre de résultats par page (max {self.max_page_size}).',
+                'schema': {'type': 'integer'},
+            },
+        ]
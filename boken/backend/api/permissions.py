@@ -10,4 +10,11 @@ class IsCreatorOrAdmin(BasePermission):
     def has_object_permission(self, request, view, obj):
         if hasattr(request.user, "role") and request.user.role == "admin":
             return True
-        return obj.add_by.id == request.user.id
+        return obj.add_by_id == request.user.id
+
+class IsWebtoonCreatorOrAdmin(BasePermission):
+    """For objects hanging off a webtoon (e.g. releases): the webtoon's creator or an admin"""
+    def has_object_permission(self, request, view, obj):
+        if hasattr(request.user, "role") and request.user.role == "admin":
+            return True
+        return obj.webtoon.add_by_id == request.user.id
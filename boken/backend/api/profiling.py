@@ -0,0 +1,267 @@
+"""Per-request profiling: SQL, serializer and render time, as Server-Timing headers and /metrics.
+
+``ProfilingMiddleware`` is listed in ``MIDDLEWARE`` but only runs with
+``PROFILING`` on; otherwise it raises ``MiddlewareNotUsed`` and Django drops
+it, so disabled profiling costs nothing per request.
+
+A profiled request carries a ``RequestProfile`` in a context variable. SQL
+is timed by an execute wrapper put on every connection, serializers by
+wrapping DRF's ``Serializer.data``/``ListSerializer.data`` and ``timed()``
+blocks, rendering by wrapping ``Response.rendered_content``. Phases may
+overlap: the queries a serializer triggers count in both. Totals are kept
+per endpoint (viewset class and action) for the Prometheus text export,
+per process; ``PROFILING_SAMPLE_RATE`` of the synchronous requests also
+run under cProfile and are dumped to ``PROFILING_DIR``.
+"""
+import contextvars
+import cProfile
+import functools
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers
+from rest_framework.response import Response
+
+PHASES = ('db', 'serialize', 'render')
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current = contextvars.ContextVar('request_profile', default=None)
+_install_lock = threading.Lock()
+_installed = False
+
+
+class RequestProfile:
+    """Timings of one request, in seconds"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self.active = set()
+
+    def add_query(self, duration):
+        self.queries += 1
+        self.timings['db'] += duration
+
+    @contextmanager
+    def phase(self, name):
+        # Une phase imbriquée dans elle-même (sérialiseur dans un sérialiseur) n'est comptée qu'une fois
+        if name in self.active:
+            yield
+            return
+        self.active.add(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+            self.active.discard(name)
+
+    def server_timing(self, total):
+        return ', '.join([
+            f'db;dur={self.timings["db"] * 1000:.2f};desc="{self.queries} queries"',
+            f'serialize;dur={self.timings["serialize"] * 1000:.2f}',
+            f'render;dur={self.timings["render"] * 1000:.2f}',
+            f'total;dur={total * 1000:.2f}',
+        ])
+
+
+@contextmanager
+def timed(phase):
+    """Count the block in ``phase`` of the current request, a no-op outside a profiled request"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    with profile.phase(phase):
+        yield
+
+
+def time_sql(execute, sql, params, many, context):
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add_query(time.perf_counter() - start)
+
+
+def add_sql_timer(connection, **kwargs):
+    if time_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_sql)
+
+
+def add_sql_timers():
+    """Time the queries of this thread's connections (new ones get it from ``connection_created``)"""
+    for connection in connections.all(initialized_only=True):
+        add_sql_timer(connection)
+
+
+def timed_property(prop, phase):
+    getter = prop.fget
+
+    @functools.wraps(getter)
+    def fget(self):
+        profile = _current.get()
+        if profile is None:
+            return getter(self)
+        with profile.phase(phase):
+            return getter(self)
+    return property(fget)
+
+
+def install():
+    """Hook the SQL timer and the DRF serializer and renderer timings, once per process"""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        connection_created.connect(add_sql_timer, dispatch_uid='api.profiling.add_sql_timer')
+        serializers.Serializer.data = timed_property(serializers.Serializer.data, 'serialize')
+        serializers.ListSerializer.data = timed_property(serializers.ListSerializer.data, 'serialize')
+        Response.rendered_content = timed_property(Response.rendered_content, 'render')
+        _installed = True
+
+
+def endpoint_name(request):
+    """``ViewSet.action`` (or view name) of the resolved view, for grouping the metrics"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    cls = getattr(match.func, 'cls', None)
+    if cls is None:
+        return match.view_name or match.func.__name__
+    actions = getattr(match.func, 'actions', None) or {}
+    return f'{cls.__name__}.{actions.get(request.method.lower(), request.method.lower())}'
+
+
+class Metrics:
+    """Per endpoint totals and request duration histograms of this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.endpoints = {}
+
+    def record(self, endpoint, method, status, profile, total):
+        with self._lock:
+            entry = self.endpoints.get((endpoint, method))
+            if entry is None:
+                entry = self.endpoints[(endpoint, method)] = {
+                    'requests': 0, 'errors': 0, 'queries': 0, 'seconds': 0.0,
+                    'buckets': [0] * len(DURATION_BUCKETS),
+                    **{f'{phase}_seconds': 0.0 for phase in PHASES},
+                }
+            entry['requests'] += 1
+            entry['errors'] += status >= 500
+            entry['queries'] += profile.queries
+            entry['seconds'] += total
+            for phase in PHASES:
+                entry[f'{phase}_seconds'] += profile.timings[phase]
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if total <= bound:
+                    entry['buckets'][i] += 1
+
+    def export(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            endpoints = sorted((key, dict(entry, buckets=list(entry['buckets']))) for key, entry in self.endpoints.items())
+
+        def labels(endpoint, method, **extra):
+            pairs = {'endpoint': endpoint, 'method': method, **extra}
+            return ','.join(f'{name}="{value}"' for name, value in pairs.items())
+
+        lines = []
+        counters = [
+            ('boken_requests_total', 'requests', 'Requests handled.'),
+            ('boken_request_errors_total', 'errors', 'Requests answered with a 5xx status.'),
+            ('boken_sql_queries_total', 'queries', 'SQL queries executed.'),
+            ('boken_db_seconds_total', 'db_seconds', 'Time spent executing SQL.'),
+            ('boken_serialize_seconds_total', 'serialize_seconds', 'Time spent in serializers.'),
+            ('boken_render_seconds_total', 'render_seconds', 'Time spent rendering responses.'),
+        ]
+        for name, field, help_text in counters:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+            lines += [f'{name}{{{labels(*key)}}} {entry[field]}' for key, entry in endpoints]
+
+        name = 'boken_request_duration_seconds'
+        lines += [f'# HELP {name} Request duration.', f'# TYPE {name} histogram']
+        for key, entry in endpoints:
+            for bound, count in zip(DURATION_BUCKETS, entry['buckets']):
+                lines.append(f'{name}_bucket{{{labels(*key, le=bound)}}} {count}')
+            lines.append(f'{name}_bucket{{{labels(*key, le="+Inf")}}} {entry["requests"]}')
+            lines.append(f'{name}_sum{{{labels(*key)}}} {entry["seconds"]}')
+            lines.append(f'{name}_count{{{labels(*key)}}} {entry["requests"]}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+
+
+def dump_profile(profiler, endpoint):
+    os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+    name = f'{time.strftime("%Y%m%d-%H%M%S")}-{time.perf_counter_ns()}-{endpoint}.prof'
+    profiler.dump_stats(os.path.join(settings.PROFILING_DIR, name))
+
+
+class ProfilingMiddleware:
+    """Profile every request when ``PROFILING`` is on, see the module docstring"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILING:
+            raise MiddlewareNotUsed
+        install()
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        add_sql_timers()
+        profile = RequestProfile()
+        state = _current.set(profile)
+        profiler = cProfile.Profile() if random.random() < settings.PROFILING_SAMPLE_RATE else None
+        try:
+            if profiler is None:
+                response = self.get_response(request)
+            else:
+                response = profiler.runcall(self.get_response, request)
+        finally:
+            _current.reset(state)
+        return self.finish(request, response, profile, profiler)
+
+    async def __acall__(self, request):
+        # Les requêtes de l'ORM asynchrone passent par un autre thread : ses connexions aussi sont chronométrées
+        await sync_to_async(add_sql_timers)()
+        profile = RequestProfile()
+        state = _current.set(profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(state)
+        return self.finish(request, response, profile, None)
+
+    def finish(self, request, response, profile, profiler):
+        total = time.perf_counter() - profile.start
+        endpoint = endpoint_name(request)
+        response['Server-Timing'] = profile.server_timing(total)
+        metrics.record(endpoint, request.method, response.status_code, profile, total)
+        if profiler is not None:
+            dump_profile(profiler, endpoint)
+        return response
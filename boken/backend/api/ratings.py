@@ -0,0 +1,123 @@
+"""Per-user votes (``UserWebtoon.rating``) and the aggregates denormalized on ``Webtoon``.
+
+Each vote moves ``Webtoon.rating_sum``/``rating_count`` by a delta in the same
+transaction, and ``Webtoon.rating`` keeps their average: reads and the
+``top_rated`` ordering never aggregate the votes. ``manage.py
+reconcile_ratings`` detects (and repairs with ``--fix``) any drift.
+"""
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Abs, Coalesce
+from django.db.models.lookups import GreaterThan
+from django.utils import timezone
+from api.cache import webtoon_cache
+from api.models.user_webtoon import UserWebtoon
+from api.models.webtoon import Webtoon
+
+
+def vote_delta(previous, rating):
+    """``(sum_delta, count_delta)`` turning the vote ``previous`` into ``rating``, None meaning no vote"""
+    return (rating or 0.0) - (previous or 0.0), (rating is not None) - (previous is not None)
+
+
+def rate(user_id, webtoon_id, rating):
+    """Set a user's vote, or withdraw it with None, and return their library entry.
+
+    The entry is locked while the aggregates move, so two concurrent votes of
+    the same user are applied one after the other. Rating a webtoon adds it to
+    the user's library; withdrawing a vote never does.
+    """
+    with transaction.atomic():
+        entries = UserWebtoon.objects.select_for_update()
+        if rating is None:
+            entry = entries.filter(user_id=user_id, webtoon_id=webtoon_id).first()
+            if entry is None:
+                return None
+            previous = entry.rating
+        else:
+            entry, created = entries.get_or_create(
+                user_id=user_id, webtoon_id=webtoon_id, defaults={'rating': rating}
+            )
+            previous = None if created else entry.rating
+
+        if previous == rating:
+            return entry
+        if entry.rating != rating:  # un élément tout juste créé porte déjà la note
+            entry.rating = rating
+            entry.save(update_fields=['rating'])
+        Webtoon.objects.filter(pk=webtoon_id).add_votes(*vote_delta(previous, rating))
+    webtoon_cache.bump()
+    return entry
+
+
+def delete_entry(entry):
+    """Delete a library entry, withdrawing its vote"""
+    with transaction.atomic():
+        locked = UserWebtoon.objects.select_for_update().filter(pk=entry.pk).first()
+        if locked is None:
+            return
+        locked.delete()
+        if locked.rating is None:
+            return
+        Webtoon.objects.filter(pk=locked.webtoon_id).add_votes(*vote_delta(locked.rating, None))
+    webtoon_cache.bump()
+
+
+def withdraw_user_votes(user_id):
+    """Withdraw every vote of a user in a single UPDATE, e.g. before the user is deleted"""
+    votes = UserWebtoon.objects.filter(user_id=user_id, rating__isnull=False)
+    vote = Subquery(votes.filter(webtoon=OuterRef('pk')).values('rating')[:1])
+    return Webtoon.objects.filter(pk__in=votes.values('webtoon_id')).add_votes(-vote, -1)
+
+
+def expected_aggregates():
+    """Expressions recomputing ``rating_sum``, ``rating_count`` and ``rating`` of a webtoon from its votes"""
+    votes = UserWebtoon.objects.filter(webtoon=OuterRef('pk'), rating__isnull=False).order_by().values('webtoon')
+    rating_sum = Coalesce(Subquery(votes.annotate(total=Sum('rating')).values('total')), Value(0.0))
+    rating_count = Coalesce(Subquery(votes.annotate(total=Count('pk')).values('total')), Value(0))
+    rating = Case(
+        When(
+            GreaterThan(rating_count, 0),
+            then=ExpressionWrapper(rating_sum / rating_count, output_field=FloatField()),
+        ),
+        default=Value(0.0),
+    )
+    return {'rating_sum': rating_sum, 'rating_count': rating_count, 'rating': rating}
+
+
+def drifted_webtoons(tolerance=1e-6):
+    """Webtoons whose stored aggregates no longer match their votes, annotated with the expected ones.
+
+    A full scan with correlated subqueries: meant for ``manage.py
+    reconcile_ratings``, never for a request.
+    """
+    expected = expected_aggregates()
+    return Webtoon.objects.annotate(
+        expected_sum=expected['rating_sum'],
+        expected_count=expected['rating_count'],
+        expected_rating=expected['rating'],
+    ).alias(
+        sum_drift=Abs(F('rating_sum') - F('expected_sum')),
+        rating_drift=Abs(F('rating') - F('expected_rating')),
+    ).filter(
+        ~Q(rating_count=F('expected_count')) | Q(sum_drift__gt=tolerance) | Q(rating_drift__gt=tolerance)
+    )
+
+
+def reconcile(webtoon_ids):
+    """Rewrite the aggregates of ``webtoon_ids`` from their votes, in one UPDATE"""
+    updated = Webtoon.objects.filter(pk__in=webtoon_ids).update(**expected_aggregates(), update_at=timezone.now())
+    webtoon_cache.bump()
+    return updated
@@ -0,0 +1,138 @@
+"""Read replicas: safe requests read from ``REPLICA_DATABASES``, everything else from the primary.
+
+``ReplicaRoutingMiddleware`` marks GET/HEAD/OPTIONS requests under
+``REPLICA_READ_PATHS`` as replica reads for the duration of the view;
+``PrimaryReplicaRouter`` then sends their queries to a random replica. Code
+running outside such a request (writes, management commands, the feed
+scheduler, streamed response bodies) always uses the primary.
+
+Replicas lag behind the primary. After a write the client (its JWT user id,
+or its address when anonymous) is pinned to the primary for
+``REPLICA_PIN_SECONDS`` so that it reads its own writes; the window should
+exceed the replication lag. Pins are stored in ``REPLICA_PIN_CACHE_ALIAS``,
+a cache shared by all the workers (see api/checks.py).
+"""
+import contextvars
+import random
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_replica_reads = contextvars.ContextVar('replica_reads', default=False)
+
+
+def reading_from_replica():
+    """True while the current request's reads are sent to a replica"""
+    return _replica_reads.get() and bool(settings.REPLICA_DATABASES)
+
+
+class PrimaryReplicaRouter:
+    """Send reads to a replica during replica requests, and everything else to the primary"""
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            # Les relations d'un objet se lisent sur la base qui l'a chargé
+            return instance._state.db
+        if not reading_from_replica() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.REPLICA_DATABASES)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Les réplicas ont les mêmes données que la base principale
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Les réplicas reçoivent le schéma par la réplication
+        return db == DEFAULT_DB_ALIAS
+
+
+def pin_keys(request):
+    """Cache keys of the pins that apply to ``request``: its JWT user id, or its address without a valid token"""
+    authenticator = JWTAuthentication()
+    header = authenticator.get_header(request)
+    raw_token = header and authenticator.get_raw_token(header)
+    if raw_token:
+        try:
+            token = authenticator.get_validated_token(raw_token)
+            # Derrière un proxy ou un NAT tous les clients partagent l'adresse : elle ne sert qu'aux anonymes
+            return [f'replica:pin:user:{token[api_settings.USER_ID_CLAIM]}']
+        except (InvalidToken, TokenError, KeyError):
+            pass
+    address = request.META.get('REMOTE_ADDR')
+    return [f'replica:pin:addr:{address}'] if address else []
+
+
+class ReplicaRoutingMiddleware:
+    """Route the reads of safe requests to the replicas, unless the client wrote recently"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def routed(self, request):
+        return bool(settings.REPLICA_DATABASES) and request.path.startswith(tuple(settings.REPLICA_READ_PATHS))
+
+    def pin(self, request):
+        # La fenêtre part de la fin de l'écriture, une fois la transaction validée
+        caches[settings.REPLICA_PIN_CACHE_ALIAS].set_many(
+            dict.fromkeys(pin_keys(request), True), timeout=settings.REPLICA_PIN_SECONDS
+        )
+
+    def read_from_replica(self, request):
+        keys = pin_keys(request)
+        return not (keys and caches[settings.REPLICA_PIN_CACHE_ALIAS].get_many(keys))
+
+    async def apin(self, request):
+        await caches[settings.REPLICA_PIN_CACHE_ALIAS].aset_many(
+            dict.fromkeys(pin_keys(request), True), timeout=settings.REPLICA_PIN_SECONDS
+        )
+
+    async def aread_from_replica(self, request):
+        keys = pin_keys(request)
+        return not (keys and await caches[settings.REPLICA_PIN_CACHE_ALIAS].aget_many(keys))
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.routed(request):
+            return self.get_response(request)
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            self.pin(request)
+            return response
+
+        state = _replica_reads.set(self.read_from_replica(request))
+        try:
+            return self.get_response(request)
+        finally:
+            _replica_reads.reset(state)
+
+    async def __acall__(self, request):
+        if not self.routed(request):
+            return await self.get_response(request)
+        if request.method not in SAFE_METHODS:
+            response = await self.get_response(request)
+            await self.apin(request)
+            return response
+
+        # Les requêtes de l'ORM asynchrone copient le contexte : elles voient ce choix
+        state = _replica_reads.set(await self.aread_from_replica(request))
+        try:
+            return await self.get_response(request)
+        finally:
+            _replica_reads.reset(state)
@@ -1,8 +1,16 @@
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from rest_framework import serializers
+from .fields import DynamicFieldsMixin
 from .models.user import User
 from .models.webtoon import Webtoon
+from .models.user_webtoon import UserWebtoon
+from .models.genre import Genre
+from .models.release import Release
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True)
 
     class Meta:
@@ -15,10 +23,200 @@ class UserSerializer(serializers.ModelSerializer):
         user = User.objects.create_user(**validated_data, password=password)
         return user
 
-class WebtoonSerializer(serializers.ModelSerializer):
+class GenreSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Genre
+        fields = ['id', 'name', 'create_at', 'update_at']
+        read_only_fields = ['id', 'create_at', 'update_at']
+
+
+class WebtoonSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     add_by = UserSerializer(read_only=True)
+    genres = serializers.SlugRelatedField(
+        many=True, slug_field='name', queryset=Genre.objects.all(), required=False
+    )
 
     class Meta:
         model = Webtoon
-        fields = ['id', 'title', 'authors', 'status', 'is_public', 'rating', 'add_by', 'release_date', 'create_at', 'update_at', 'waiting_review']
-        read_only_fields = ['id', 'is_public', 'add_by', 'created_at', 'release_date', 'update_at'] 
+        fields = ['id', 'title', 'authors', 'status', 'is_public', 'rating', 'rating_count', 'add_by', 'genres', 'release_date', 'create_at', 'update_at', 'waiting_review']
+        # rating est la moyenne des votes (POST /api/webtoons/{id}/rate/), voir api/ratings.py
+        read_only_fields = ['id', 'is_public', 'rating', 'rating_count', 'add_by', 'created_at', 'release_date', 'update_at']
+        expandable_fields = ['add_by']
+
+
+class ReleaseSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Release
+        fields = ['id', 'webtoon', 'alt_title', 'description', 'language', 'total_chapters', 'create_at', 'update_at']
+        read_only_fields = ['id', 'create_at', 'update_at']
+
+    def validate_webtoon(self, webtoon):
+        if self.instance is not None and webtoon.pk != self.instance.webtoon_id:
+            raise serializers.ValidationError('Le webtoon ne peut pas être changé.')
+        return webtoon
+
+
+class ReleaseSummarySerializer(ReleaseSerializer):
+    """Release without its description, for lists"""
+
+    class Meta(ReleaseSerializer.Meta):
+        fields = [name for name in ReleaseSerializer.Meta.fields if name != 'description']
+
+
+class WebtoonDetailSerializer(WebtoonSerializer):
+    """Webtoon detail with its releases, filtered by ``?lang=`` in ``WebtoonViewSet``"""
+    releases = ReleaseSerializer(many=True, read_only=True)
+
+    class Meta(WebtoonSerializer.Meta):
+        fields = WebtoonSerializer.Meta.fields + ['releases']
+
+
+class WebtoonImportListSerializer(serializers.ListSerializer):
+    def validate_rows(self, rows):
+        """Validate each row on its own, yielding ``(validated_data, None)`` or ``(None, errors)``"""
+        for row in rows:
+            if isinstance(row, Exception):
+                yield None, {'non_field_errors': [str(row)]}
+                continue
+            try:
+                yield self.run_child_validation(row), None
+            except serializers.ValidationError as exc:
+                yield None, exc.detail
+
+
+class WebtoonImportSerializer(WebtoonSerializer):
+    """Title uniqueness is left to the database, see ``api.importers.WebtoonImporter``.
+
+    Genres are not imported: ``bulk_create`` cannot write many-to-many rows.
+    """
+    genres = None
+
+    class Meta(WebtoonSerializer.Meta):
+        fields = [name for name in WebtoonSerializer.Meta.fields if name != 'genres']
+        extra_kwargs = {'title': {'validators': []}}
+        list_serializer_class = WebtoonImportListSerializer
+
+
+class UserWebtoonSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = UserWebtoon
+        fields = ['id', 'webtoon', 'chapter_read', 'chapter_out', 'note', 'reading_status', 'rating', 'create_at', 'update_at']
+        read_only_fields = ['id', 'rating', 'create_at', 'update_at']
+
+    def validate_webtoon(self, webtoon):
+        request = self.context['request']
+        if self.instance is None and UserWebtoon.objects.filter(user_id=request.user.id, webtoon=webtoon).exists():
+            raise serializers.ValidationError('Ce webtoon est déjà dans la bibliothèque.')
+        if self.instance is not None and webtoon.pk != self.instance.webtoon_id:
+            raise serializers.ValidationError('Le webtoon ne peut pas être changé.')
+        return webtoon
+
+    def validate(self, attrs):
+        chapter_read = attrs.get('chapter_read', getattr(self.instance, 'chapter_read', 0))
+        chapter_out = attrs.get('chapter_out', getattr(self.instance, 'chapter_out', 0))
+        if chapter_read > chapter_out:
+            raise serializers.ValidationError(
+                {'chapter_read': 'Le chapitre lu ne peut pas dépasser le nombre de chapitres sortis.'}
+            )
+        return attrs
+
+
+class RatingSerializer(serializers.Serializer):
+    rating = serializers.FloatField(min_value=0, max_value=5, allow_null=True)
+
+
+class BulkReviewSerializer(serializers.Serializer):
+    DECISION_CHOICES = (
+        ("approve", "Approve"),
+        ("reject", "Reject"),
+    )
+    BATCH_MAX = 1000
+
+    ids = serializers.ListField(child=serializers.UUIDField(), min_length=1, max_length=BATCH_MAX)
+    decision = serializers.ChoiceField(choices=DECISION_CHOICES)
+
+
+class LibraryProgressListSerializer(serializers.ListSerializer):
+    """Validate a progress batch as a whole and upsert it in as few statements as possible.
+
+    Validation checks the webtoons in one query. ``save`` then locks the rows
+    the user already has (``select_for_update``), checks ``chapter_read <=
+    chapter_out`` on them and upserts, for each row, only the fields it sent:
+    concurrent batches touching other fields of the same entry keep their
+    changes. Rows sending the same fields share one statement. The database
+    check constraint covers entries created concurrently by another batch.
+    """
+    CHAPTER_CONSTRAINT = 'userwebtoon_chapter_read_lte_out'
+
+    def validate(self, rows):
+        ids = [row['webtoon_id'] for row in rows]
+        duplicates = {str(pk) for pk, count in Counter(ids).items() if count > 1}
+        if duplicates:
+            raise serializers.ValidationError(f'Webtoons en double : {", ".join(sorted(duplicates))}.')
+
+        known = set(Webtoon.objects.filter(id__in=ids).values_list('id', flat=True))
+        missing = [str(pk) for pk in ids if pk not in known]
+        if missing:
+            raise serializers.ValidationError(f'Webtoons introuvables : {", ".join(missing)}.')
+        return rows
+
+    def save(self, **kwargs):
+        rows = self.validated_data
+        user_id = self.context['request'].user.id
+        try:
+            with transaction.atomic():
+                existing = {
+                    entry.webtoon_id: entry
+                    for entry in UserWebtoon.objects.select_for_update().filter(
+                        user_id=user_id, webtoon_id__in=[row['webtoon_id'] for row in rows]
+                    )
+                }
+                entries, groups = self.merge(rows, existing, user_id)
+                for fields, group in groups.items():
+                    UserWebtoon.objects.bulk_create(
+                        group,
+                        update_conflicts=True,
+                        unique_fields=['user', 'webtoon'],
+                        update_fields=[*fields, 'update_at'],
+                    )
+        except IntegrityError as e:
+            if self.CHAPTER_CONSTRAINT not in str(e):
+                raise
+            raise serializers.ValidationError(
+                'Le chapitre lu dépasse le nombre de chapitres sortis.'
+            ) from e
+
+        self.updated = len(existing)
+        self.instance = entries
+        return entries
+
+    @staticmethod
+    def merge(rows, existing, user_id):
+        """Apply the rows to the locked entries, grouped by the fields they send"""
+        now = timezone.now()
+        entries, invalid, groups = [], [], defaultdict(list)
+        for row in rows:
+            entry = existing.get(row['webtoon_id']) or UserWebtoon(user_id=user_id, create_at=now)
+            for field, value in row.items():
+                setattr(entry, field, value)
+            entry.update_at = now
+            if entry.chapter_read > entry.chapter_out:
+                invalid.append(str(entry.webtoon_id))
+            entries.append(entry)
+            groups[tuple(sorted(field for field in row if field != 'webtoon_id'))].append(entry)
+        if invalid:
+            raise serializers.ValidationError(
+                f'Le chapitre lu dépasse le nombre de chapitres sortis : {", ".join(invalid)}.'
+            )
+        return entries, groups
+
+
+class LibraryProgressSerializer(serializers.Serializer):
+    webtoon = serializers.UUIDField(source='webtoon_id')
+    chapter_read = serializers.IntegerField(min_value=0, required=False)
+    chapter_out = serializers.IntegerField(min_value=0, required=False)
+    note = serializers.CharField(allow_blank=True, required=False)
+    reading_status = serializers.ChoiceField(choices=UserWebtoon.READING_STATUS_CHOICES, required=False)
+
+    class Meta:
+        list_serializer_class = LibraryProgressListSerializer
@@ -0,0 +1,101 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from api.authentication import invalidate_user_snapshots
+from api.cache import webtoon_cache
+from api.models.genre import Genre
+from api.models.release import Release
+from api.models.tombstone import Tombstone
+from api.models.user import User
+from api.models.webtoon import Webtoon
+from api.ratings import withdraw_user_votes
+from api.serializers import UserSerializer
+
+
+# Fields of the creator embedded in webtoon payloads (WebtoonSerializer.add_by). BaseModel.save
+# adds update_at to every update_fields, so it does not tell by itself that the creator changed
+EMBEDDED_USER_FIELDS = frozenset(
+    name for name, field in UserSerializer().fields.items() if not field.write_only
+) - {'update_at'}
+
+
+@receiver([post_save, post_delete], sender=Webtoon)
+def invalidate_webtoon_cache(sender, **kwargs):
+    webtoon_cache.bump()
+
+
+@receiver(post_save, sender=User)
+def invalidate_creator_webtoons(sender, created, update_fields, **kwargs):
+    """Webtoon payloads embed their creator, so changes to a creator invalidate them too.
+
+    Signups (no webtoons yet) and saves limited to fields the payload leaves
+    out, such as the password rehashed at login or ``last_login``, keep the cache.
+    """
+    if created or (update_fields is not None and not EMBEDDED_USER_FIELDS & set(update_fields)):
+        return
+    webtoon_cache.bump()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_creator(sender, **kwargs):
+    # add_by passe à NULL par un UPDATE, sans signal pour les webtoons concernés
+    webtoon_cache.bump()
+
+
+@receiver(post_delete, sender=Webtoon)
+def record_webtoon_tombstone(sender, instance, **kwargs):
+    """Deleted ids are reported by the delta sync (``api.sync``)"""
+    Tombstone.objects.create(model=sender._meta.label_lower, object_id=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_authenticated_user(sender, instance, **kwargs):
+    invalidate_user_snapshots(instance.pk)
+
+
+@receiver(pre_delete, sender=User)
+def withdraw_deleted_user_votes(sender, instance, **kwargs):
+    """The library cascade deletes the user's votes: take them out of the webtoon aggregates first"""
+    withdraw_user_votes(instance.pk)
+
+
+@receiver(m2m_changed, sender=Webtoon.genres.through)
+def touch_webtoon_genres(sender, instance, action, reverse, pk_set, **kwargs):
+    """Genres are part of the webtoon payload: move ``update_at`` so ETags and the cache follow"""
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        webtoons = Webtoon.objects.filter(pk=instance.pk)
+    elif reverse and action in ('post_add', 'post_remove'):
+        webtoons = Webtoon.objects.filter(pk__in=pk_set)
+    elif reverse and action == 'pre_clear':
+        # genre.webtoons.clear() : les liens sont lus avant d'être supprimés
+        webtoons = Webtoon.objects.filter(genres=instance)
+    else:
+        return
+    webtoons.update(update_at=timezone.now())
+    webtoon_cache.bump()
+
+
+@receiver(post_save, sender=Genre)
+@receiver(pre_delete, sender=Genre)
+def touch_genre_webtoons(sender, instance, created=False, **kwargs):
+    """A renamed or deleted genre changes the payload of every webtoon having it"""
+    if created:
+        return
+    Webtoon.objects.filter(genres=instance).update(update_at=timezone.now())
+    webtoon_cache.bump()
+
+
+@receiver(post_save, sender=Release)
+def touch_release_webtoon(sender, instance, **kwargs):
+    """Releases are part of the webtoon detail payload.
+
+    Deletions are handled by ``ReleaseViewSet.perform_destroy``: a delete
+    receiver would make the cascade from a webtoon load every release,
+    descriptions included, instead of a single DELETE.
+    """
+    touch_webtoons(Webtoon.objects.filter(pk=instance.webtoon_id))
+
+
+def touch_webtoons(webtoons):
+    webtoons.update(update_at=timezone.now())
+    webtoon_cache.bump()
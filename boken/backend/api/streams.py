@@ -0,0 +1,101 @@
+import codecs
+import json
+import re
+from itertools import islice
+
+from rest_framework.exceptions import ParseError
+
+READ_SIZE = 64 * 1024
+MAX_ROW_SIZE = 1024 * 1024
+WHITESPACE = re.compile(r'\s*')
+
+
+def iter_bytes(stream, size=READ_SIZE):
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def chunked(iterable, size):
+    """Group an iterable into lists of at most ``size`` items without materializing it"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def iter_ndjson(stream, read_size=READ_SIZE):
+    """Yield one decoded value per non-empty line, or a ``ParseError`` for a malformed line"""
+    pending = b''
+    for chunk in iter_bytes(stream, read_size):
+        *lines, pending = (pending + chunk).split(b'\n')
+        if len(pending) > MAX_ROW_SIZE:
+            raise ParseError('Ligne NDJSON trop longue.')
+        for line in lines:
+            if line.strip():
+                yield _decode_line(line)
+    if pending.strip():
+        yield _decode_line(pending)
+
+
+def _decode_line(line):
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return ParseError(f'JSON invalide : {exc}')
+
+
+def iter_json_array(stream, read_size=READ_SIZE):
+    """Yield the items of a top-level JSON array while reading it ``read_size`` bytes at a time"""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter_bytes(stream, read_size)
+    buffer, pos, eof = '', 0, False
+    expect = '['
+
+    while True:
+        pos = WHITESPACE.match(buffer, pos).end()
+        char = buffer[pos] if pos < len(buffer) else None
+        needs_more = char is None
+
+        if char is None:
+            pass
+        elif expect == '[':
+            if char != '[':
+                raise ParseError('Un tableau JSON est attendu.')
+            pos += 1
+            expect = 'first'
+        elif char == ']' and expect in ('first', 'separator'):
+            return
+        elif expect == 'separator':
+            if char != ',':
+                raise ParseError('Tableau JSON invalide : "," attendue.')
+            pos += 1
+            expect = 'value'
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except ValueError as exc:
+                if eof:
+                    raise ParseError(f'JSON invalide : {exc}')
+                needs_more = True
+            else:
+                # A number cut by the chunk boundary still decodes ("1." gives 1):
+                # only accept a value once the following "," or "]" is buffered
+                following = WHITESPACE.match(buffer, end).end()
+                needs_more = not eof and buffer[following:following + 1] not in (',', ']')
+                if not needs_more:
+                    pos = end
+                    expect = 'separator'
+                    yield value
+
+        if needs_more:
+            if eof:
+                raise ParseError('Tableau JSON incomplet.')
+            chunk = next(chunks, None)
+            eof = chunk is None
+            buffer = buffer[pos:] + text.decode(chunk or b'', final=eof)
+            pos = 0
+            if len(buffer) > MAX_ROW_SIZE:
+                raise ParseError('Élément JSON trop long ou invalide.')
@@ -0,0 +1,130 @@
+"""Delta sync: the rows changed and the ids deleted since a watermark.
+
+A watermark is an opaque token holding two ``(update_at, id)`` positions: the
+last change and the last tombstone the client has seen. Both are read along
+an ``(update_at, id)`` index, so a sync costs a range scan of what changed,
+not of the catalogue.
+
+Only rows older than ``SYNC_SETTLE_SECONDS`` are reported: ``update_at`` is
+set before the commit, and a slower transaction could otherwise commit a row
+behind a watermark already handed out.
+
+Tombstones are kept for ``SYNC_TOMBSTONE_TTL`` seconds, then deleted by
+``manage.py prune_tombstones``. A watermark also holds the time up to which
+its client has received every tombstone; once that is older than the
+retention, deletions may have been pruned unseen and ``read_changes`` raises
+``ResyncRequired``.
+"""
+import base64
+import binascii
+import datetime
+import json
+import uuid
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from api.models.tombstone import Tombstone
+from api.pagination import keyset_filter, row_position
+
+
+def encode_position(position):
+    return None if position is None else [position[0].isoformat(), str(position[1])]
+
+
+def decode_position(value):
+    if value is None:
+        return None
+    update_at = parse_datetime(value[0])
+    if update_at is None:
+        raise ValueError(value[0])
+    return update_at, uuid.UUID(value[1])
+
+
+class ResyncRequired(Exception):
+    """The watermark predates the tombstone retention: the client must sync from scratch"""
+
+
+def encode_watermark(changed, deleted, seen):
+    """Encode the last change and last tombstone positions, and the tombstone ``seen`` time, into an opaque token"""
+    payload = {'c': encode_position(changed), 'd': encode_position(deleted), 's': seen.isoformat()}
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_watermark(token):
+    """Decode a token built by ``encode_watermark`` into ``(changed, deleted, seen)``"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        changed, deleted = decode_position(payload['c']), decode_position(payload['d'])
+        if 's' in payload:
+            seen = parse_datetime(payload['s'])
+            if seen is None:
+                raise ValueError(payload['s'])
+        else:
+            # Watermark d'avant la rétention : seul le dernier tombstone remis est sûr
+            seen = (deleted or changed or (None,))[0]
+        return changed, deleted, seen
+    except (TypeError, ValueError, KeyError, IndexError, binascii.Error):
+        raise ValidationError({'since': ['Watermark invalide.']})
+
+
+def tombstone_cutoff():
+    return timezone.now() - datetime.timedelta(seconds=settings.SYNC_TOMBSTONE_TTL)
+
+
+def prune_tombstones(batch_size=1000):
+    """Delete the tombstones older than ``SYNC_TOMBSTONE_TTL``, ``batch_size`` per DELETE; returns the count"""
+    expired = Tombstone.objects.filter(update_at__lt=tombstone_cutoff())
+    pruned = 0
+    while True:
+        batch = list(expired.values_list('id', flat=True)[:batch_size])
+        if not batch:
+            return pruned
+        pruned += Tombstone.objects.filter(id__in=batch).delete()[0]
+
+
+def read_changes(rows, queryset, since, limit):
+    """Changes of ``queryset`` after the watermark ``since`` (None for a first sync).
+
+    ``rows`` turns a queryset into ``.values()`` rows. Returns ``(rows,
+    deleted ids, next watermark, has_more)``, at most ``limit`` rows and
+    ``limit`` ids; the client calls again with the new watermark while
+    ``has_more`` is true. Raises ``ResyncRequired`` when tombstones the
+    client has not seen may have been pruned.
+    """
+    horizon = timezone.now() - datetime.timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    tombstones = Tombstone.objects.filter(model=queryset.model._meta.label_lower, update_at__lte=horizon)
+
+    if since is None:
+        # Premier appel : le client n'a rien à supprimer, on part du dernier tombstone
+        changed_at = None
+        latest = tombstones.order_by('-update_at', '-id').values('update_at', 'id').first()
+        deleted_at = latest and row_position(latest)
+        tombstones = tombstones.none()
+    else:
+        changed_at, deleted_at, seen = decode_watermark(since)
+        if seen is None or seen < tombstone_cutoff():
+            raise ResyncRequired
+
+    changes = queryset.filter(update_at__lte=horizon).order_by('update_at', 'id')
+    if changed_at is not None:
+        changes = keyset_filter(changes, changed_at, descending=False)
+    changed = list(rows(changes)[:limit + 1])
+
+    tombstones = tombstones.order_by('update_at', 'id')
+    if deleted_at is not None:
+        tombstones = keyset_filter(tombstones, deleted_at, descending=False)
+    deleted = list(tombstones.values('update_at', 'id', 'object_id')[:limit + 1])
+
+    has_more = len(changed) > limit or len(deleted) > limit
+    # Tous les tombstones jusqu'à l'horizon sont remis, sauf si la page s'arrête avant
+    seen = deleted[limit - 1]['update_at'] if len(deleted) > limit else horizon
+    changed, deleted = changed[:limit], deleted[:limit]
+    if changed:
+        changed_at = row_position(changed[-1])
+    if deleted:
+        deleted_at = row_position(deleted[-1])
+    watermark = encode_watermark(changed_at, deleted_at, seen)
+    return changed, [row['object_id'] for row in deleted], watermark, has_more
@@ -0,0 +1,27 @@
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from api.conditional import conditional_response, set_validators
+from api.feeds import FEEDS, get_feed
+
+
+class FeedView(APIView):
+    """Flux de la page d'accueil (`latest`, `top_rated`), servis pré-rendus depuis `FeedSnapshot`.
+
+    Pas d'authentification ni de sérialisation : le corps JSON est renvoyé tel quel.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request, name):
+        if name not in FEEDS:
+            return Response({'error': 'Flux inconnu.'}, status=status.HTTP_404_NOT_FOUND)
+
+        etag, last_modified, body = get_feed(name)
+        validators = (etag, last_modified)
+        response = conditional_response(request, validators)
+        if response is not None:
+            return response
+        return set_validators(HttpResponse(body, content_type='application/json'), validators)
@@ -0,0 +1,16 @@
+from rest_framework import viewsets
+from rest_framework.permissions import AllowAny, IsAdminUser
+from api.models.genre import Genre
+from api.serializers import GenreSerializer
+
+
+class GenreViewSet(viewsets.ModelViewSet):
+    """Liste des genres triée par nom, non paginée : la taxonomie reste petite"""
+    queryset = Genre.objects.all()
+    serializer_class = GenreSerializer
+    pagination_class = None
+
+    def get_permissions(self):
+        if self.action in ['list', 'retrieve']:
+            return [AllowAny()]
+        return [IsAdminUser()]
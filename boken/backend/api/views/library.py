@@ -0,0 +1,49 @@
+from rest_framework import viewsets, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.decorators import action
+from api import ratings
+from api.models.user_webtoon import UserWebtoon
+from api.serializers import LibraryProgressSerializer, UserWebtoonSerializer
+
+
+PROGRESS_BATCH_MAX = 500
+
+
+class LibraryViewSet(viewsets.ModelViewSet):
+    """Bibliothèque de l'utilisateur connecté, un élément par webtoon (`/api/library/{webtoon_id}/`)"""
+    queryset = UserWebtoon.objects.all()
+    serializer_class = UserWebtoonSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'webtoon'
+
+    def get_queryset(self):
+        return UserWebtoon.objects.filter(user_id=self.request.user.id)
+
+    def perform_create(self, serializer):
+        serializer.save(user_id=self.request.user.id)
+
+    def perform_destroy(self, instance):
+        # Retire aussi la note de l'utilisateur des agrégats du webtoon
+        ratings.delete_entry(instance)
+
+    # === Progression en lot ===
+    @action(detail=False, methods=['patch'])
+    def progress(self, request):
+        """Enregistre la progression de plusieurs webtoons en une seule requête d'upsert"""
+        if not isinstance(request.data, list):
+            return Response({'error': 'Le corps doit être une liste.'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = LibraryProgressSerializer(
+            data=request.data, many=True, max_length=PROGRESS_BATCH_MAX,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        entries = serializer.save()
+
+        return Response({
+            'created': len(entries) - serializer.updated,
+            'updated': serializer.updated,
+            'results': UserWebtoonSerializer(entries, many=True).data,
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,26 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_safe
+from api.profiling import metrics
+
+
+def metrics_allowed(request):
+    """Bearer ``PROFILING_METRICS_TOKEN`` when it is set, else a local ``REMOTE_ADDR``"""
+    token = settings.PROFILING_METRICS_TOKEN
+    if token:
+        scheme, _, credentials = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(credentials.encode(), token.encode())
+    # Derrière un proxy local toutes les requêtes viennent de 127.0.0.1 : il faut alors le jeton
+    return request.META.get('REMOTE_ADDR') in settings.PROFILING_METRICS_ADDRESSES
+
+
+@require_safe
+def metrics_view(request):
+    """Métriques de profilage de ce process au format texte Prometheus, servies au porteur du jeton ou en local"""
+    if not settings.PROFILING:
+        raise Http404
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.export(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,46 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from api.models.release import Release
+from api.models.webtoon import Webtoon
+from api.permissions import IsWebtoonCreatorOrAdmin
+from api.serializers import ReleaseSerializer, ReleaseSummarySerializer
+from api.signals import touch_webtoons
+
+
+class ReleaseViewSet(viewsets.ModelViewSet):
+    """Traductions des webtoons ; la liste ne lit jamais les descriptions"""
+    queryset = Release.objects.all()
+    serializer_class = ReleaseSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['webtoon', 'language']
+
+    def get_permissions(self):
+        if self.action in ['list', 'retrieve']:
+            return [AllowAny()]
+        elif self.action in ['update', 'destroy', 'partial_update']:
+            return [IsAuthenticated(), IsWebtoonCreatorOrAdmin()]
+        return [IsAuthenticated()]
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ReleaseSummarySerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        if self.action == 'list':
+            return Release.objects.summaries()
+        if self.action in ['update', 'destroy', 'partial_update']:
+            return Release.objects.select_related('webtoon')
+        return Release.objects.all()
+
+    def perform_create(self, serializer):
+        webtoon = serializer.validated_data['webtoon']
+        if getattr(self.request.user, 'role', None) != 'admin' and webtoon.add_by_id != self.request.user.id:
+            raise PermissionDenied('Seul le créateur du webtoon peut ajouter une traduction.')
+        serializer.save()
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        touch_webtoons(Webtoon.objects.filter(pk=instance.webtoon_id))
@@ -3,12 +3,15 @@ from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from api.conditional import ConditionalGetMixin
+from api.fields import SparseFieldsMixin
 from api.permissions import IsSelfOrAdmin
+from api.rows import RowListMixin
 from api.models.user import User
 from api.serializers import UserSerializer
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsMixin, ConditionalGetMixin, RowListMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer 
     permission_classes = [JWTAuthentication]
@@ -22,6 +25,12 @@ class UserViewSet(viewsets.ModelViewSet):
             return [IsAdminUser()]
         return [IsAuthenticated()]
 
+    def get_queryset(self):
+        if self.action in self.read_actions:
+            only, related, prefetch = self.get_read_fields()
+            return User.objects.select_related(*related).prefetch_related(*prefetch).only(*only)
+        return User.objects.all()
+
     # === Création admin ===
     @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
     def create_admin(self, request):
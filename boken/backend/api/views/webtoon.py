@@ -1,29 +1,124 @@
+import itertools
+import json
+
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, status
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError
+from api import ratings
+from api.cache import webtoon_cache
+from api.conditional import (
+    ConditionalGetMixin,
+    conditional_response,
+    get_response_validators,
+    set_validators,
+)
+from api.exporters import EXPORT_FORMATS, export_rows
+from api.fields import SparseFieldsMixin, get_field_params
+from api.filters import WebtoonFilter
+from api.importers import WebtoonImporter
 from api.permissions import IsCreatorOrAdmin
+from api.rows import RowListMixin
+from api.models.release import Release
 from api.models.webtoon import Webtoon
-from api.serializers import WebtoonSerializer
+from api.serializers import (
+    BulkReviewSerializer,
+    RatingSerializer,
+    WebtoonDetailSerializer,
+    WebtoonSerializer,
+)
+from api.streams import iter_json_array, iter_ndjson
+from api.sync import ResyncRequired, read_changes
+
+
+SEARCH_MAX_RESULTS = 100
+TOP_RATED_MAX_RESULTS = 100
+CHANGES_MAX_RESULTS = 1000
+EXPORT_CHUNK_SIZE = 2000
+NDJSON_MEDIA_TYPES = ('application/x-ndjson', 'application/jsonl')
 
 
-class WebtoonViewSet(viewsets.ModelViewSet):
+class WebtoonViewSet(SparseFieldsMixin, ConditionalGetMixin, RowListMixin, viewsets.ModelViewSet):
     queryset = Webtoon.objects.all()
     serializer_class = WebtoonSerializer 
     permission_classes = [JWTAuthentication]
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = WebtoonFilter
+    validator_fields = ('update_at', 'add_by__update_at')
+    read_actions = ('list', 'retrieve', 'search', 'top_rated', 'review_queue', 'changes')
 
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'search', 'top_rated', 'changes']:
             return [AllowAny()]
         elif self.action in ['update', 'destroy', 'partial_update', 'create']:
             return [IsAuthenticated(), IsCreatorOrAdmin()]
-        elif self.action in ['set_to_public']:
+        elif self.action in ['set_to_public', 'bulk_import', 'export', 'review_queue', 'bulk_review']:
             return [IsAdminUser()]
         return [IsAuthenticated()]
 
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return WebtoonDetailSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        if self.action in self.read_actions:
+            only, related, prefetch = self.get_read_fields()
+            prefetch = [self.get_releases_prefetch() if lookup == 'releases' else lookup for lookup in prefetch]
+            return Webtoon.objects.for_action(self.action, only, related, prefetch)
+        return Webtoon.objects.for_action(self.action, related=['add_by'])
+
+    def get_limit(self, maximum, default=20):
+        """`?limit=` borné à [1, maximum], None si ce n'est pas un entier"""
+        try:
+            limit = int(self.request.query_params.get('limit', default))
+        except ValueError:
+            return None
+        return max(1, min(limit, maximum))
+
+    def get_releases_prefetch(self):
+        """Les traductions ne sont lues que pour le détail, et seulement celle de `?lang=` si demandée"""
+        releases = Release.objects.order_by('language')
+        lang = self.request.query_params.get('lang')
+        if lang:
+            releases = releases.filter(language=lang)
+        return Prefetch('releases', queryset=releases)
+
+    # === Lecture en cache ===
+    # Les écritures invalident le cache via les signaux de api/signals.py
+    def list(self, request, *args, **kwargs):
+        key = f'list:{request.build_absolute_uri()}'
+        return self.cached_response(key, super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        fields, expand = get_field_params(request)
+        fields = '*' if fields is None else ','.join(sorted(fields))
+        lang = request.query_params.get('lang', '*')
+        key = f'detail:{kwargs[self.lookup_field]}:{fields}:{",".join(sorted(expand))}:{lang}'
+        return self.cached_response(key, super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, key, fetch, request, *args, **kwargs):
+        """Sert le payload et ses validateurs depuis le cache, sinon les calcule avec `fetch`"""
+        entry = webtoon_cache.get(key)
+        if entry is not None:
+            validators, data = entry
+            response = conditional_response(request, validators)
+            return response or set_validators(Response(data), validators)
+
+        response = fetch(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            webtoon_cache.set(key, (get_response_validators(response), response.data))
+        return response
+
     def perform_create(self, serializer):
-        serializer.save(add_by=self.request.user)
+        # request.user peut être un UserSnapshot (api/authentication.py)
+        serializer.save(add_by_id=self.request.user.id)
 
     @action(detail=True, methods=['patch'], permission_classes=[IsAdminUser])
     def set_to_public(self, request, pk=None):
@@ -42,3 +137,165 @@ class WebtoonViewSet(viewsets.ModelViewSet):
 
         serializer = self.get_serializer(webtoon)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    # === Modération ===
+    @action(detail=False, methods=['get'])
+    def review_queue(self, request):
+        """Webtoons en attente de modération, paginés le long de l'index partiel webtoon_review_idx"""
+        queryset = self.filter_queryset(self.get_queryset()).filter(waiting_review=True)
+        return self.get_row_list_response(queryset)
+
+    @action(detail=False, methods=['post'])
+    def bulk_review(self, request):
+        """Approuve (rend public) ou rejette un lot de webtoons en attente, en un seul UPDATE"""
+        serializer = BulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = set(serializer.validated_data['ids'])
+        decision = serializer.validated_data['decision']
+
+        # .update() n'envoie pas post_save : une seule invalidation pour tout le lot
+        updated = Webtoon.objects.filter(id__in=ids, waiting_review=True).update(
+            waiting_review=False,
+            is_public=decision == 'approve',
+            update_at=timezone.now(),
+        )
+        if updated:
+            webtoon_cache.bump()
+        return Response({
+            'decision': decision,
+            'requested': len(ids),
+            'updated': updated,
+            'skipped': len(ids) - updated,
+        }, status=status.HTTP_200_OK)
+
+    # === Recherche ===
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'error': 'Le paramètre "q" est requis.'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        limit = self.get_limit(SEARCH_MAX_RESULTS)
+        if limit is None:
+            return Response({'error': 'Le paramètre "limit" doit être un entier.'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        row_serializer = self.get_row_serializer()
+        webtoons = self.filter_queryset(self.get_queryset()).search(query)
+        rows = row_serializer.rows(webtoons)[:limit]
+        return Response({'results': row_serializer.serialize(rows)}, status=status.HTTP_200_OK)
+
+    # === Notes ===
+    @action(detail=True, methods=['post'])
+    def rate(self, request, pk=None):
+        """Enregistre la note (0 à 5) de l'utilisateur connecté, ou la retire avec null"""
+        webtoon = self.get_object()
+        serializer = RatingSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        rating = serializer.validated_data['rating']
+        ratings.rate(request.user.id, webtoon.pk, rating)
+        aggregate = Webtoon.objects.filter(pk=webtoon.pk).values('rating', 'rating_count').get()
+        return Response({
+            'rating': rating,
+            'average': aggregate['rating'],
+            'rating_count': aggregate['rating_count'],
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def top_rated(self, request):
+        """Les mieux notés, lus dans l'index (-rating, -rating_count, -id) sans agréger les votes"""
+        limit = self.get_limit(TOP_RATED_MAX_RESULTS)
+        if limit is None:
+            return Response({'error': 'Le paramètre "limit" doit être un entier.'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        row_serializer = self.get_row_serializer()
+        webtoons = self.filter_queryset(self.get_queryset()).order_by('-rating', '-rating_count', '-id')
+        rows = row_serializer.rows(webtoons)[:limit]
+        return Response({'results': row_serializer.serialize(rows)}, status=status.HTTP_200_OK)
+
+    # === Synchronisation ===
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """Webtoons créés ou modifiés et ids supprimés depuis `?since=<watermark>`, avec le watermark suivant"""
+        limit = self.get_limit(CHANGES_MAX_RESULTS, default=100)
+        if limit is None:
+            return Response({'error': 'Le paramètre "limit" doit être un entier.'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        row_serializer = self.get_row_serializer()
+        try:
+            changed, deleted, watermark, has_more = read_changes(
+                lambda queryset: row_serializer.rows(queryset, 'update_at', 'id'),
+                self.filter_queryset(self.get_queryset()),
+                request.query_params.get('since') or None,
+                limit,
+            )
+        except ResyncRequired:
+            # Des suppressions ont pu être purgées sans que le client les voie
+            return Response({
+                'error': 'Watermark plus ancien que la rétention des suppressions : resynchronisation complète requise.',
+                'resync_required': True,
+            }, status=status.HTTP_410_GONE)
+        return Response({
+            'results': row_serializer.serialize(changed),
+            'deleted': deleted,
+            'watermark': watermark,
+            'has_more': has_more,
+        }, status=status.HTTP_200_OK)
+
+    # === Import en masse ===
+    @action(detail=False, methods=['post'])
+    def bulk_import(self, request):
+        """Importe un tableau JSON ou un flux NDJSON de webtoons, résultat ligne par ligne en NDJSON"""
+        on_conflict = request.query_params.get('on_conflict', 'skip')
+        if on_conflict not in WebtoonImporter.conflict_modes:
+            return Response({'error': 'on_conflict doit valoir "skip" ou "update".'},
+                status=status.HTTP_400_BAD_REQUEST)
+        if request.stream is None:
+            return Response({'error': 'Le corps de la requête est vide.'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        if request.content_type.split(';')[0].strip() in NDJSON_MEDIA_TYPES:
+            rows = iter_ndjson(request.stream)
+        else:
+            rows = iter_json_array(request.stream)
+        importer = WebtoonImporter(request.user.id, on_conflict, self.get_serializer_context())
+
+        # La première ligne est lue avant de répondre : un corps illisible donne un 400
+        try:
+            first = next(rows, None)
+        except ParseError as exc:
+            return Response({'error': exc.detail}, status=status.HTTP_400_BAD_REQUEST)
+        if first is not None:
+            rows = itertools.chain([first], rows)
+
+        def report():
+            reported = 0
+            try:
+                for result in importer.run(rows):
+                    reported += 1
+                    yield json.dumps(result, default=str) + '\n'
+            except ParseError as exc:
+                # Les lignes à partir de `row` n'ont pas été importées
+                yield json.dumps({'row': reported, 'status': 'error', 'error': str(exc.detail)}) + '\n'
+            yield json.dumps({'summary': importer.counts}) + '\n'
+
+        return StreamingHttpResponse(report(), content_type='application/x-ndjson')
+
+    # === Export ===
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Exporte le catalogue (filtrable) en NDJSON ou CSV, en flux et à mémoire constante"""
+        output = request.query_params.get('output', 'ndjson')
+        if output not in EXPORT_FORMATS:
+            return Response({'error': 'output doit valoir "ndjson" ou "csv".'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        writer, content_type = EXPORT_FORMATS[output]
+        rows = export_rows(self.filter_queryset(Webtoon.objects.all()), EXPORT_CHUNK_SIZE)
+        response = StreamingHttpResponse(writer(rows, EXPORT_CHUNK_SIZE), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="webtoons.{output}"'
+        return response
@@ -0,0 +1,153 @@
+import functools
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_safe
+from rest_framework import exceptions, status
+from rest_framework.views import exception_handler
+from api.cache import webtoon_cache
+from api.conditional import conditional_response, get_response_validators, set_validators
+from api.fields import get_field_params
+from api.models.webtoon import Webtoon
+from api.profiling import timed
+from api.renderers import FastJSONRenderer
+from api.views.webtoon import SEARCH_MAX_RESULTS, WebtoonViewSet
+
+
+# === Vues asynchrones de lecture ===
+# Liste, détail et recherche des webtoons pour un serveur ASGI (uvicorn) : même
+# payload que WebtoonViewSet, dont elles reprennent querysets, filtres, champs
+# et validateurs, mais les requêtes passent par l'ORM asynchrone (aiterator,
+# aget) au lieu d'occuper un thread du pool pendant l'attente.
+
+def json_response(data, status=status.HTTP_200_OK):
+    with timed('render'):
+        content = FastJSONRenderer().render(data)
+    return HttpResponse(content, content_type='application/json', status=status)
+
+
+async def authenticate(request):
+    """Authentification DRF (JWT) sans thread : `aauthenticate` quand l'authentificateur la propose"""
+    for authenticator in request.authenticators:
+        if hasattr(authenticator, 'aauthenticate'):
+            result = await authenticator.aauthenticate(request)
+        else:
+            result = await sync_to_async(authenticator.authenticate)(request)
+        if result is not None:
+            request._authenticator = authenticator
+            request.user, request.auth = result
+            return
+    request._not_authenticated()
+
+
+def handle_exception(view, exc):
+    """Réponse JSON d'une exception DRF, comme `APIView.handle_exception`"""
+    headers = {}
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        auth_header = view.get_authenticate_header(view.request)
+        if auth_header:
+            headers['WWW-Authenticate'] = auth_header
+        else:
+            exc.status_code = status.HTTP_403_FORBIDDEN
+    response = exception_handler(exc, {'view': view, 'args': (), 'kwargs': view.kwargs, 'request': view.request})
+    if response is None:
+        raise exc
+    result = json_response(response.data, status=response.status_code)
+    for name, value in {**response.headers, **headers}.items():
+        if name.lower() != 'content-type':
+            result[name] = value
+    return result
+
+
+def async_read(action):
+    """Vue asynchrone pour l'action `action` de WebtoonViewSet : `handler(view, request, **kwargs)`"""
+    def decorator(handler):
+        @require_safe
+        @functools.wraps(handler)
+        async def view_func(request, **kwargs):
+            view = WebtoonViewSet(
+                action_map={'get': action, 'head': action}, args=(), kwargs=kwargs, format_kwarg=None,
+            )
+            view.request = view.initialize_request(request)
+            try:
+                await authenticate(view.request)
+                view.check_permissions(view.request)
+                return await handler(view, view.request, **kwargs)
+            except Exception as exc:
+                return handle_exception(view, exc)
+        return view_func
+    return decorator
+
+
+async def cached_response(request, key, fetch):
+    """`WebtoonViewSet.cached_response` : `fetch()` renvoie `(réponse, payload à mettre en cache ou None)`"""
+    entry = await webtoon_cache.aget(key)
+    if entry is not None:
+        validators, data = entry
+        response = conditional_response(request, validators)
+        return response or set_validators(json_response(data), validators)
+
+    response, data = await fetch()
+    if data is not None:
+        await webtoon_cache.aset(key, (get_response_validators(response), data))
+    return response
+
+
+@async_read('list')
+async def webtoon_list(view, request):
+    async def fetch():
+        queryset = view.filter_queryset(view.get_queryset())
+        row_serializer = view.get_row_serializer()
+        rows = row_serializer.rows(queryset, *view.get_row_lookups())
+        page = await view.paginator.apaginate_queryset(rows, request, view)
+        validators = view.get_list_validators(page)
+        response = conditional_response(request, validators)
+        if response is not None:
+            return response, None
+
+        data = view.paginator.get_paginated_data(await row_serializer.aserialize(page))
+        return set_validators(json_response(data), validators), data
+
+    return await cached_response(request, f'async-list:{request.build_absolute_uri()}', fetch)
+
+
+@async_read('retrieve')
+async def webtoon_detail(view, request, pk):
+    async def fetch():
+        queryset = view.filter_queryset(view.get_queryset())
+        try:
+            instance = await queryset.aget(pk=pk)
+        except (Webtoon.DoesNotExist, DjangoValidationError, TypeError, ValueError):
+            raise Http404
+        view.check_object_permissions(request, instance)
+
+        validators = view.get_detail_validators(instance)
+        response = conditional_response(request, validators)
+        if response is not None:
+            return response, None
+        # Tout ce que lit le sérialiseur est chargé par get_queryset (only, select_related, prefetch)
+        data = view.get_serializer(instance).data
+        return set_validators(json_response(data), validators), data
+
+    fields, expand = get_field_params(request)
+    fields = '*' if fields is None else ','.join(sorted(fields))
+    lang = request.query_params.get('lang', '*')
+    return await cached_response(request, f'async-detail:{pk}:{fields}:{",".join(sorted(expand))}:{lang}', fetch)
+
+
+@async_read('search')
+async def webtoon_search(view, request):
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return json_response({'error': 'Le paramètre "q" est requis.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    limit = view.get_limit(SEARCH_MAX_RESULTS)
+    if limit is None:
+        return json_response({'error': 'Le paramètre "limit" doit être un entier.'},
+            status=status.HTTP_400_BAD_REQUEST)
+
+    row_serializer = view.get_row_serializer()
+    webtoons = view.filter_queryset(view.get_queryset()).search(query)
+    rows = [row async for row in row_serializer.rows(webtoons)[:limit].aiterator()]
+    return json_response({'results': await row_serializer.aserialize(rows)})
@@ -12,5 +12,13 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Les requêtes asynchrones ouvrent leurs connexions depuis des threads variables :
+# pas de connexions persistantes par défaut, DB_POOL=1 pour les réutiliser
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
+
+# Rafraîchit les flux de la page d'accueil dans ce process si FEED_REFRESH_INTERVAL > 0
+from api.feeds import start_scheduler  # noqa: E402
+
+start_scheduler()
@@ -10,8 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import importlib.util
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -37,21 +41,24 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     "corsheaders",
     'rest_framework',
+    'django_filters',
     'api',
 ]
 
 MIDDLEWARE = [
+    'api.profiling.ProfilingMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.replicas.ReplicaRoutingMiddleware',
 ]
 
 AUTH_USER_MODEL = 'api.User' 
@@ -78,25 +85,173 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ),
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetCursorPagination',
+    'PAGE_SIZE': 20,
 }
 
+# Authenticated users are cached per token for this many seconds (api/authentication.py).
+# With several workers the alias must be a shared cache (Redis, Memcached): a
+# deactivation or role change only reaches the snapshots of the cache it is written to.
+# `manage.py check --deploy` warns about a per-process one (api/checks.py).
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_TIMEOUT = 60
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
+# Read from the environment (DB_*), the defaults match the local development database.
+# Connections are kept open between requests for DB_CONN_MAX_AGE seconds (0 closes them
+# after each request, "none" keeps them forever) and pinged before reuse when
+# DB_CONN_HEALTH_CHECKS is on. DB_POOL=1 uses psycopg 3's pool instead: the threads of a
+# process share DB_POOL_MIN_SIZE..DB_POOL_MAX_SIZE connections and a request waits at
+# most DB_POOL_TIMEOUT seconds for one; the health checks then run when a connection is
+# taken from the pool.
+# Under ASGI (backend/asgi.py) DB_CONN_MAX_AGE defaults to 0: async requests open their
+# connections from varying threads, so persistent ones pile up instead of being reused,
+# as the Django docs warn. Use DB_POOL=1 there to reuse connections.
+
+
+def env_bool(env, name, default):
+    return env.get(name, str(default)).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def database_config(env):
+    """Build the ``default`` database settings from environment variables"""
+    max_age = env.get('DB_CONN_MAX_AGE', '60').strip().lower()
+    config = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env.get('DB_NAME', 'boken'),
+        'USER': env.get('DB_USER', 'N4yt'),
+        'PASSWORD': env.get('DB_PASSWORD', '1234'),
+        'HOST': env.get('DB_HOST', '127.0.0.1'),
+        'PORT': env.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': None if max_age == 'none' else int(max_age),
+        'CONN_HEALTH_CHECKS': env_bool(env, 'DB_CONN_HEALTH_CHECKS', True),
+        'OPTIONS': {
+            'connect_timeout': int(env.get('DB_CONNECT_TIMEOUT', '5')),
+        },
+    }
+    if env_bool(env, 'DB_POOL', False):
+        # Django refuse les connexions persistantes avec un pool
+        config['CONN_MAX_AGE'] = 0
+        config['OPTIONS']['pool'] = {
+            'min_size': int(env.get('DB_POOL_MIN_SIZE', '2')),
+            'max_size': int(env.get('DB_POOL_MAX_SIZE', '10')),
+            'timeout': float(env.get('DB_POOL_TIMEOUT', '10')),
+            'max_idle': float(env.get('DB_POOL_MAX_IDLE', '600')),
+            'max_lifetime': float(env.get('DB_POOL_MAX_LIFETIME', '3600')),
+        }
+    return config
+
+
+def replica_configs(env, primary):
+    """Build one ``replica``, ``replica_2``... alias per DB_REPLICA_HOSTS entry (``host`` or ``host:port``)"""
+    replicas = {}
+    hosts = [host.strip() for host in env.get('DB_REPLICA_HOSTS', '').split(',') if host.strip()]
+    for i, address in enumerate(hosts, start=1):
+        host, _, port = address.partition(':')
+        config = {**primary, 'OPTIONS': dict(primary['OPTIONS'])}
+        config.update({
+            'HOST': host,
+            'PORT': port or primary['PORT'],
+            'USER': env.get('DB_REPLICA_USER', primary['USER']),
+            'PASSWORD': env.get('DB_REPLICA_PASSWORD', primary['PASSWORD']),
+            # Les tests lisent la base de test principale au lieu d'en créer une
+            'TEST': {'MIRROR': 'default'},
+        })
+        replicas['replica' if i == 1 else f'replica_{i}'] = config
+    return replicas
+
 
 DATABASES = {
+    'default': database_config(os.environ),
+}
+DATABASES.update(replica_configs(os.environ, DATABASES['default']))
+
+
+# Read replicas
+# Safe requests under REPLICA_READ_PATHS read from a random REPLICA_DATABASES alias
+# (api/replicas.py); writes and everything outside a request use "default". A client
+# that wrote is pinned to "default" for REPLICA_PIN_SECONDS, which should exceed the
+# replication lag. Without DB_REPLICA_HOSTS every query goes to "default".
+# The pins live in REPLICA_PIN_CACHE_ALIAS, which must be shared by every worker
+# (Redis, Memcached): a pin in one process' memory does not cover the next request if
+# another worker serves it. The system checks refuse a local cache once replicas are set.
+
+DATABASE_ROUTERS = ['api.replicas.PrimaryReplicaRouter']
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != 'default']
+REPLICA_READ_PATHS = ['/api/']
+REPLICA_PIN_SECONDS = float(os.environ.get('DB_REPLICA_PIN_SECONDS', '5'))
+REPLICA_PIN_CACHE_ALIAS = 'default'
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The "webtoons" alias holds serialized webtoon payloads (api/cache.py). LocMemCache
+# evicts in LRU order past MAX_ENTRIES and expires entries after TIMEOUT seconds;
+# point BACKEND at a shared cache (Redis, Memcached) to share it between workers.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'boken',
-        'USER': 'N4yt',
-        'PASSWORD': '1234',
-        'HOST': '127.0.0.1',
-        'PORT': '5432',
-    }
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'webtoons': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'boken-webtoons',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
 }
 
 
+# Home feeds
+# Snapshots of the home page feeds rendered by `manage.py refresh_feeds` (api/feeds.py).
+# With a positive FEED_REFRESH_INTERVAL (seconds) each web process refreshes them in a
+# background thread; otherwise run `manage.py refresh_feeds --every <seconds>` once.
+# Whatever refreshes them, a request finding a snapshot older than FEED_MAX_AGE seconds
+# renders it again, so feeds never go stale for longer without a scheduler.
+
+FEED_SIZE = 50
+FEED_REFRESH_INTERVAL = int(os.environ.get('FEED_REFRESH_INTERVAL', '0'))
+FEED_MAX_AGE = int(os.environ.get('FEED_MAX_AGE', '60'))
+
+
+# Delta sync
+# /api/webtoons/changes/ only reports rows older than SYNC_SETTLE_SECONDS, so that a
+# transaction still in flight when a watermark is issued is not skipped (api/sync.py).
+# Deletions are reported from tombstones kept SYNC_TOMBSTONE_TTL seconds; run
+# `manage.py prune_tombstones` (e.g. daily) to delete the older ones. A client whose
+# watermark predates the retention gets a 410 and must sync again from scratch.
+
+SYNC_SETTLE_SECONDS = 1.0
+SYNC_TOMBSTONE_TTL = int(os.environ.get('SYNC_TOMBSTONE_TTL', str(30 * 24 * 3600)))
+
+
+# Profiling
+# Opt-in with PROFILING=1: ProfilingMiddleware (api/profiling.py) times the SQL, serializers
+# and rendering of each request, returns them in a Server-Timing header and adds them to
+# per endpoint totals served at /metrics (Prometheus text format). PROFILING_SAMPLE_RATE of
+# the synchronous requests also run under cProfile, dumped to PROFILING_DIR. Off, the
+# middleware removes itself.
+# With PROFILING_METRICS_TOKEN set, /metrics requires "Authorization: Bearer <token>".
+# Without it, /metrics is served to PROFILING_METRICS_ADDRESSES only: behind a reverse proxy
+# on the same host every request comes from 127.0.0.1, so set the token there.
+
+PROFILING = env_bool(os.environ, 'PROFILING', False)
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_DIR = os.environ.get('PROFILING_DIR', str(BASE_DIR / 'profiles'))
+PROFILING_METRICS_ADDRESSES = ['127.0.0.1', '::1']
+PROFILING_METRICS_TOKEN = os.environ.get('PROFILING_METRICS_TOKEN', '')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -116,6 +271,50 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# PASSWORD_HASHER picks the algorithm of new hashes: argon2 (needs argon2-cffi, the default
+# when installed), scrypt or pbkdf2. The others stay listed so that stored hashes still
+# verify; they are rehashed with the chosen algorithm and costs at the next login. Hashing
+# runs on PASSWORD_HASH_WORKERS threads per process, with PASSWORD_HASH_QUEUE more waiting;
+# beyond that logins and signups get a 503 (api/hashers.py).
+#
+# Default costs: Argon2id m=19 MiB t=2 p=1 (OWASP), scrypt N=2^15 r=8 p=1 (32 MiB, the
+# interactive login level of scrypt's author), PBKDF2-SHA256 at Django's 1M iterations.
+# test/benchmark/login_bench.py measures the logins per second per core of each.
+
+PASSWORD_HASHER_PATHS = {
+    'argon2': 'api.hashers.Argon2PasswordHasher',
+    'scrypt': 'api.hashers.ScryptPasswordHasher',
+    'pbkdf2': 'api.hashers.PBKDF2PasswordHasher',
+}
+
+
+def password_hashers(env):
+    """PASSWORD_HASHERS with the PASSWORD_HASHER strategy first"""
+    default = 'argon2' if importlib.util.find_spec('argon2') else 'scrypt'
+    strategy = env.get('PASSWORD_HASHER', default)
+    if strategy not in PASSWORD_HASHER_PATHS:
+        raise ImproperlyConfigured(f'PASSWORD_HASHER must be one of {", ".join(PASSWORD_HASHER_PATHS)}')
+    return [PASSWORD_HASHER_PATHS[strategy], *(path for name, path in PASSWORD_HASHER_PATHS.items() if name != strategy)]
+
+
+PASSWORD_HASHERS = password_hashers(os.environ)
+PASSWORD_ARGON2 = {
+    'time_cost': int(os.environ.get('PASSWORD_ARGON2_TIME_COST', '2')),
+    'memory_cost': int(os.environ.get('PASSWORD_ARGON2_MEMORY_KIB', '19456')),
+    'parallelism': int(os.environ.get('PASSWORD_ARGON2_PARALLELISM', '1')),
+}
+PASSWORD_SCRYPT = {
+    'work_factor': int(os.environ.get('PASSWORD_SCRYPT_N', str(2 ** 15))),
+    'block_size': int(os.environ.get('PASSWORD_SCRYPT_R', '8')),
+    'parallelism': int(os.environ.get('PASSWORD_SCRYPT_P', '1')),
+}
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get('PASSWORD_PBKDF2_ITERATIONS', '1000000'))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', str(max(1, (os.cpu_count() or 2) // 2))))
+PASSWORD_HASH_QUEUE = int(os.environ.get('PASSWORD_HASH_QUEUE', '32'))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -5,16 +5,30 @@ from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
 )
+from api.views.feed import FeedView
+from api.views.genre import GenreViewSet
+from api.views.library import LibraryViewSet
+from api.views.metrics import metrics_view
+from api.views.release import ReleaseViewSet
 from api.views.user import UserViewSet
 from api.views.webtoon import WebtoonViewSet
+from api.views.webtoon_async import webtoon_detail, webtoon_list, webtoon_search
 
 router = routers.DefaultRouter()
 router.register(r'users', UserViewSet)
 router.register(r'webtoons', WebtoonViewSet)
+router.register(r'library', LibraryViewSet)
+router.register(r'genres', GenreViewSet)
+router.register(r'releases', ReleaseViewSet)
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/feeds/<str:name>/', FeedView.as_view(), name='feed'),
+    path('api/async/webtoons/', webtoon_list, name='async-webtoon-list'),
+    path('api/async/webtoons/search/', webtoon_search, name='async-webtoon-search'),
+    path('api/async/webtoons/<str:pk>/', webtoon_detail, name='async-webtoon-detail'),
     path('api/', include(router.urls)),
     path('login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('metrics', metrics_view, name='metrics'),
 ]
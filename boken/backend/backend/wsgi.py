@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Rafraîchit les flux de la page d'accueil dans ce process si FEED_REFRESH_INTERVAL > 0
+from api.feeds import start_scheduler  # noqa: E402
+
+start_scheduler()
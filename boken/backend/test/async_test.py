@@ -0,0 +1,185 @@
+import asyncio
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import Genre, Release
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class AsyncWebtoonReadTests(APITestCase):
+    def setUp(self):
+        self.sync_url = "/api/webtoons/"
+        self.async_url = "/api/async/webtoons/"
+        webtoon_cache.backend.clear()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        action = Genre.objects.create(name="Action")
+        self.webtoons = [
+            Webtoon.objects.create(
+                title=f"Webtoon {i}", authors="Author", status="Ongoing", add_by=self.user
+            )
+            for i in range(3)
+        ]
+        self.webtoons[0].genres.add(action)
+        Release.objects.create(webtoon=self.webtoons[0], language="fr", alt_title="Webtoon FR")
+        self.webtoon = self.webtoons[0]
+
+    # === TESTS LISTE ===
+    async def test_list_matches_sync(self):
+        """✅ La liste asynchrone rend le même payload que la liste synchrone"""
+        response = await self.async_client.get(self.async_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = (await self.async_client.get(self.sync_url)).json()
+        self.assertEqual(response.json()["results"], expected["results"])
+
+    async def test_list_pages(self):
+        """✅ Le curseur `next` mène à la page suivante"""
+        first = (await self.async_client.get(self.async_url, {"page_size": 2})).json()
+        self.assertEqual(len(first["results"]), 2)
+        second = (await self.async_client.get(first["next"])).json()
+        self.assertEqual(len(second["results"]), 1)
+        self.assertIsNone(second["next"])
+
+    async def test_list_filters(self):
+        """✅ Les filtres de WebtoonFilter s'appliquent"""
+        response = await self.async_client.get(self.async_url, {"genre": "Action"})
+        self.assertEqual([row["title"] for row in response.json()["results"]], ["Webtoon 0"])
+
+    async def test_list_invalid_filter(self):
+        """🚫 Un filtre invalide retourne 400"""
+        response = await self.async_client.get(self.async_url, {"rating__gte": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_list_not_modified(self):
+        """✅ Un If-None-Match à jour retourne 304"""
+        etag = (await self.async_client.get(self.async_url))["ETag"]
+        response = await self.async_client.get(self.async_url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_list_is_served_from_cache(self):
+        """✅ Le deuxième appel est servi par le cache"""
+        webtoon_cache.reset_stats()
+        await self.async_client.get(self.async_url)
+        response = await self.async_client.get(self.async_url)
+        self.assertEqual(len(response.json()["results"]), 3)
+        self.assertEqual(webtoon_cache.stats()["hits"], 1)
+
+    # === TESTS DÉTAIL ===
+    async def test_detail_matches_sync(self):
+        """✅ Le détail asynchrone rend le même payload que le détail synchrone"""
+        response = await self.async_client.get(f"{self.async_url}{self.webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = (await self.async_client.get(f"{self.sync_url}{self.webtoon.id}/")).json()
+        self.assertEqual(response.json(), expected)
+        self.assertEqual(response.json()["releases"][0]["language"], "fr")
+
+    async def test_detail_fields_and_expand(self):
+        """✅ `fields` et `expand` s'appliquent au détail"""
+        url = f"{self.async_url}{self.webtoon.id}/"
+        data = (await self.async_client.get(url, {"fields": "id,title,add_by"})).json()
+        self.assertEqual(data, {"id": str(self.webtoon.id), "title": "Webtoon 0", "add_by": str(self.user.id)})
+        data = (await self.async_client.get(url, {"fields": "add_by", "expand": "add_by"})).json()
+        self.assertEqual(data["add_by"]["username"], "user")
+
+    async def test_detail_not_found(self):
+        """🚫 Un id inconnu ou invalide retourne 404"""
+        response = await self.async_client.get(f"{self.async_url}00000000-0000-0000-0000-000000000000/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = await self.async_client.get(f"{self.async_url}not-an-id/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_detail_invalidated_by_update(self):
+        """✅ Une modification invalide le détail en cache"""
+        url = f"{self.async_url}{self.webtoon.id}/"
+        await self.async_client.get(url)
+        response = await self.async_client.patch(
+            f"{self.sync_url}{self.webtoon.id}/", {"title": "Renamed"},
+            content_type="application/json", headers={"Authorization": f"Bearer {self.user_token}"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((await self.async_client.get(url)).json()["title"], "Renamed")
+
+    # === TESTS RECHERCHE ===
+    async def test_search_matches_sync(self):
+        """✅ La recherche asynchrone rend les mêmes résultats"""
+        params = {"q": "Webtoon 1"}
+        response = await self.async_client.get(f"{self.async_url}search/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = (await self.async_client.get(f"{self.sync_url}search/", params)).json()
+        self.assertEqual(response.json(), expected)
+
+    async def test_search_requires_query(self):
+        """🚫 Sans `q`, la recherche retourne 400"""
+        response = await self.async_client.get(f"{self.async_url}search/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.json())
+
+    # === TESTS AUTHENTIFICATION ===
+    async def test_authenticated_request(self):
+        """✅ Un JWT valide est accepté"""
+        response = await self.async_client.get(
+            self.async_url, headers={"Authorization": f"Bearer {self.user_token}"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    async def test_invalid_token(self):
+        """🚫 Un JWT invalide retourne 401, comme les vues synchrones"""
+        response = await self.async_client.get(self.async_url, headers={"Authorization": "Bearer invalid"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("WWW-Authenticate", response)
+
+    async def test_inactive_user(self):
+        """🚫 Le JWT d'un utilisateur désactivé est refusé"""
+        await User.objects.filter(pk=self.user.pk).aupdate(is_active=False)
+        response = await self.async_client.get(
+            self.async_url, headers={"Authorization": f"Bearer {self.user_token}"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_cache_off_event_loop(self):
+        """✅ Cache des réponses et des utilisateurs lus et écrits hors de la boucle d'événements"""
+        calls, on_loop = [], []
+
+        def watch(backend, name):
+            method = getattr(backend, name)
+
+            def wrapper(*args, **kwargs):
+                calls.append(name)
+                try:
+                    asyncio.get_running_loop()
+                    on_loop.append(name)
+                except RuntimeError:
+                    pass
+                return method(*args, **kwargs)
+            return mock.patch.object(backend, name, wrapper)
+
+        headers = {"Authorization": f"Bearer {self.user_token}"}
+        backends = {caches[settings.AUTH_USER_CACHE_ALIAS], webtoon_cache.backend}
+        patches = [watch(backend, name) for backend in backends for name in ("get", "get_many", "add", "set")]
+        for patch in patches:
+            patch.start()
+        try:
+            for _ in range(2):
+                response = await self.async_client.get(self.async_url, headers=headers)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+        finally:
+            for patch in reversed(patches):
+                patch.stop()
+        self.assertTrue(calls)
+        self.assertEqual(on_loop, [])
+
+    async def test_write_not_allowed(self):
+        """🚫 Les vues asynchrones sont en lecture seule"""
+        response = await self.async_client.post(self.async_url, {})
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
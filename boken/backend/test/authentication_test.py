@@ -0,0 +1,137 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.conf import settings
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken
+from api.authentication import CachedJWTAuthentication, UserSnapshot, generation_key, invalidate_user_snapshots
+from api.checks import check_auth_user_cache
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        self.users_url = "/api/users/"
+        caches[settings.AUTH_USER_CACHE_ALIAS].clear()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.token = self.get_token_for_user(self.user)
+        self.detail_url = f"{self.users_url}{self.user.id}/"
+
+    def get_token_for_user(self, user):
+        """Retourne un JWT valide pour un utilisateur donné"""
+        return str(RefreshToken.for_user(user).access_token)
+
+    def authenticate(self, token=None):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token or self.token}")
+
+    def test_second_request_skips_user_lookup(self):
+        """✅ Le deuxième appel avec le même token ne recharge pas l'utilisateur"""
+        self.authenticate()
+        self.client.get(self.detail_url)
+        # Seule la lecture de l'objet demandé reste
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_snapshot_is_compact(self):
+        """✅ L'utilisateur en cache n'a que id, role, is_staff et is_active"""
+        snapshot = UserSnapshot.from_user(self.user)
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+        self.assertEqual(snapshot.pk, self.user.id)
+        self.assertTrue(snapshot.is_authenticated)
+
+    def test_deactivated_user_is_rejected(self):
+        """🚫 Un utilisateur désactivé est refusé même avec un token en cache"""
+        self.authenticate()
+        self.client.get(self.detail_url)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_user_is_rejected(self):
+        """🚫 Un utilisateur supprimé est refusé même avec un token en cache"""
+        self.authenticate()
+        self.client.get(self.detail_url)
+        self.user.delete()
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_role_change_applies_immediately(self):
+        """✅ Une promotion admin s'applique dès la requête suivante"""
+        self.authenticate()
+        response = self.client.get(self.users_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.role = "admin"
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.users_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_role_change_applies_to_every_token(self):
+        """✅ Une rétrogradation invalide tous les tokens de l'utilisateur"""
+        admin = User.objects.create_admin(email="admin@test.com", username="admin", password="admin1234")
+        first, second = self.get_token_for_user(admin), self.get_token_for_user(admin)
+        for token in (first, second):
+            self.authenticate(token)
+            self.assertEqual(self.client.get(self.users_url).status_code, status.HTTP_200_OK)
+
+        admin.role = "user"
+        admin.is_staff = False
+        admin.save()
+        for token in (first, second):
+            self.authenticate(token)
+            self.assertEqual(self.client.get(self.users_url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cached_user_can_create_webtoon(self):
+        """✅ Un utilisateur servi depuis le cache peut créer un webtoon"""
+        self.authenticate()
+        self.client.get(self.detail_url)
+        data = {"title": "Cached Webtoon", "authors": "Author", "status": "Ongoing"}
+        response = self.client.post("/api/webtoons/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["add_by"]["id"], str(self.user.id))
+
+    # === TESTS INVALIDATION ===
+    def test_invalidation_without_generation(self):
+        """✅ Invalider un utilisateur jamais mis en cache crée quand même une génération"""
+        cache = caches[settings.AUTH_USER_CACHE_ALIAS]
+        cache.delete(generation_key(self.user.id))
+        invalidate_user_snapshots(self.user.id)
+        self.assertIsNotNone(cache.get(generation_key(self.user.id)))
+
+    def test_change_during_first_lookup_is_not_cached(self):
+        """🚫 Un utilisateur modifié pendant son premier chargement n'est pas mis en cache"""
+        authenticator = CachedJWTAuthentication()
+        token = AccessToken(self.token)
+        caches[settings.AUTH_USER_CACHE_ALIAS].delete(generation_key(self.user.id))
+        user_id, generation, snapshot = authenticator.read_snapshot(token)
+        self.assertIsNone(generation)
+
+        # Désactivé entre la lecture du cache et l'écriture du snapshot
+        invalidate_user_snapshots(self.user.id)
+        authenticator.write_snapshot(token, user_id, generation, self.user)
+        self.assertIsNone(authenticator.read_snapshot(token)[2])
+
+    def test_bulk_update_needs_explicit_invalidation(self):
+        """✅ Après un update() en masse, invalidate_user_snapshots applique la désactivation"""
+        self.authenticate()
+        self.client.get(self.detail_url)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        invalidate_user_snapshots(self.user.pk)
+        self.assertEqual(self.client.get(self.detail_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # === TESTS CONFIGURATION ===
+    def test_check_local_cache(self):
+        """🚫 `check --deploy` signale un cache d'utilisateurs propre au processus"""
+        self.assertEqual([message.id for message in check_auth_user_cache(None)], ["api.W001"])
+        shared = {**settings.CACHES, "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        with override_settings(CACHES=shared, AUTH_USER_CACHE_ALIAS="shared"):
+            self.assertEqual(check_auth_user_cache(None), [])
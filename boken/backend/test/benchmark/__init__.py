@@ -0,0 +1,31 @@
+"""Benchmarks de l'API.
+
+Ils ne sont pas lancés avec la suite de tests normale ; pour les exécuter :
+
+    python manage.py test test.benchmark --pattern="*_bench.py"
+
+La taille du jeu de données se règle avec la variable d'environnement
+``BOKEN_BENCH_ROWS`` ; test/benchmark/datagen.py le génère, jusqu'au million
+de lignes sur une vraie base.
+
+Le test de charge (load_bench.py) écrit son rapport JSON dans
+``BOKEN_BENCH_REPORT`` et, si ``BOKEN_BENCH_BASELINE`` désigne un rapport de
+référence, échoue quand une latence ou un débit s'est dégradé de plus de
+``BOKEN_BENCH_THRESHOLD`` (0.2 = 20 %) :
+
+    BOKEN_BENCH_REPORT=baseline.json python manage.py test test.benchmark.load_bench --pattern="*_bench.py"
+    BOKEN_BENCH_BASELINE=baseline.json python manage.py test test.benchmark.load_bench --pattern="*_bench.py"
+
+Les micro-benchmarks des sérialiseurs et des permissions (micro_*.py)
+tournent sous pytest-benchmark (requirement-bench.txt), qui garde ses propres
+références :
+
+    pytest --benchmark-autosave
+    pytest --benchmark-compare --benchmark-compare-fail=median:20%
+"""
+import os
+
+BENCH_ROWS = int(os.environ.get("BOKEN_BENCH_ROWS", "20000"))
+BENCH_REPORT = os.environ.get("BOKEN_BENCH_REPORT", "bench-report.json")
+BENCH_BASELINE = os.environ.get("BOKEN_BENCH_BASELINE")
+BENCH_THRESHOLD = float(os.environ.get("BOKEN_BENCH_THRESHOLD", "0.2"))
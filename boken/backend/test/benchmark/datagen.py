@@ -0,0 +1,132 @@
+"""Jeu de données synthétique pour les benchmarks et les tests de charge.
+
+Crée des utilisateurs, des genres et des webtoons par ``bulk_create``, par
+lots de taille constante : un million de webtoons tient en mémoire et en
+quelques minutes. Tous les utilisateurs partagent le même mot de passe
+(``BENCH_PASSWORD``), haché une seule fois. Les dates et les clés UUIDv7
+sont étalées sur l'année écoulée, comme sur une base qui a vécu.
+
+Depuis un test : ``generate(webtoons=..., users=...)``. En ligne de commande,
+sur la base de ``DJANGO_SETTINGS_MODULE`` (backend.settings par défaut) :
+
+    python test/benchmark/datagen.py --webtoons 1000000 --users 10000
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+BENCH_PASSWORD = "bench-password"
+GENRES = ("Action", "Comedy", "Drama", "Fantasy", "Horror", "Romance", "Sci-Fi", "Slice of Life", "Sports", "Thriller")
+STATUSES = ("Ongoing", "Completed", "Hiatus")
+SPAN_DAYS = 365
+
+
+def batches(total, batch_size):
+    for start in range(0, total, batch_size):
+        yield range(start, min(start + batch_size, total))
+
+
+def stamps(index, total, now):
+    """`(uuid7, datetime)` de la ligne `index` sur `total`, de la plus ancienne à `now`"""
+    from api.models.base_model import uuid7
+
+    moment = now - datetime.timedelta(days=SPAN_DAYS) * (1 - index / max(total, 1))
+    return uuid7(int(moment.timestamp() * 1000)), moment
+
+
+def generate(webtoons=1000, users=None, genres_per_webtoon=2, batch_size=5000, prefix="bench", seed=0, stdout=None):
+    """Crée `users` utilisateurs (1 pour 100 webtoons par défaut) et `webtoons` webtoons, avec leurs genres.
+
+    Les titres, e-mails et pseudos sont préfixés par `prefix` : deux appels
+    avec des préfixes différents remplissent la même base. Renvoie les
+    utilisateurs créés.
+    """
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+    from django.utils import timezone
+    from api.cache import webtoon_cache
+    from api.models import Genre, User, Webtoon, WebtoonGenre
+
+    rng = random.Random(seed)
+    users = max(1, webtoons // 100) if users is None else users
+    now = timezone.now()
+    password = make_password(BENCH_PASSWORD)
+    log = stdout.write if stdout is not None else (lambda message: None)
+
+    start = time.perf_counter()
+    genre_ids = []
+    for name in GENRES:
+        genre, _ = Genre.objects.get_or_create(name=name)
+        genre_ids.append(genre.pk)
+
+    created_users = []
+    for chunk in batches(users, batch_size):
+        rows = []
+        for i in chunk:
+            pk, moment = stamps(i, users, now)
+            rows.append(User(
+                id=pk, email=f"{prefix}{i}@example.com", username=f"{prefix}{i}",
+                password=password, create_at=moment, update_at=moment,
+            ))
+        with transaction.atomic():
+            created_users += User.objects.bulk_create(rows)
+    log(f"{users} utilisateurs en {time.perf_counter() - start:.1f} s\n")
+
+    user_ids = [user.pk for user in created_users]
+    genres_per_webtoon = min(genres_per_webtoon, len(genre_ids))
+    for chunk in batches(webtoons, batch_size):
+        rows, links = [], []
+        for i in chunk:
+            pk, moment = stamps(i, webtoons, now)
+            count = rng.randrange(0, 50)
+            rating = round(rng.uniform(1, 5), 2) if count else 0.0
+            rows.append(Webtoon(
+                id=pk, title=f"{prefix.capitalize()} webtoon {i}", authors=f"Author {i % 997}",
+                status=rng.choice(STATUSES), release_date=moment.date(), is_public=rng.random() < 0.9,
+                rating=rating, rating_sum=rating * count, rating_count=count,
+                add_by_id=user_ids[i % len(user_ids)] if user_ids else None,
+                create_at=moment, update_at=moment,
+            ))
+            links += [
+                WebtoonGenre(webtoon_id=pk, genre_id=genre_id, create_at=moment, update_at=moment)
+                for genre_id in rng.sample(genre_ids, genres_per_webtoon)
+            ]
+        with transaction.atomic():
+            Webtoon.objects.bulk_create(rows)
+            WebtoonGenre.objects.bulk_create(links)
+        if chunk.stop % (batch_size * 20) == 0 or chunk.stop == webtoons:
+            log(f"{chunk.stop}/{webtoons} webtoons, {time.perf_counter() - start:.1f} s\n")
+
+    # bulk_create ne passe pas par save() : les réponses en cache ne voient pas les nouvelles lignes
+    webtoon_cache.bump()
+    return created_users
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--webtoons", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=None, help="1 pour 100 webtoons par défaut")
+    parser.add_argument("--genres-per-webtoon", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--prefix", default="bench", help="préfixe des titres, e-mails et pseudos")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+    import django
+    django.setup()
+
+    start = time.perf_counter()
+    generate(
+        webtoons=args.webtoons, users=args.users, genres_per_webtoon=args.genres_per_webtoon,
+        batch_size=args.batch_size, prefix=args.prefix, seed=args.seed, stdout=sys.stdout,
+    )
+    print(f"terminé en {time.perf_counter() - start:.1f} s ; mot de passe des comptes : {BENCH_PASSWORD}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import statistics
+import time
+
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+from api.cache import webtoon_cache
+from api.models import Genre, WebtoonGenre
+from api.models.webtoon import Webtoon
+from . import BENCH_ROWS
+
+
+class GenreFilterBenchmark(TestCase):
+    """Latence de `?genre=` (OU / ET) quand le nombre de titres par genre grandit.
+
+    Objectif : une latence stable, la page restant un parcours d'index quel
+    que soit le volume du genre (``BOKEN_BENCH_ROWS=100000`` pour 100k titres).
+    Le cache est invalidé à chaque requête : l'agrégat des validateurs ETag
+    (count + max) reste proportionnel au nombre de titres du genre.
+    """
+    requests = 50
+    steps = (BENCH_ROWS // 100, BENCH_ROWS // 10, BENCH_ROWS)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.target, cls.other = Genre.objects.bulk_create([Genre(name="Target"), Genre(name="Other")])
+
+    def grow_to(self, size):
+        """Ajoute des webtoons du genre Target (un sur deux aussi Other) jusqu'à `size`"""
+        start = Webtoon.objects.count()
+        webtoons = Webtoon.objects.bulk_create(
+            (
+                Webtoon(title=f"Webtoon {i}", authors="Author", status="Ongoing")
+                for i in range(start, size)
+            ),
+            batch_size=5000,
+        )
+        WebtoonGenre.objects.bulk_create(
+            (
+                WebtoonGenre(webtoon=webtoon, genre=genre)
+                for i, webtoon in enumerate(webtoons)
+                for genre in ((self.target, self.other) if i % 2 else (self.target,))
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def measure(self, client, params):
+        timings = []
+        for _ in range(self.requests):
+            webtoon_cache.bump()  # mesure la base, pas le cache
+            start = time.perf_counter()
+            response = client.get("/api/webtoons/", params)
+            timings.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+        return statistics.median(timings) * 1000, statistics.quantiles(timings, n=20)[-1] * 1000
+
+    def test_genre_filter_latency(self):
+        client = APIClient()
+        print(f"\n[genre] {connection.vendor}, {self.requests} requêtes par mesure")
+        p95s = []
+        for size in self.steps:
+            self.grow_to(size)
+            any_p50, any_p95 = self.measure(client, {"genre": "Target,Other"})
+            all_p50, all_p95 = self.measure(client, {"genre": "Target,Other", "genre_mode": "and"})
+            p95s.append(max(any_p95, all_p95))
+            print(f"  {size:>7} titres  OU p50 {any_p50:.2f} ms p95 {any_p95:.2f} ms"
+                  f"  ET p50 {all_p50:.2f} ms p95 {all_p95:.2f} ms")
+        print(f"  p95 {p95s[-1] / p95s[0]:.1f}x entre {self.steps[0]} et {self.steps[-1]} titres")
@@ -0,0 +1,178 @@
+"""Générateur de charge HTTP, pour comparer les réglages de connexion à la base (DB_*).
+
+Il ne fait pas partie des tests : il tape sur un serveur déjà lancé, par
+exemple contre un PostgreSQL local, une fois sans réutilisation des
+connexions puis une fois avec le pool :
+
+    DB_CONN_MAX_AGE=0 python manage.py runserver --noreload
+    python test/benchmark/http_load.py --concurrency 16 --duration 20
+
+    DB_POOL=1 DB_POOL_MAX_SIZE=16 python manage.py runserver --noreload
+    python test/benchmark/http_load.py --concurrency 16 --duration 20
+
+runserver crée un thread par connexion : sans pool, chaque requête ouvre sa
+propre connexion PostgreSQL. Les chemins par défaut ne passent pas par le
+cache des webtoons, chaque requête va donc jusqu'à la base.
+
+Pour beaucoup de clients (``--concurrency 1000``), ``--asyncio`` les fait
+tourner dans une seule boucle au lieu d'un thread chacun, par exemple pour
+comparer les vues synchrones sous WSGI et les vues asynchrones sous ASGI :
+
+    gunicorn backend.wsgi --threads 32
+    python test/benchmark/http_load.py --asyncio --concurrency 1000 --path "/api/webtoons/search/?q=one"
+
+    DB_POOL=1 uvicorn backend.asgi:application
+    python test/benchmark/http_load.py --asyncio --concurrency 1000 --path "/api/async/webtoons/search/?q=one"
+"""
+import argparse
+import asyncio
+import http.client
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = ("/api/genres/", "/api/webtoons/top_rated/?limit=10")
+
+
+def worker(base, paths, headers, deadline, latencies, errors):
+    """Enchaîne les requêtes sur une connexion keep-alive jusqu'à ``deadline``"""
+    connection_class = http.client.HTTPSConnection if base.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(base.hostname, base.port, timeout=30)
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            connection.request("GET", base.path.rstrip("/") + path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            connection.close()
+            continue
+        if response.status >= 400:
+            errors.append(path)
+        else:
+            latencies.append(time.perf_counter() - start)
+    connection.close()
+
+
+async def read_response(reader):
+    """Lit une réponse HTTP/1.1 (Content-Length ou chunked), renvoie son code"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connexion fermée")
+    status = int(status_line.split()[1])
+    length, chunked = 0, False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+    if not chunked:
+        await reader.readexactly(length)
+        return status
+    while True:
+        size = int((await reader.readline()).split(b";")[0], 16)
+        await reader.readexactly(size + 2)
+        if size == 0:
+            return status
+
+
+async def async_worker(base, paths, headers, deadline, latencies, errors):
+    """``worker`` pour la boucle asyncio : une connexion keep-alive par client"""
+    extra = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    prefix = base.path.rstrip("/")
+    connection = None
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(base.hostname, base.port or 80)
+            reader, writer = connection
+            writer.write(f"GET {prefix}{path} HTTP/1.1\r\nHost: {base.netloc}\r\n{extra}\r\n".encode())
+            await writer.drain()
+            status = await asyncio.wait_for(read_response(reader), timeout=30)
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            errors.append(path)
+            if connection is not None:
+                connection[1].close()
+            connection = None
+            continue
+        if status >= 400:
+            errors.append(path)
+        else:
+            latencies.append(time.perf_counter() - start)
+    if connection is not None:
+        connection[1].close()
+
+
+async def run_async(url, paths, concurrency, duration, headers):
+    base = urlsplit(url)
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(
+        async_worker(base, paths, headers, deadline, latencies, errors) for _ in range(concurrency)
+    ))
+    return latencies, errors, time.perf_counter() - start
+
+
+def run(url, paths, concurrency, duration, headers):
+    """Lance ``concurrency`` clients pendant ``duration`` secondes, renvoie ``(latences, erreurs, durée)``"""
+    base = urlsplit(url)
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + duration
+    threads = [
+        threading.Thread(target=worker, args=(base, paths, headers, deadline, latencies, errors))
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="serveur visé")
+    parser.add_argument("--path", action="append", dest="paths",
+                        help=f"chemin à appeler, répétable (défaut : {', '.join(DEFAULT_PATHS)})")
+    parser.add_argument("--concurrency", type=int, default=8, help="clients simultanés")
+    parser.add_argument("--duration", type=float, default=10, help="durée en secondes")
+    parser.add_argument("--token", help="JWT envoyé en Authorization: Bearer")
+    parser.add_argument("--asyncio", action="store_true", help="clients dans une boucle asyncio (http seulement)")
+    args = parser.parse_args()
+
+    headers = {"Accept": "application/json"}
+    if args.token:
+        headers["Authorization"] = f"Bearer {args.token}"
+    paths = args.paths or list(DEFAULT_PATHS)
+    if args.asyncio:
+        latencies, errors, elapsed = asyncio.run(run_async(args.url, paths, args.concurrency, args.duration, headers))
+    else:
+        latencies, errors, elapsed = run(args.url, paths, args.concurrency, args.duration, headers)
+
+    print(f"{len(latencies)} requêtes en {elapsed:.1f} s, {len(errors)} erreurs, {args.concurrency} clients")
+    if len(latencies) < 2:
+        return
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"  débit {len(latencies) / elapsed:.0f} req/s")
+    print(f"  latence p50 {quantiles[49] * 1000:.1f} ms  p95 {quantiles[94] * 1000:.1f} ms"
+          f"  p99 {quantiles[98] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models.webtoon import Webtoon
+from . import BENCH_ROWS
+
+User = get_user_model()
+
+
+class BulkImportBenchmark(TestCase):
+    """Débit d'import (lignes/s) : bulk_import comparé à un POST par webtoon"""
+    single_posts = 200
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        token = str(RefreshToken.for_user(self.admin).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def rows(self, count, prefix):
+        return [
+            {"title": f"{prefix} {i}", "authors": "Author", "status": "Ongoing", "rating": 4.0}
+            for i in range(count)
+        ]
+
+    def test_import_throughput(self):
+        start = time.perf_counter()
+        for row in self.rows(self.single_posts, "Single"):
+            response = self.client.post("/api/webtoons/", row, format="json")
+            self.assertEqual(response.status_code, 201)
+        single_rate = self.single_posts / (time.perf_counter() - start)
+
+        body = "\n".join(json.dumps(row) for row in self.rows(BENCH_ROWS, "Bulk"))
+        start = time.perf_counter()
+        response = self.client.generic(
+            "POST", "/api/webtoons/bulk_import/", body, content_type="application/x-ndjson"
+        )
+        summary = json.loads(b"".join(response.streaming_content).splitlines()[-1])["summary"]
+        bulk_rate = BENCH_ROWS / (time.perf_counter() - start)
+
+        print(f"\n[import] POST unitaire : {single_rate:.0f} lignes/s ({self.single_posts} lignes)")
+        print(f"  bulk_import NDJSON : {bulk_rate:.0f} lignes/s ({BENCH_ROWS} lignes)")
+        print(f"  gain x{bulk_rate / single_rate:.1f}")
+
+        self.assertEqual(summary["created"], BENCH_ROWS)
+        self.assertEqual(Webtoon.objects.filter(title__startswith="Bulk").count(), BENCH_ROWS)
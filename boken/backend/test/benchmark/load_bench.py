@@ -0,0 +1,77 @@
+import time
+
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import Webtoon
+from . import BENCH_BASELINE, BENCH_REPORT, BENCH_ROWS, BENCH_THRESHOLD
+from .datagen import BENCH_PASSWORD, generate
+from .report import build_report, compare, read_report, summarize, write_report
+
+
+class LoadBenchmark(TestCase):
+    """Test de charge en processus : liste, détail, création et connexion, requête par requête.
+
+    Les requêtes passent par toute la pile Django (middlewares, vues,
+    sérialiseurs, rendu) sans serveur HTTP ; chacune est jouée seule, le débit
+    est donc l'inverse de la latence moyenne d'un client. La charge concurrente
+    se mesure avec test/benchmark/http_load.py contre un serveur lancé.
+    """
+    requests = 300
+    # Chaque connexion hache le mot de passe : quelques-unes suffisent
+    login_requests = 20
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = generate(webtoons=BENCH_ROWS, users=max(1, BENCH_ROWS // 100))[0]
+        cls.ids = list(Webtoon.objects.values_list("id", flat=True)[:cls.requests])
+
+    def run_scenario(self, name, send, count=None, cached=False):
+        count = count or self.requests
+        timings = []
+        for i in range(count):
+            if not cached:
+                webtoon_cache.bump()  # mesure la base, pas le cache
+            start = time.perf_counter()
+            response = send(i)
+            timings.append(time.perf_counter() - start)
+            self.assertLess(response.status_code, 400, f"{name} : {response.status_code} {response.content[:200]}")
+        return summarize(timings)
+
+    def test_load(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+        anonymous = APIClient()
+
+        scenarios = {
+            "list": self.run_scenario("list", lambda i: client.get("/api/webtoons/", {"page_size": 20})),
+            "list_cached": self.run_scenario(
+                "list_cached", lambda i: client.get("/api/webtoons/", {"page_size": 20}), cached=True
+            ),
+            "retrieve": self.run_scenario(
+                "retrieve", lambda i: client.get(f"/api/webtoons/{self.ids[i % len(self.ids)]}/")
+            ),
+            "create": self.run_scenario("create", lambda i: client.post("/api/webtoons/", {
+                "title": f"Load webtoon {i}", "authors": "Author", "status": "Ongoing", "genres": ["Action"],
+            }, format="json")),
+            "login": self.run_scenario("login", lambda i: anonymous.post("/login/", {
+                "email": self.user.email, "password": BENCH_PASSWORD,
+            }), count=self.login_requests),
+        }
+        report = build_report(scenarios, vendor=connection.vendor, rows=BENCH_ROWS)
+        if BENCH_REPORT:
+            write_report(report, BENCH_REPORT)
+
+        print(f"\n[load] {connection.vendor}, {BENCH_ROWS} webtoons, requêtes une à une")
+        for name, result in scenarios.items():
+            print(f"  {name:<12} {result['rps']:>8.1f} req/s  p50 {result['p50_ms']:.2f} ms  "
+                  f"p95 {result['p95_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms")
+        if BENCH_REPORT:
+            print(f"  rapport : {BENCH_REPORT}")
+
+        if BENCH_BASELINE:
+            regressions = compare(report, read_report(BENCH_BASELINE), BENCH_THRESHOLD)
+            self.assertFalse(regressions, f"dégradations au-delà de {BENCH_THRESHOLD:.0%} par rapport à "
+                             f"{BENCH_BASELINE} :\n  " + "\n  ".join(regressions))
@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from api.hashers import get_pool
+from api.models import User
+from backend.settings import password_hashers
+
+
+class LoginBenchmark(TestCase):
+    """Connexions par seconde et par cœur sur /login/, pour chaque algorithme aux coûts réglés.
+
+    Une connexion hache une fois le mot de passe : le coût de l'algorithme
+    fixe le débit par cœur. La deuxième mesure hache en parallèle sur
+    ``PASSWORD_HASH_WORKERS`` = nombre de cœurs, pour vérifier que le pool
+    passe à l'échelle (le hachage relâche le GIL).
+    """
+    logins = 20
+
+    def measure_logins(self, client):
+        start = time.perf_counter()
+        for _ in range(self.logins):
+            response = client.post("/login/", {"email": "bench@test.com", "password": "bench-password"})
+            self.assertEqual(response.status_code, 200)
+        return self.logins / (time.perf_counter() - start)
+
+    def measure_pool(self, encoded, workers):
+        hasher = get_hasher(encoded.split("$", 1)[0])
+        per_thread = max(1, self.logins // workers)
+
+        def verify():
+            for _ in range(per_thread):
+                hasher.verify("bench-password", encoded)
+
+        with override_settings(PASSWORD_HASH_WORKERS=workers, PASSWORD_HASH_QUEUE=workers):
+            get_pool()
+            threads = [threading.Thread(target=verify) for _ in range(workers)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            return per_thread * workers / (time.perf_counter() - start)
+
+    def test_logins_per_core(self):
+        strategies = ["scrypt", "pbkdf2"]
+        if importlib.util.find_spec("argon2"):
+            strategies.insert(0, "argon2")
+        cores = os.cpu_count() or 1
+        costs = {
+            "argon2": "m={memory_cost} KiB t={time_cost} p={parallelism}".format(**settings.PASSWORD_ARGON2),
+            "scrypt": "N={work_factor} r={block_size} p={parallelism}".format(**settings.PASSWORD_SCRYPT),
+            "pbkdf2": f"{settings.PASSWORD_PBKDF2_ITERATIONS} itérations",
+        }
+
+        print(f"\n[login] {self.logins} connexions par algorithme, {cores} cœur(s)")
+        for strategy in strategies:
+            with override_settings(PASSWORD_HASHERS=password_hashers({"PASSWORD_HASHER": strategy})):
+                user = User.objects.create_user(email="bench@test.com", username="bench", password="bench-password")
+                rate = self.measure_logins(APIClient())
+                pooled = self.measure_pool(make_password("bench-password"), cores)
+                user.delete()
+            print(f"  {strategy:<7} {costs[strategy]:<28} {rate:>6.1f} connexions/s/cœur, "
+                  f"pool de {cores} : {pooled:.1f} hachages/s")
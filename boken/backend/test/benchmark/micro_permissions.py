@@ -0,0 +1,60 @@
+"""Micro-benchmarks des permissions et de l'authentification JWT, sous pytest-benchmark"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("pytest_django")
+
+from rest_framework.permissions import IsAdminUser, IsAuthenticated  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+from api.authentication import CachedJWTAuthentication, UserSnapshot  # noqa: E402
+from api.models import Release, User, Webtoon  # noqa: E402
+from api.models.base_model import uuid7  # noqa: E402
+from api.permissions import IsCreatorOrAdmin, IsSelfOrAdmin, IsWebtoonCreatorOrAdmin  # noqa: E402
+
+factory = APIRequestFactory()
+
+
+@pytest.fixture
+def request_as():
+    """Requête DRF authentifiée par un `UserSnapshot`, comme après CachedJWTAuthentication"""
+    def build(role="user"):
+        request = Request(factory.get("/api/webtoons/"))
+        request.user = UserSnapshot(id=uuid7(), role=role, is_staff=role == "admin", is_active=True)
+        return request
+    return build
+
+
+@pytest.mark.parametrize("permission", [IsCreatorOrAdmin, IsSelfOrAdmin], ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("role", ["user", "admin"])
+def test_object_permission(benchmark, request_as, permission, role):
+    """Permission objet d'un utilisateur qui n'est pas le créateur, ou d'un admin"""
+    request = request_as(role)
+    webtoon = Webtoon(id=uuid7(), add_by_id=uuid7())
+    assert benchmark(permission().has_object_permission, request, None, webtoon) == (role == "admin")
+
+
+def test_webtoon_creator_permission(benchmark, request_as):
+    """Permission sur une version, qui remonte au créateur du webtoon"""
+    request = request_as()
+    release = Release(webtoon=Webtoon(id=uuid7(), add_by_id=request.user.id))
+    assert benchmark(IsWebtoonCreatorOrAdmin().has_object_permission, request, None, release)
+
+
+@pytest.mark.parametrize("permission", [IsAuthenticated, IsAdminUser], ids=lambda cls: cls.__name__)
+def test_view_permission(benchmark, request_as, permission):
+    """Permissions de vue de DRF sur un `UserSnapshot`"""
+    request = request_as()
+    assert benchmark(permission().has_permission, request, None) == (permission is IsAuthenticated)
+
+
+def test_cached_jwt_authentication(benchmark, db):
+    """Authentification d'un JWT dont l'utilisateur est en cache (le cas courant)"""
+    user = User.objects.create_user(email="bench@example.com", username="bench", password="bench")
+    token = RefreshToken.for_user(user).access_token
+    request = factory.get("/api/webtoons/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    authenticator = CachedJWTAuthentication()
+    authenticator.authenticate(request)
+    authenticated, _ = benchmark(authenticator.authenticate, request)
+    assert authenticated.pk == user.pk
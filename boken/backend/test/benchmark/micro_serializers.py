@@ -0,0 +1,61 @@
+"""Micro-benchmarks des sérialiseurs, sous pytest-benchmark (voir test/benchmark/__init__.py)"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("pytest_django")
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from api.models import Genre, User, Webtoon  # noqa: E402
+from api.renderers import FastJSONRenderer  # noqa: E402
+from api.rows import RowSerializer  # noqa: E402
+from api.serializers import UserSerializer, WebtoonDetailSerializer, WebtoonSerializer  # noqa: E402
+from .datagen import generate  # noqa: E402
+
+PAGE = 100
+
+
+@pytest.fixture
+def webtoons(db):
+    generate(webtoons=PAGE, users=10)
+    return list(Webtoon.objects.select_related("add_by").prefetch_related("genres").order_by("-update_at", "-id"))
+
+
+def test_webtoon_serializer_page(benchmark, webtoons):
+    """Une page de liste par le sérialiseur DRF"""
+    data = benchmark(lambda: WebtoonSerializer(webtoons, many=True).data)
+    assert len(data) == PAGE
+
+
+def test_webtoon_row_serializer_page(benchmark, webtoons):
+    """La même page par le chemin `.values()` des listes (api/rows.py)"""
+    row_serializer = RowSerializer(WebtoonSerializer())
+    rows = list(row_serializer.rows(Webtoon.objects.order_by("-update_at", "-id")))
+    data = benchmark(row_serializer.serialize, rows)
+    assert len(data) == PAGE
+
+
+def test_webtoon_page_render(benchmark, webtoons):
+    """Rendu JSON d'une page : JSONRenderer de DRF comparé à orjson"""
+    data = WebtoonSerializer(webtoons, many=True).data
+    assert benchmark(FastJSONRenderer().render, data) == JSONRenderer().render(data)
+
+
+def test_webtoon_detail_serializer(benchmark, webtoons):
+    """Un détail de webtoon, versions comprises"""
+    webtoon = Webtoon.objects.prefetch_related("genres", "releases").select_related("add_by").get(pk=webtoons[0].pk)
+    data = benchmark(lambda: WebtoonDetailSerializer(webtoon).data)
+    assert data["id"] == str(webtoon.pk)
+
+
+def test_webtoon_serializer_validation(benchmark, webtoons):
+    """Validation d'une création : unicité du titre et genres compris"""
+    payload = {"title": "New webtoon", "authors": "Author", "status": "Ongoing",
+               "genres": list(Genre.objects.values_list("name", flat=True)[:2])}
+    assert benchmark(lambda: WebtoonSerializer(data=payload).is_valid())
+
+
+def test_user_serializer_page(benchmark, webtoons):
+    """Une page d'utilisateurs"""
+    users = list(User.objects.all())
+    data = benchmark(lambda: UserSerializer(users, many=True).data)
+    assert len(data) == len(users)
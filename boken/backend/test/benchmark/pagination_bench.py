@@ -0,0 +1,71 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from api.models.webtoon import Webtoon
+from api.pagination import KeysetCursorPagination, encode_cursor
+from . import BENCH_ROWS
+
+
+def median_time(fn, repeat=15):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+class PaginationBenchmark(TestCase):
+    """Compare le coût de la première et de la dernière page : keyset vs offset"""
+    page_size = 20
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        Webtoon.objects.bulk_create(
+            (
+                Webtoon(
+                    title=f"Bench {i}",
+                    authors="Author",
+                    status="Ongoing",
+                    update_at=now - timedelta(seconds=i),
+                )
+                for i in range(BENCH_ROWS)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def keyset_page(self, position):
+        query = f"?cursor={encode_cursor(position)}" if position else ""
+        request = APIRequestFactory().get(f"/api/webtoons/{query}")
+        paginator = KeysetCursorPagination()
+        return paginator.paginate_queryset(Webtoon.objects.all(), Request(request))
+
+    def offset_page(self, offset):
+        return list(Webtoon.objects.order_by("-update_at", "-id")[offset:offset + self.page_size])
+
+    def test_deep_page_cost(self):
+        deep_offset = BENCH_ROWS - self.page_size
+        deep_row = Webtoon.objects.order_by("-update_at", "-id").values("update_at", "id")[deep_offset - 1]
+        deep_position = (deep_row["update_at"], deep_row["id"])
+
+        keyset_first = median_time(lambda: self.keyset_page(None))
+        keyset_deep = median_time(lambda: self.keyset_page(deep_position))
+        offset_first = median_time(lambda: self.offset_page(0))
+        offset_deep = median_time(lambda: self.offset_page(deep_offset))
+
+        print(f"\n[pagination] {BENCH_ROWS} lignes, page n°{deep_offset // self.page_size + 1}")
+        print(f"  keyset  première page {keyset_first * 1000:.2f} ms, page profonde {keyset_deep * 1000:.2f} ms")
+        print(f"  offset  première page {offset_first * 1000:.2f} ms, page profonde {offset_deep * 1000:.2f} ms")
+
+        self.assertEqual(len(self.keyset_page(deep_position)), self.page_size)
+        # Temps constant : la page profonde ne doit pas coûter plus que quelques premières pages
+        self.assertLess(keyset_deep, keyset_first * 3 + 0.002)
@@ -0,0 +1,58 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import User
+from api.models.webtoon import Webtoon
+from . import BENCH_ROWS
+
+
+class ReplicaRoutingBenchmark(TestCase):
+    """Débit des lectures avec et sans routage vers les réplicas.
+
+    Dans un seul processus de test, le « réplica » est la base principale
+    (``REPLICA_DATABASES=["default"]``) : la mesure donne le coût du
+    middleware (lecture du JWT, épinglage dans le cache), pas le gain. Le
+    gain vient de la charge répartie sur plusieurs serveurs ; il se mesure
+    avec test/benchmark/http_load.py contre un serveur lancé sans puis avec
+    ``DB_REPLICA_HOSTS``, PostgreSQL principal et réplica en streaming.
+    """
+    requests = 500
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="bench@test.com", username="bench", password="1234")
+        Webtoon.objects.bulk_create(
+            (Webtoon(title=f"Webtoon {i}", authors="Author", status="Ongoing") for i in range(min(BENCH_ROWS, 1000))),
+            batch_size=5000,
+        )
+
+    def measure(self, client):
+        start = time.perf_counter()
+        timings = []
+        for _ in range(self.requests):
+            webtoon_cache.bump()  # mesure la base, pas le cache
+            begin = time.perf_counter()
+            response = client.get("/api/webtoons/", {"limit": 20})
+            timings.append(time.perf_counter() - begin)
+            self.assertEqual(response.status_code, 200)
+        return self.requests / (time.perf_counter() - start), statistics.median(timings) * 1000
+
+    def test_routing_overhead(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+
+        with override_settings(REPLICA_DATABASES=[]):
+            primary_rate, primary_p50 = self.measure(client)
+        with override_settings(REPLICA_DATABASES=["default"]):
+            routed_rate, routed_p50 = self.measure(client)
+
+        print(f"\n[replica] {connection.vendor}, {self.requests} GET authentifiés, épinglage sur `{settings.REPLICA_PIN_CACHE_ALIAS}`")
+        print(f"  sans routage : {primary_rate:.0f} req/s, p50 {primary_p50:.2f} ms")
+        print(f"  avec routage : {routed_rate:.0f} req/s, p50 {routed_p50:.2f} ms")
+        print(f"  surcoût par requête {routed_p50 - primary_p50:+.3f} ms")
@@ -0,0 +1,86 @@
+"""Rapport JSON du test de charge et comparaison avec une référence.
+
+Un rapport a la forme ``{"meta": {...}, "scenarios": {nom: mesures}}`` ;
+``meta`` décrit la mesure (base, taille du jeu de données, versions), les
+mesures sont le débit (``rps``) et les latences (``p50_ms``, ``p95_ms``,
+``p99_ms``). ``compare()`` liste ce qui s'est dégradé de plus que le seuil
+par rapport à la référence.
+"""
+import datetime
+import json
+import platform
+import statistics
+
+# p99 reste dans le rapport, mais sur quelques centaines de requêtes il est trop bruité pour échouer dessus
+COMPARED_LATENCIES = ("p50_ms", "p95_ms")
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize(timings):
+    """Mesures d'un scénario à partir des durées de ses requêtes, en secondes, jouées une à une"""
+    ordered = sorted(timings)
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / sum(ordered), 1),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+    }
+
+
+def build_report(scenarios, **meta):
+    import django
+
+    return {
+        "meta": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            **meta,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def read_report(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(report, baseline, threshold, keys=("vendor", "rows")):
+    """Dégradations de `report` par rapport à `baseline` au-delà de `threshold` (0.2 = 20 %).
+
+    Une latence régresse quand elle dépasse la référence de plus de
+    `threshold`, le débit quand la référence le dépasse d'autant. Deux
+    rapports dont les `keys` de ``meta`` diffèrent ne sont pas comparables.
+    """
+    mismatched = [
+        f"{key} : {baseline['meta'].get(key)!r} dans la référence, {report['meta'].get(key)!r} ici"
+        for key in keys if baseline["meta"].get(key) != report["meta"].get(key)
+    ]
+    if mismatched:
+        return ["référence non comparable, " + ", ".join(mismatched)]
+
+    regressions = []
+    for name, current in report["scenarios"].items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            continue
+        for metric in COMPARED_LATENCIES:
+            if reference[metric] and current[metric] > reference[metric] * (1 + threshold):
+                regressions.append(f"{name} {metric} : {reference[metric]} -> {current[metric]} "
+                                   f"(+{current[metric] / reference[metric] - 1:.0%})")
+        if reference["rps"] > current["rps"] * (1 + threshold):
+            regressions.append(f"{name} rps : {reference['rps']} -> {current['rps']} "
+                               f"({current['rps'] / reference['rps'] - 1:.0%})")
+    return regressions
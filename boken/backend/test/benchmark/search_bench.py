@@ -0,0 +1,57 @@
+import random
+import statistics
+import time
+
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+from api.models.webtoon import Webtoon
+from . import BENCH_ROWS
+
+WORDS = [
+    "solo", "leveling", "tower", "god", "reader", "omniscient", "return", "hero", "mage",
+    "sword", "academy", "villain", "princess", "dragon", "hunter", "regressor", "king",
+    "shadow", "moon", "blade", "emperor", "demon", "knight", "chronicle", "legend",
+]
+
+
+class SearchBenchmark(TestCase):
+    """Latence p95 de /api/webtoons/search/ (objectif : < 50 ms sur PostgreSQL)"""
+    requests = 200
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(42)
+        Webtoon.objects.bulk_create(
+            (
+                Webtoon(
+                    title=f"{' '.join(rng.sample(WORDS, 3))} {i}",
+                    authors=f"{rng.choice(WORDS)} {rng.choice(WORDS)}",
+                    status="Ongoing",
+                )
+                for i in range(BENCH_ROWS)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_search_p95(self):
+        rng = random.Random(7)
+        client = APIClient()
+        timings = []
+        for _ in range(self.requests):
+            query = " ".join(rng.sample(WORDS, 2))
+            # Une faute de frappe sur deux requêtes pour solliciter pg_trgm
+            if rng.random() < 0.5:
+                query = query[:-1]
+            start = time.perf_counter()
+            response = client.get("/api/webtoons/search/", {"q": query})
+            timings.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+
+        p95 = statistics.quantiles(timings, n=20)[-1] * 1000
+        print(f"\n[search] {connection.vendor}, {BENCH_ROWS} lignes, {self.requests} requêtes")
+        print(f"  p50 {statistics.median(timings) * 1000:.2f} ms, p95 {p95:.2f} ms")
+        if connection.vendor == "postgresql":
+            self.assertLess(p95, 50)
@@ -0,0 +1,63 @@
+import time
+import uuid
+
+from django.db import connection
+from django.test import TestCase
+from api.models.base_model import uuid7
+from . import BENCH_ROWS
+
+BATCH_SIZE = 10000
+
+
+class UuidKeyBenchmark(TestCase):
+    """Débit d'insertion et taille de l'index de clé primaire : UUIDv4 aléatoires contre UUIDv7.
+
+    Chaque variante remplit sa propre table (clé UUID + une colonne de
+    charge). Avec des clés v4 chaque insertion tombe sur une page au hasard
+    de l'index : pages coupées à moitié, index plus gros et cache moins
+    efficace. L'écart se creuse quand l'index dépasse la mémoire, par
+    exemple sur PostgreSQL avec ``BOKEN_BENCH_ROWS=10000000``.
+    """
+
+    def create_table(self, name):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"CREATE TABLE {name} (id uuid PRIMARY KEY, payload integer NOT NULL)")
+            else:
+                # Même stockage que UUIDField sur SQLite : char(32)
+                cursor.execute(f"CREATE TABLE {name} (id char(32) PRIMARY KEY, payload integer NOT NULL)")
+
+    def index_size(self, name):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SELECT pg_relation_size(%s)", [f"{name}_pkey"])
+            else:
+                cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s", [f"sqlite_autoindex_{name}_1"])
+            return cursor.fetchone()[0]
+
+    def fill(self, name, make_key):
+        """Insère BENCH_ROWS lignes par lots, renvoie le débit en lignes/s"""
+        self.create_table(name)
+        adapt = (lambda key: key) if connection.vendor == "postgresql" else (lambda key: key.hex)
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            for offset in range(0, BENCH_ROWS, BATCH_SIZE):
+                rows = [(adapt(make_key()), i) for i in range(offset, min(offset + BATCH_SIZE, BENCH_ROWS))]
+                cursor.executemany(f"INSERT INTO {name} (id, payload) VALUES (%s, %s)", rows)
+        return BENCH_ROWS / (time.perf_counter() - start)
+
+    def test_insert_locality(self):
+        v4_rate = self.fill("bench_uuid_v4", uuid.uuid4)
+        v7_rate = self.fill("bench_uuid_v7", uuid7)
+        v4_size = self.index_size("bench_uuid_v4")
+        v7_size = self.index_size("bench_uuid_v7")
+
+        print(f"\n[uuid] {connection.vendor}, {BENCH_ROWS} lignes")
+        print(f"  v4 : {v4_rate:.0f} lignes/s, index {v4_size / 1024:.0f} Kio")
+        print(f"  v7 : {v7_rate:.0f} lignes/s, index {v7_size / 1024:.0f} Kio")
+        print(f"  débit x{v7_rate / v4_rate:.2f}, index {v7_size / v4_size:.0%} de la taille v4")
+
+        if connection.vendor == "postgresql":
+            # Les insertions en fin d'index remplissent les pages au lieu de les couper en deux
+            # (SQLite coupe aussi la page la plus à droite en deux : pas d'écart de taille)
+            self.assertLess(v7_size, v4_size)
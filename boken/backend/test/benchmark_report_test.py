@@ -0,0 +1,41 @@
+from django.test import SimpleTestCase
+from test.benchmark.report import build_report, compare, summarize
+
+
+def scenario(rps, p50, p95, p99=None):
+    return {"requests": 100, "rps": rps, "mean_ms": p50, "p50_ms": p50, "p95_ms": p95, "p99_ms": p99 or p95}
+
+
+class BenchmarkReportTests(SimpleTestCase):
+    def setUp(self):
+        self.baseline = build_report({"list": scenario(100, 10, 20)}, vendor="postgresql", rows=1000)
+
+    # === TESTS MESURES ===
+    def test_summarize(self):
+        """✅ Débit et percentiles viennent des durées des requêtes"""
+        result = summarize([0.001] * 90 + [0.010] * 10)
+        self.assertEqual(result["requests"], 100)
+        self.assertEqual(result["rps"], 526.3)
+        self.assertEqual((result["p50_ms"], result["p95_ms"], result["p99_ms"]), (1.0, 10.0, 10.0))
+
+    # === TESTS COMPARAISON ===
+    def test_within_threshold(self):
+        """✅ Une variation sous le seuil n'est pas une régression"""
+        report = build_report({"list": scenario(90, 11, 23), "login": scenario(3, 300, 320)},
+                              vendor="postgresql", rows=1000)
+        self.assertEqual(compare(report, self.baseline, 0.2), [])
+
+    def test_regressions(self):
+        """🚫 Latence ou débit dégradés au-delà du seuil"""
+        report = build_report({"list": scenario(50, 10, 30, p99=500)}, vendor="postgresql", rows=1000)
+        regressions = compare(report, self.baseline, 0.2)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("list p95_ms : 20 -> 30"))
+        self.assertTrue(regressions[1].startswith("list rps : 100 -> 50"))
+
+    def test_incomparable_baseline(self):
+        """🚫 Une référence mesurée sur une autre base ou un autre volume n'est pas comparable"""
+        report = build_report({"list": scenario(100, 10, 20)}, vendor="sqlite", rows=1000)
+        regressions = compare(report, self.baseline, 0.2)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("vendor", regressions[0])
@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models.webtoon import Webtoon
+from .utils import QueryBudgetMixin
+
+User = get_user_model()
+
+
+class WebtoonCacheTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        webtoon_cache.backend.clear()
+        webtoon_cache.reset_stats()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+
+        self.webtoon = Webtoon.objects.create(
+            title="User Webtoon", authors="User Author", status="Ongoing", add_by=self.user
+        )
+        self.detail_url = f"{self.webtoons_url}{self.webtoon.id}/"
+
+    def test_retrieve_is_served_from_cache(self):
+        """✅ Le deuxième GET d'un webtoon ne touche pas la base"""
+        first = self.client.get(self.detail_url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.detail_url)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(webtoon_cache.stats()["hits"], 1)
+        self.assertEqual(webtoon_cache.stats()["misses"], 1)
+
+    def test_list_is_served_from_cache(self):
+        """✅ Le deuxième GET de la liste ne touche pas la base"""
+        self.client.get(self.webtoons_url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.webtoons_url)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_update_invalidates(self):
+        """✅ Une modification invalide le cache"""
+        self.client.get(self.detail_url)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        self.client.patch(self.detail_url, {"title": "Renamed"}, format="json")
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["title"], "Renamed")
+
+    def test_create_invalidates_list(self):
+        """✅ Une création invalide la liste"""
+        self.client.get(self.webtoons_url)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        data = {"title": "New Webtoon", "authors": "Author", "status": "Ongoing"}
+        self.client.post(self.webtoons_url, data, format="json")
+        response = self.client.get(self.webtoons_url)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_set_to_public_invalidates(self):
+        """✅ set_to_public invalide le cache"""
+        self.client.get(self.detail_url)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        self.client.patch(f"{self.detail_url}set_to_public/", {"is_public": True}, format="json")
+        response = self.client.get(self.detail_url)
+        self.assertTrue(response.data["is_public"])
+
+    def test_destroy_invalidates(self):
+        """✅ Une suppression invalide le cache"""
+        self.client.get(self.detail_url)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        self.client.delete(self.detail_url)
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_creator_update_invalidates(self):
+        """✅ Renommer le créateur invalide les webtoons qui l'embarquent"""
+        self.client.get(self.detail_url)
+        self.user.username = "renamed_user"
+        self.user.save()
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["add_by"]["username"], "renamed_user")
+
+    def test_user_signup_and_rehash_keep_cache(self):
+        """✅ Inscription et rehachage du mot de passe ne vident pas le cache"""
+        version = webtoon_cache.get_version()
+        User.objects.create_user(email="other@test.com", username="other", password="1234")
+        self.user.set_password("5678")
+        self.user.save(update_fields=["password"])
+        self.assertEqual(webtoon_cache.get_version(), version)
+
+    def test_errors_are_not_cached(self):
+        """✅ Les 404 ne sont pas mis en cache"""
+        url = f"{self.webtoons_url}00000000-0000-0000-0000-000000000000/"
+        self.client.get(url)
+        self.client.get(url)
+        self.assertEqual(webtoon_cache.stats()["hits"], 0)
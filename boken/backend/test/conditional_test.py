@@ -0,0 +1,160 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.users_url = "/api/users/"
+        webtoon_cache.backend.clear()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+
+        self.webtoon = Webtoon.objects.create(
+            title="User Webtoon", authors="User Author", status="Ongoing", add_by=self.user
+        )
+        self.detail_url = f"{self.webtoons_url}{self.webtoon.id}/"
+
+    # === TESTS BaseModel ===
+    def test_save_refreshes_update_at(self):
+        """✅ save() met à jour update_at"""
+        before = self.webtoon.update_at
+        self.webtoon.title = "Renamed"
+        self.webtoon.save()
+        self.assertGreater(self.webtoon.update_at, before)
+
+    def test_save_update_fields_refreshes_update_at(self):
+        """✅ save(update_fields=...) met aussi à jour update_at"""
+        old = timezone.now() - timedelta(days=1)
+        Webtoon.objects.filter(pk=self.webtoon.pk).update(update_at=old)
+        self.webtoon.refresh_from_db()
+        self.webtoon.rating = 4.0
+        self.webtoon.save(update_fields=["rating"])
+        self.webtoon.refresh_from_db()
+        self.assertGreater(self.webtoon.update_at, old)
+
+    def test_update_method_sets_update_at(self):
+        """✅ BaseModel.update() met à jour les attributs et update_at"""
+        before = self.webtoon.update_at
+        self.webtoon.update({"title": "Updated", "unknown": "ignored"})
+        self.assertEqual(self.webtoon.title, "Updated")
+        self.assertGreater(self.webtoon.update_at, before)
+
+    # === TESTS webtoons ===
+    def test_retrieve_sends_validators(self):
+        """✅ Le détail d'un webtoon porte ETag et Last-Modified"""
+        response = self.client.get(self.detail_url)
+        self.assertIn("ETag", response.headers)
+        self.assertIn("Last-Modified", response.headers)
+
+    def test_retrieve_if_none_match(self):
+        """✅ If-None-Match identique → 304, avec ou sans cache"""
+        etag = self.client.get(self.detail_url).headers["ETag"]
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["ETag"], etag)
+
+        webtoon_cache.backend.clear()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_if_modified_since(self):
+        """✅ If-Modified-Since postérieur → 304, antérieur → 200"""
+        later = http_date((timezone.now() + timedelta(minutes=1)).timestamp())
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=later)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        earlier = http_date((timezone.now() - timedelta(days=1)).timestamp())
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=earlier)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_etag_changes_on_update(self):
+        """✅ Une modification change l'ETag"""
+        etag = self.client.get(self.detail_url).headers["ETag"]
+        self.webtoon.title = "Renamed"
+        self.webtoon.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_retrieve_etag_changes_with_creator(self):
+        """✅ Renommer le créateur change l'ETag du webtoon"""
+        etag = self.client.get(self.detail_url).headers["ETag"]
+        self.user.username = "renamed_user"
+        self.user.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_if_none_match(self):
+        """✅ La liste répond 304 tant que rien ne change"""
+        etag = self.client.get(self.webtoons_url).headers["ETag"]
+        response = self.client.get(self.webtoons_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_etag_changes_on_delete(self):
+        """✅ Une suppression change l'ETag de la liste"""
+        Webtoon.objects.create(title="Other", authors="A", status="Ongoing")
+        etag = self.client.get(self.webtoons_url).headers["ETag"]
+        self.webtoon.delete()
+        response = self.client.get(self.webtoons_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_from_page_rows(self):
+        """✅ L'ETag d'une page vient de ses lignes : aucune agrégation sur la table, une page voisine n'y change rien"""
+        for i in range(3):
+            Webtoon.objects.create(title=f"Other {i}", authors="A", status="Ongoing")
+        webtoon_cache.backend.clear()
+        with CaptureQueriesContext(connection) as context:
+            etag = self.client.get(self.webtoons_url, {"page_size": 2}).headers["ETag"]
+        self.assertFalse([query for query in context.captured_queries if "COUNT(" in query["sql"] or "MAX(" in query["sql"]])
+
+        # self.webtoon, le plus ancien, est sur la deuxième page
+        Webtoon.objects.filter(pk=self.webtoon.pk).delete()
+        webtoon_cache.backend.clear()
+        response = self.client.get(self.webtoons_url, {"page_size": 2}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    # === TESTS users ===
+    def test_user_retrieve_if_none_match(self):
+        """✅ Le détail d'un utilisateur répond 304 sans sérialiser"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        url = f"{self.users_url}{self.user.id}/"
+        etag = self.client.get(url).headers["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_user_retrieve_checks_permissions_first(self):
+        """🚫 Un ETag valide ne contourne pas les permissions"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        url = f"{self.users_url}{self.admin.id}/"
+        etag = self.client.get(url).headers["ETag"]
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_list_if_none_match(self):
+        """✅ La liste des utilisateurs répond 304 tant que rien ne change"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        etag = self.client.get(self.users_url).headers["ETag"]
+        response = self.client.get(self.users_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
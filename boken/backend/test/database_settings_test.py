@@ -0,0 +1,34 @@
+from django.test import SimpleTestCase
+from backend.settings import database_config
+
+
+class DatabaseSettingsTests(SimpleTestCase):
+    # === TESTS CONFIGURATION ===
+    def test_defaults(self):
+        """✅ Sans variable d'environnement : base locale, connexions persistantes vérifiées"""
+        config = database_config({})
+        self.assertEqual((config["NAME"], config["HOST"], config["PORT"]), ("boken", "127.0.0.1", "5432"))
+        self.assertEqual(config["CONN_MAX_AGE"], 60)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+        self.assertNotIn("pool", config["OPTIONS"])
+
+    def test_environment(self):
+        """✅ Les paramètres de connexion viennent de l'environnement"""
+        config = database_config({
+            "DB_NAME": "prod", "DB_HOST": "db", "DB_CONN_MAX_AGE": "none", "DB_CONN_HEALTH_CHECKS": "off",
+        })
+        self.assertEqual((config["NAME"], config["HOST"]), ("prod", "db"))
+        self.assertIsNone(config["CONN_MAX_AGE"])
+        self.assertFalse(config["CONN_HEALTH_CHECKS"])
+
+    def test_pool(self):
+        """✅ `DB_POOL=1` active le pool psycopg et coupe les connexions persistantes"""
+        config = database_config({"DB_POOL": "1", "DB_POOL_MAX_SIZE": "32", "DB_POOL_TIMEOUT": "2.5"})
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        pool = config["OPTIONS"]["pool"]
+        self.assertEqual((pool["min_size"], pool["max_size"], pool["timeout"]), (2, 32, 2.5))
+
+    def test_invalid_number(self):
+        """🚫 Une valeur non numérique est refusée au démarrage"""
+        with self.assertRaises(ValueError):
+            database_config({"DB_CONN_MAX_AGE": "forever"})
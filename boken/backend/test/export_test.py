@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class WebtoonExportTests(APITestCase):
+    def setUp(self):
+        self.export_url = "/api/webtoons/export/"
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+
+        self.webtoon = Webtoon.objects.create(
+            title="Solo Leveling", authors="Chugong", status="Finished", rating=4.5,
+            release_date="2018-03-04", is_public=True, add_by=self.user,
+        )
+        Webtoon.objects.create(title="Orphan, \"quoted\"", authors="Nobody", status="Ongoing")
+
+    def content(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        """✅ Export NDJSON avec le nom du créateur"""
+        response = self.client.get(self.export_url)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = {row["title"]: row for row in map(json.loads, self.content(response).splitlines())}
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows["Solo Leveling"], {
+            "id": str(self.webtoon.id),
+            "title": "Solo Leveling",
+            "authors": "Chugong",
+            "status": "Finished",
+            "is_public": True,
+            "rating": 4.5,
+            "rating_count": 0,
+            "release_date": "2018-03-04",
+            "waiting_review": False,
+            "add_by": "user",
+            "create_at": self.webtoon.create_at.isoformat(),
+            "update_at": self.webtoon.update_at.isoformat(),
+        })
+        self.assertIsNone(rows['Orphan, "quoted"']["add_by"])
+
+    def test_export_csv(self):
+        """✅ Export CSV avec une ligne d'en-tête"""
+        response = self.client.get(self.export_url, {"output": "csv"})
+        self.assertIn("attachment", response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+        self.assertEqual(sorted(row["title"] for row in rows), ['Orphan, "quoted"', "Solo Leveling"])
+        self.assertEqual(next(row for row in rows if row["add_by"])["add_by"], "user")
+
+    def test_export_uses_filters(self):
+        """✅ L'export accepte les mêmes filtres que la liste"""
+        response = self.client.get(self.export_url, {"is_public": "true"})
+        lines = self.content(response).splitlines()
+        self.assertEqual([json.loads(line)["title"] for line in lines], ["Solo Leveling"])
+
+    def test_export_unknown_output(self):
+        """🚫 Un format inconnu donne 400"""
+        response = self.client.get(self.export_url, {"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_user_cannot_export(self):
+        """🚫 Un utilisateur simple ne peut pas exporter"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,157 @@
+import json
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.cache import feed_cache, webtoon_cache
+from api.feeds import FeedScheduler, refresh_feed
+from api.models import FeedSnapshot
+from api.models.webtoon import Webtoon
+from api.serializers import WebtoonSerializer
+
+
+class FeedTests(APITestCase):
+    def setUp(self):
+        self.latest_url = "/api/feeds/latest/"
+        self.top_rated_url = "/api/feeds/top_rated/"
+        webtoon_cache.backend.clear()
+
+        Webtoon.objects.bulk_create([
+            Webtoon(title="Average", authors="A", status="Ongoing", rating=3, rating_sum=6, rating_count=2),
+            Webtoon(title="Best", authors="A", status="Finished", rating=5, rating_sum=5, rating_count=1),
+            Webtoon(title="Unrated", authors="A", status="Ongoing"),
+        ])
+
+    def results(self, response):
+        return json.loads(response.content)["results"]
+
+    # === TESTS LECTURE ===
+    def test_latest_matches_serializer(self):
+        """✅ Le flux `latest` a la représentation de la liste, du plus récent au plus ancien"""
+        response = self.client.get(self.latest_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        expected = WebtoonSerializer(Webtoon.objects.order_by("-update_at", "-id"), many=True).data
+        self.assertEqual(self.results(response), json.loads(json.dumps(expected)))
+
+    def test_top_rated_order(self):
+        """✅ Le flux `top_rated` suit la moyenne des notes"""
+        response = self.client.get(self.top_rated_url)
+        self.assertEqual([row["title"] for row in self.results(response)], ["Best", "Average", "Unrated"])
+
+    def test_feed_is_a_snapshot(self):
+        """✅ Le flux ne change qu'au rafraîchissement"""
+        self.client.get(self.latest_url)
+        Webtoon.objects.create(title="Fresh", authors="A", status="Ongoing")
+        self.assertNotIn("Fresh", [row["title"] for row in self.results(self.client.get(self.latest_url))])
+        refresh_feed("latest")
+        self.assertEqual(self.results(self.client.get(self.latest_url))[0]["title"], "Fresh")
+
+    def test_cached_feed_costs_one_query(self):
+        """✅ Un flux en cache ne coûte que la lecture de son ETag"""
+        self.client.get(self.latest_url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.latest_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refresh_elsewhere_is_served(self):
+        """✅ Un rafraîchissement fait par un autre processus est servi sans attendre le cache"""
+        self.client.get(self.latest_url)
+        Webtoon.objects.create(title="Fresh", authors="A", status="Ongoing")
+        version = feed_cache.get_version()
+        refresh_feed("latest")
+        self.assertEqual(feed_cache.get_version(), version)
+        self.assertEqual(self.results(self.client.get(self.latest_url))[0]["title"], "Fresh")
+
+    def test_stale_snapshot_is_rendered_again(self):
+        """✅ Sans planificateur, un instantané plus vieux que FEED_MAX_AGE est rendu à nouveau"""
+        self.client.get(self.latest_url)
+        Webtoon.objects.create(title="Fresh", authors="A", status="Ongoing")
+        FeedSnapshot.objects.update(refreshed_at=timezone.now() - timedelta(seconds=settings.FEED_MAX_AGE + 1))
+        self.assertEqual(self.results(self.client.get(self.latest_url))[0]["title"], "Fresh")
+
+    def test_stale_snapshot_is_rendered_once(self):
+        """✅ Un seul rendu par instantané périmé : pendant ce rendu, les autres requêtes servent l'ancien corps"""
+        self.client.get(self.latest_url)
+        Webtoon.objects.create(title="Fresh", authors="A", status="Ongoing")
+        FeedSnapshot.objects.update(refreshed_at=timezone.now() - timedelta(seconds=settings.FEED_MAX_AGE + 1))
+        during = []
+
+        def refresh(name, size=None):
+            during.append(self.results(self.client.get(self.latest_url))[0]["title"])
+            return refresh_feed(name, size)
+
+        with mock.patch("api.feeds.refresh_feed", side_effect=refresh) as refreshed:
+            response = self.client.get(self.latest_url)
+        self.assertEqual(refreshed.call_count, 1)
+        self.assertEqual(len(during), 1)
+        self.assertNotEqual(during[0], "Fresh")
+        self.assertEqual(self.results(response)[0]["title"], "Fresh")
+
+    def test_feed_not_modified(self):
+        """✅ `If-None-Match` donne un 304"""
+        etag = self.client.get(self.latest_url)["ETag"]
+        response = self.client.get(self.latest_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unknown_feed(self):
+        """🚫 Un flux inconnu retourne 404"""
+        response = self.client.get("/api/feeds/popular/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    # === TESTS RAFRAÎCHISSEMENT ===
+    def test_unchanged_refresh_keeps_etag(self):
+        """✅ Un rafraîchissement sans changement garde l'ETag et le cache"""
+        first = refresh_feed("latest")
+        version = feed_cache.get_version()
+        second = refresh_feed("latest")
+        self.assertEqual(first.etag, second.etag)
+        self.assertEqual(feed_cache.get_version(), version)
+
+    def test_refresh_command(self):
+        """✅ La commande matérialise tous les flux"""
+        out = StringIO()
+        call_command("refresh_feeds", "--size", "2", stdout=out)
+        self.assertEqual(dict(FeedSnapshot.objects.values_list("name", "size")), {"latest": 2, "top_rated": 2})
+        self.assertIn("top_rated: 2 webtoons", out.getvalue())
+
+    def test_scheduler_refreshes_until_stopped(self):
+        """✅ Le planificateur rafraîchit à intervalle fixe jusqu'à `stop()`"""
+        refreshed = threading.Event()
+        calls = []
+
+        def refresh(names, size):
+            calls.append(names)
+            if len(calls) == 2:
+                refreshed.set()
+
+        with mock.patch("api.feeds.refresh_feeds", side_effect=refresh):
+            scheduler = FeedScheduler(0.01, ["latest"])
+            scheduler.start()
+            self.assertTrue(refreshed.wait(5))
+            scheduler.stop(timeout=5)
+        self.assertFalse(scheduler.is_alive())
+        self.assertEqual(calls[0], ["latest"])
+
+    def test_scheduler_survives_errors(self):
+        """✅ Une erreur de rafraîchissement n'arrête pas le planificateur"""
+        failed, refreshed = threading.Event(), threading.Event()
+
+        def refresh(names, size):
+            if not failed.is_set():
+                failed.set()
+                raise RuntimeError("base indisponible")
+            refreshed.set()
+
+        with mock.patch("api.feeds.refresh_feeds", side_effect=refresh), self.assertLogs("api.feeds", "ERROR"):
+            scheduler = FeedScheduler(0.01)
+            scheduler.start()
+            self.assertTrue(refreshed.wait(5))
+            scheduler.stop(timeout=5)
+        self.assertGreaterEqual(scheduler.runs, 2)
@@ -0,0 +1,118 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class SparseFieldsTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.users_url = "/api/users/"
+        webtoon_cache.backend.clear()
+
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+        self.webtoon = Webtoon.objects.create(
+            title="Solo Leveling", authors="Chugong", status="Finished", rating=4.5, add_by=self.admin
+        )
+        self.detail_url = f"{self.webtoons_url}{self.webtoon.id}/"
+
+    def list_sql(self, query):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"{self.webtoons_url}{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return queries.captured_queries[-1]["sql"]
+
+    # === TESTS DE FORME ===
+    def test_default_representation_is_unchanged(self):
+        """✅ Sans paramètre, la représentation complète (add_by imbriqué) est conservée"""
+        row = self.client.get(self.webtoons_url).data["results"][0]
+        self.assertIn("authors", row)
+        self.assertEqual(row["add_by"]["username"], "admin")
+
+    def test_fields_trims_list(self):
+        """✅ `fields` ne garde que les champs demandés"""
+        response = self.client.get(self.webtoons_url, {"fields": "id,title,rating,status,update_at"})
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"id", "title", "rating", "status", "update_at"})
+
+    def test_fields_without_ordering_fields_paginate(self):
+        """✅ La pagination fonctionne sans `update_at` ni `id` dans `fields`"""
+        Webtoon.objects.create(title="Tower of God", authors="SIU", status="Ongoing")
+        first = self.client.get(self.webtoons_url, {"fields": "title", "page_size": 1})
+        second = self.client.get(first.data["next"])
+        self.assertEqual(set(first.data["results"][0]), {"title"})
+        self.assertNotEqual(first.data["results"], second.data["results"])
+
+    def test_relation_collapses_to_id(self):
+        """✅ Sans `expand`, add_by est rendu par son id"""
+        response = self.client.get(self.webtoons_url, {"fields": "id,add_by"})
+        self.assertEqual(str(response.data["results"][0]["add_by"]), str(self.admin.id))
+
+    def test_expand_relation(self):
+        """✅ `expand=add_by` rend le créateur complet"""
+        response = self.client.get(self.webtoons_url, {"fields": "id,add_by", "expand": "add_by"})
+        self.assertEqual(response.data["results"][0]["add_by"]["email"], "admin@test.com")
+
+    def test_retrieve_fields_are_cached_separately(self):
+        """✅ Le détail mis en cache dépend de `fields` et `expand`"""
+        first = self.client.get(self.detail_url, {"fields": "id,title"})
+        second = self.client.get(self.detail_url, {"fields": "id,add_by", "expand": "add_by"})
+        self.assertEqual(set(first.data), {"id", "title"})
+        self.assertEqual(second.data["add_by"]["username"], "admin")
+        self.assertNotEqual(first["ETag"], second["ETag"])
+
+    def test_users_fields(self):
+        """✅ `fields` s'applique aussi aux utilisateurs"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.client.get(self.users_url, {"fields": "id,username"})
+        self.assertEqual(set(response.data["results"][0]), {"id", "username"})
+
+    def test_writes_ignore_fields(self):
+        """✅ Les écritures renvoient toujours la représentation complète"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.client.patch(f"{self.detail_url}?fields=id", {"rating": 3.0}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("title", response.data)
+
+    def test_unknown_field(self):
+        """🚫 Un champ inconnu retourne 400"""
+        response = self.client.get(self.webtoons_url, {"fields": "id,nope"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_write_only_field_is_unknown(self):
+        """🚫 Le mot de passe ne peut pas être demandé"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.client.get(self.users_url, {"fields": "id,password"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_expand(self):
+        """🚫 Une relation non extensible retourne 400"""
+        response = self.client.get(self.webtoons_url, {"expand": "title"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # === TESTS SQL ===
+    def test_sql_reads_only_requested_columns(self):
+        """✅ La requête ne lit que les colonnes demandées, sans jointure"""
+        sql = self.list_sql("?fields=id,title")
+        self.assertNotIn('"authors"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_sql_joins_expanded_relation(self):
+        """✅ La jointure sur le créateur n'est faite qu'avec `expand`"""
+        sql = self.list_sql("?fields=id,add_by&expand=add_by")
+        self.assertIn("JOIN", sql)
+
+    def test_retrieve_loads_no_extra_rows(self):
+        """✅ Le détail restreint tient en une requête"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, {"fields": "id,title"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
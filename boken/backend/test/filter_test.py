@@ -0,0 +1,107 @@
+from django.db import connection
+from rest_framework.test import APITestCase
+from rest_framework import status
+from api.filters import WebtoonFilter
+from api.models.webtoon import Webtoon
+
+
+class WebtoonFilterTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        Webtoon.objects.create(
+            title="Ongoing Top", authors="A", status="Ongoing", rating=4.8,
+            release_date="2021-03-01", is_public=True,
+        )
+        Webtoon.objects.create(
+            title="Ongoing Low", authors="A", status="Ongoing", rating=2.1,
+            release_date="2019-06-01", is_public=True,
+        )
+        Webtoon.objects.create(
+            title="Finished Mid", authors="A", status="Finished", rating=3.5,
+            release_date="2015-01-01", is_public=False, waiting_review=True,
+        )
+        Webtoon.objects.create(
+            title="Hiatus Top", authors="A", status="Hiatus", rating=4.5,
+            release_date="2022-09-01", is_public=True,
+        )
+
+    def titles(self, params):
+        response = self.client.get(self.webtoons_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(row["title"] for row in response.data["results"])
+
+    # === TESTS FILTRES ===
+    def test_filter_status_exact(self):
+        """✅ Filtre d'égalité sur le statut"""
+        self.assertEqual(self.titles({"status": "Ongoing"}), ["Ongoing Low", "Ongoing Top"])
+
+    def test_filter_status_in(self):
+        """✅ Filtre IN sur le statut"""
+        self.assertEqual(
+            self.titles({"status__in": "Finished,Hiatus"}), ["Finished Mid", "Hiatus Top"]
+        )
+
+    def test_filter_rating_range(self):
+        """✅ Filtre d'intervalle sur la note"""
+        self.assertEqual(self.titles({"rating__range": "3,4.6"}), ["Finished Mid", "Hiatus Top"])
+        self.assertEqual(self.titles({"rating__gte": 4.6}), ["Ongoing Top"])
+
+    def test_filter_release_date_range(self):
+        """✅ Filtre d'intervalle sur la date de sortie"""
+        self.assertEqual(
+            self.titles({"release_date__gte": "2020-01-01", "release_date__lte": "2021-12-31"}),
+            ["Ongoing Top"],
+        )
+
+    def test_filter_visibility(self):
+        """✅ Filtres sur is_public et waiting_review"""
+        self.assertEqual(self.titles({"is_public": "false"}), ["Finished Mid"])
+        self.assertEqual(self.titles({"waiting_review": "true"}), ["Finished Mid"])
+
+    def test_filters_are_combined(self):
+        """✅ Les filtres se combinent"""
+        self.assertEqual(self.titles({"is_public": "true", "rating__gte": 4}), ["Hiatus Top", "Ongoing Top"])
+
+    def test_invalid_filter_value(self):
+        """🚫 Une valeur invalide retourne 400"""
+        response = self.client.get(self.webtoons_url, {"rating__gte": "beaucoup"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class WebtoonFilterIndexTests(APITestCase):
+    """Vérifie avec EXPLAIN que le planificateur utilise bien les index"""
+
+    def explain(self, params, ordering=("-update_at", "-id")):
+        queryset = WebtoonFilter(params, queryset=Webtoon.objects.all()).qs.order_by(*ordering)
+        if connection.vendor == "postgresql":
+            # Sur une table presque vide PostgreSQL préfère un seq scan
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def assertUsesIndex(self, plan, index_name):
+        self.assertIn(index_name, plan, f"Index {index_name} non utilisé :\n{plan}")
+
+    def test_status_and_rating_use_composite_index(self):
+        plan = self.explain({"status": "Ongoing", "rating__gte": 4}, ordering=("rating",))
+        self.assertUsesIndex(plan, "webtoon_status_rating_idx")
+
+    def test_status_in_uses_composite_index(self):
+        plan = self.explain({"status__in": "Ongoing,Finished"}, ordering=("status", "rating"))
+        self.assertUsesIndex(plan, "webtoon_status_rating_idx")
+
+    def test_rating_range_uses_index(self):
+        plan = self.explain({"rating__range": "3,5"}, ordering=("rating",))
+        self.assertUsesIndex(plan, "webtoon_rating_idx")
+
+    def test_release_date_range_uses_index(self):
+        plan = self.explain({"release_date__gte": "2020-01-01"}, ordering=("release_date",))
+        self.assertUsesIndex(plan, "webtoon_release_date_idx")
+
+    def test_public_listing_uses_partial_index(self):
+        plan = self.explain({"is_public": "true"})
+        self.assertUsesIndex(plan, "webtoon_public_idx")
+
+    def test_review_listing_uses_partial_index(self):
+        plan = self.explain({"waiting_review": "true"})
+        self.assertUsesIndex(plan, "webtoon_review_idx")
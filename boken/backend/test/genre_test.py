@@ -0,0 +1,151 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import Genre
+from api.models.webtoon import Webtoon
+from api.serializers import WebtoonSerializer
+
+User = get_user_model()
+
+
+class GenreTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.genres_url = "/api/genres/"
+        webtoon_cache.backend.clear()
+
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+
+        self.action, self.drama, self.comedy = Genre.objects.bulk_create([
+            Genre(name="Action"), Genre(name="Drama"), Genre(name="Comedy"),
+        ])
+        self.both = Webtoon.objects.create(title="Both", authors="A", status="Ongoing", add_by=self.user)
+        self.both.genres.set([self.drama, self.action])
+        self.action_only = Webtoon.objects.create(title="Action only", authors="A", status="Ongoing")
+        self.action_only.genres.set([self.action])
+        self.none = Webtoon.objects.create(title="None", authors="A", status="Ongoing")
+
+    def titles(self, response):
+        return sorted(row["title"] for row in response.data["results"])
+
+    # === TESTS SÉRIALISATION ===
+    def test_genres_in_list(self):
+        """✅ La liste rend les genres de chaque webtoon, triés par nom"""
+        response = self.client.get(self.webtoons_url)
+        genres = {row["title"]: row["genres"] for row in response.data["results"]}
+        self.assertEqual(genres, {"Both": ["Action", "Drama"], "Action only": ["Action"], "None": []})
+
+    def test_list_matches_serializer(self):
+        """✅ Le chemin rapide rend les genres comme WebtoonSerializer"""
+        response = self.client.get(self.webtoons_url)
+        expected = WebtoonSerializer(
+            Webtoon.objects.prefetch_related("genres").order_by("-update_at", "-id"), many=True
+        ).data
+        self.assertEqual(response.data["results"], expected)
+
+    def test_list_query_count_is_fixed(self):
+        """✅ Une page coûte le même nombre de requêtes quel que soit le nombre de genres"""
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(self.webtoons_url)
+        webtoon_cache.backend.clear()
+        extra = Genre.objects.bulk_create([Genre(name=f"Genre {i}") for i in range(10)])
+        self.none.genres.set(extra)
+        webtoon_cache.backend.clear()
+        with CaptureQueriesContext(connection) as after:
+            self.client.get(self.webtoons_url)
+        self.assertEqual(len(after), len(before))
+
+    def test_retrieve_prefetches_genres(self):
+        """✅ Le détail charge les genres en une requête"""
+        with self.assertNumQueries(2):
+            response = self.client.get(f"{self.webtoons_url}{self.both.id}/", {"fields": "id,genres"})
+        self.assertEqual(response.data["genres"], ["Action", "Drama"])
+
+    def test_set_genres_on_update(self):
+        """✅ Le créateur modifie les genres par leur nom"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.patch(
+            f"{self.webtoons_url}{self.both.id}/", {"genres": ["Comedy"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["genres"], ["Comedy"])
+
+    def test_unknown_genre(self):
+        """🚫 Un genre inexistant est refusé"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.patch(
+            f"{self.webtoons_url}{self.both.id}/", {"genres": ["Horror"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_genre_change_invalidates_etag(self):
+        """✅ Changer les genres change l'ETag du webtoon"""
+        url = f"{self.webtoons_url}{self.both.id}/"
+        etag = self.client.get(url)["ETag"]
+        self.both.genres.add(self.comedy)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Comedy", response.data["genres"])
+
+    def test_genre_rename_invalidates_cache(self):
+        """✅ Renommer un genre se voit immédiatement dans la liste"""
+        self.client.get(self.webtoons_url)
+        self.drama.name = "Tragedy"
+        self.drama.save()
+        response = self.client.get(self.webtoons_url)
+        genres = {row["title"]: row["genres"] for row in response.data["results"]}
+        self.assertEqual(genres["Both"], ["Action", "Tragedy"])
+
+    # === TESTS FILTRES ===
+    def test_filter_genre_or(self):
+        """✅ `genre=a,b` garde les webtoons ayant l'un des genres"""
+        response = self.client.get(self.webtoons_url, {"genre": "Drama,Action"})
+        self.assertEqual(self.titles(response), ["Action only", "Both"])
+
+    def test_filter_genre_and(self):
+        """✅ `genre_mode=and` garde les webtoons ayant tous les genres"""
+        response = self.client.get(self.webtoons_url, {"genre": "Drama,Action", "genre_mode": "and"})
+        self.assertEqual(self.titles(response), ["Both"])
+
+    def test_filter_genre_is_a_single_query(self):
+        """✅ Le filtre par genre tient dans la requête de la page (EXISTS)"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.webtoons_url, {"genre": "Drama,Action", "genre_mode": "and", "fields": "id,title"})
+        page_sql = queries.captured_queries[-1]["sql"]
+        self.assertEqual(page_sql.count("EXISTS"), 2)
+        self.assertIn("api_webtoongenre", page_sql)
+
+    def test_filter_invalid_mode(self):
+        """🚫 Un genre_mode inconnu retourne 400"""
+        response = self.client.get(self.webtoons_url, {"genre": "Drama", "genre_mode": "xor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # === TESTS ENDPOINT GENRES ===
+    def test_list_genres(self):
+        """✅ Tout le monde peut lister les genres, triés par nom"""
+        response = self.client.get(self.genres_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["name"] for row in response.data], ["Action", "Comedy", "Drama"])
+
+    def test_admin_creates_genre(self):
+        """✅ Un admin crée un genre"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.client.post(self.genres_url, {"name": "Horror"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_user_cannot_create_genre(self):
+        """🚫 Un utilisateur simple ne peut pas créer de genre"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.post(self.genres_url, {"name": "Horror"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,110 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.hashers import get_pool
+from backend.settings import password_hashers
+
+User = get_user_model()
+
+SCRYPT = "api.hashers.ScryptPasswordHasher"
+PBKDF2 = "api.hashers.PBKDF2PasswordHasher"
+
+
+class PasswordHasherSettingsTests(SimpleTestCase):
+    # === TESTS CONFIGURATION ===
+    def test_strategy_first(self):
+        """✅ L'algorithme choisi passe en tête, les autres restent pour vérifier les anciens hachages"""
+        hashers = password_hashers({"PASSWORD_HASHER": "pbkdf2"})
+        self.assertEqual(hashers[0], PBKDF2)
+        self.assertEqual(len(hashers), 3)
+        self.assertIn(SCRYPT, hashers)
+
+    def test_unknown_strategy(self):
+        """🚫 Un algorithme inconnu est refusé au démarrage"""
+        with self.assertRaises(ImproperlyConfigured):
+            password_hashers({"PASSWORD_HASHER": "md5"})
+
+
+@override_settings(
+    PASSWORD_HASHERS=[SCRYPT, PBKDF2],
+    PASSWORD_SCRYPT={"work_factor": 2 ** 12, "block_size": 8, "parallelism": 1},
+    PASSWORD_PBKDF2_ITERATIONS=1000,
+)
+class PasswordHashingTests(APITestCase):
+    def setUp(self):
+        self.login_url = "/login/"
+        self.users_url = "/api/users/"
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+
+    def login(self, password="1234"):
+        return self.client.post(self.login_url, {"email": "user@test.com", "password": password})
+
+    def stored_hash(self):
+        return User.objects.values_list("password", flat=True).get(pk=self.user.pk)
+
+    # === TESTS HACHAGE ===
+    def test_create_user_uses_strategy(self):
+        """✅ create_user hache avec l'algorithme et les coûts choisis"""
+        self.assertTrue(self.stored_hash().startswith("scrypt$4096$"))
+
+    def test_hashing_runs_on_pool(self):
+        """✅ Le hachage tourne sur un thread du pool, pas sur celui de la requête"""
+        self.assertTrue(get_pool().run(lambda: threading.current_thread().name).startswith("password-hash"))
+
+    # === TESTS REHACHAGE ===
+    def test_login_rehashes_other_algorithm(self):
+        """✅ Un hachage PBKDF2 passe en scrypt à la connexion"""
+        User.objects.filter(pk=self.user.pk).update(password=make_password("1234", hasher="pbkdf2_sha256"))
+        response = self.login()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+        self.assertTrue(self.stored_hash().startswith("scrypt$4096$"))
+
+    def test_login_rehashes_new_costs(self):
+        """✅ Des coûts modifiés s'appliquent à la connexion suivante"""
+        with override_settings(PASSWORD_SCRYPT={"work_factor": 2 ** 11, "block_size": 8, "parallelism": 1}):
+            self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+        self.assertTrue(self.stored_hash().startswith("scrypt$2048$"))
+        # L'ancien réglage revient : le hachage moins coûteux est vérifié puis remplacé
+        self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+        self.assertTrue(self.stored_hash().startswith("scrypt$4096$"))
+
+    def test_wrong_password_keeps_hash(self):
+        """🚫 Un mauvais mot de passe ne rehache rien"""
+        legacy = make_password("1234", hasher="pbkdf2_sha256")
+        User.objects.filter(pk=self.user.pk).update(password=legacy)
+        self.assertEqual(self.login("wrong").status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.stored_hash(), legacy)
+
+    # === TESTS SATURATION ===
+    def test_saturated_pool(self):
+        """🚫 Pool occupé et file pleine : connexion et inscription retournent 503 avec Retry-After"""
+        with override_settings(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_QUEUE=0):
+            started, release = threading.Event(), threading.Event()
+
+            def hold():
+                started.set()
+                release.wait(5)
+
+            holder = threading.Thread(target=get_pool().run, args=(hold,))
+            holder.start()
+            started.wait(5)
+            try:
+                response = self.login()
+                self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+                self.assertEqual(response["Retry-After"], "1")
+                response = self.client.post(
+                    self.users_url, {"email": "new@test.com", "username": "new", "password": "1234"}
+                )
+                self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            finally:
+                release.set()
+                holder.join()
+            self.assertEqual(self.login().status_code, status.HTTP_200_OK)
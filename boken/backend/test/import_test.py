@@ -0,0 +1,125 @@
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.importers import WebtoonImporter
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class WebtoonBulkImportTests(APITestCase):
+    def setUp(self):
+        self.import_url = "/api/webtoons/bulk_import/"
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+
+        Webtoon.objects.create(title="Existing", authors="Old Author", status="Ongoing")
+
+    def post(self, body, content_type="application/json", **params):
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return self.client.generic("POST", f"{self.import_url}?{query}", body, content_type=content_type)
+
+    def read(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        return lines[:-1], lines[-1]["summary"]
+
+    def rows(self, count, prefix="Imported"):
+        return [{"title": f"{prefix} {i}", "authors": "Author", "status": "Ongoing"} for i in range(count)]
+
+    # === TESTS IMPORT ===
+    def test_import_json_array(self):
+        """✅ Un admin importe un tableau JSON"""
+        results, summary = self.read(self.post(json.dumps(self.rows(3))))
+        self.assertEqual(summary["created"], 3)
+        self.assertEqual([result["status"] for result in results], ["created"] * 3)
+        self.assertEqual(Webtoon.objects.filter(add_by=self.admin).count(), 3)
+
+    def test_import_ndjson(self):
+        """✅ Un admin importe un flux NDJSON"""
+        body = "\n".join(json.dumps(row) for row in self.rows(3))
+        results, summary = self.read(self.post(body, content_type="application/x-ndjson"))
+        self.assertEqual(summary["created"], 3)
+
+    def test_import_across_chunks(self):
+        """✅ L'import traite les lignes par lots"""
+        WebtoonImporter.chunk_size, previous = 4, WebtoonImporter.chunk_size
+        self.addCleanup(setattr, WebtoonImporter, "chunk_size", previous)
+        results, summary = self.read(self.post(json.dumps(self.rows(10))))
+        self.assertEqual([result["row"] for result in results], list(range(10)))
+        self.assertEqual(Webtoon.objects.filter(title__startswith="Imported").count(), 10)
+
+    def test_invalid_rows_are_reported(self):
+        """✅ Les lignes invalides sont signalées sans bloquer les autres"""
+        rows = self.rows(2) + [{"title": "No Authors", "status": "Ongoing"}, "not an object"]
+        results, summary = self.read(self.post(json.dumps(rows)))
+        self.assertEqual(summary["created"], 2)
+        self.assertEqual(summary["invalid"], 2)
+        self.assertIn("authors", results[2]["errors"])
+        self.assertFalse(Webtoon.objects.filter(title="No Authors").exists())
+
+    def test_malformed_ndjson_line(self):
+        """✅ Une ligne NDJSON illisible est signalée"""
+        body = '{"title": "Good", "authors": "A", "status": "Ongoing"}\n{"title": \n'
+        results, summary = self.read(self.post(body, content_type="application/x-ndjson"))
+        self.assertEqual([result["status"] for result in results], ["created", "invalid"])
+
+    def test_existing_titles_are_skipped(self):
+        """✅ Par défaut un titre existant est ignoré"""
+        rows = [{"title": "Existing", "authors": "New Author", "status": "Finished"}]
+        results, summary = self.read(self.post(json.dumps(rows)))
+        self.assertEqual(results[0]["status"], "skipped")
+        self.assertEqual(Webtoon.objects.get(title="Existing").authors, "Old Author")
+
+    def test_existing_titles_are_updated(self):
+        """✅ on_conflict=update met à jour le webtoon existant"""
+        rows = [{"title": "Existing", "authors": "New Author", "status": "Finished"}]
+        results, summary = self.read(self.post(json.dumps(rows), on_conflict="update"))
+        self.assertEqual(results[0]["status"], "updated")
+        webtoon = Webtoon.objects.get(title="Existing")
+        self.assertEqual((webtoon.authors, webtoon.status), ("New Author", "Finished"))
+
+    def test_duplicate_titles_in_input(self):
+        """✅ Un titre en double dans l'import : la dernière ligne l'emporte"""
+        rows = [
+            {"title": "Twice", "authors": "First", "status": "Ongoing"},
+            {"title": "Twice", "authors": "Second", "status": "Ongoing"},
+        ]
+        results, summary = self.read(self.post(json.dumps(rows)))
+        self.assertEqual([result["status"] for result in results], ["duplicate", "created"])
+        self.assertEqual(Webtoon.objects.get(title="Twice").authors, "Second")
+
+    def test_malformed_body(self):
+        """🚫 Un corps qui n'est pas un tableau JSON donne 400"""
+        response = self.post(json.dumps({"title": "Not a list"}))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_truncated_body(self):
+        """✅ Un tableau tronqué importe ce qui précède et signale l'erreur"""
+        WebtoonImporter.chunk_size, previous = 2, WebtoonImporter.chunk_size
+        self.addCleanup(setattr, WebtoonImporter, "chunk_size", previous)
+        body = json.dumps(self.rows(3))[:-40]
+        results, summary = self.read(self.post(body))
+        self.assertEqual(results[-1]["status"], "error")
+        self.assertEqual(summary["created"], 2)
+
+    def test_invalid_conflict_mode(self):
+        """🚫 on_conflict inconnu donne 400"""
+        response = self.post(json.dumps(self.rows(1)), on_conflict="replace")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_user_cannot_import(self):
+        """🚫 Un utilisateur simple ne peut pas importer"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.post(json.dumps(self.rows(1)))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,166 @@
+import uuid
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models import UserWebtoon
+from api.models.webtoon import Webtoon
+from api.serializers import LibraryProgressListSerializer
+from .utils import QueryBudgetMixin
+
+User = get_user_model()
+
+
+class LibraryTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        self.library_url = "/api/library/"
+        self.progress_url = "/api/library/progress/"
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.other = User.objects.create_user(
+            email="other@test.com", username="other", password="1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+
+        self.webtoons = Webtoon.objects.bulk_create([
+            Webtoon(title=f"Webtoon {i}", authors="Author", status="Ongoing") for i in range(5)
+        ])
+        self.entry = UserWebtoon.objects.create(
+            user=self.user, webtoon=self.webtoons[0], chapter_read=3, chapter_out=10
+        )
+        UserWebtoon.objects.create(user=self.other, webtoon=self.webtoons[1], chapter_out=5)
+
+    # === TESTS CRUD ===
+    def test_list_only_own_library(self):
+        """✅ La bibliothèque ne contient que les webtoons de l'utilisateur connecté"""
+        response = self.client.get(self.library_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["webtoon"] for row in response.data["results"]], [self.webtoons[0].id])
+
+    def test_add_webtoon(self):
+        """✅ Un utilisateur ajoute un webtoon à sa bibliothèque"""
+        response = self.client.post(self.library_url, {"webtoon": str(self.webtoons[1].id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(UserWebtoon.objects.filter(user=self.user, webtoon=self.webtoons[1]).exists())
+
+    def test_add_webtoon_twice(self):
+        """🚫 Un webtoon ne peut pas être ajouté deux fois"""
+        response = self.client.post(self.library_url, {"webtoon": str(self.webtoons[0].id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update_by_webtoon_id(self):
+        """✅ La progression se modifie via l'id du webtoon"""
+        response = self.client.patch(
+            f"{self.library_url}{self.webtoons[0].id}/", {"chapter_read": 7}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.entry.refresh_from_db()
+        self.assertEqual(self.entry.chapter_read, 7)
+
+    def test_update_chapter_read_above_chapter_out(self):
+        """🚫 Le chapitre lu ne peut pas dépasser le nombre de chapitres sortis"""
+        response = self.client.patch(
+            f"{self.library_url}{self.webtoons[0].id}/", {"chapter_read": 11}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_user_entry_not_found(self):
+        """🚫 Les éléments des autres utilisateurs sont introuvables"""
+        response = self.client.delete(f"{self.library_url}{self.webtoons[1].id}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_requires_authentication(self):
+        """🚫 La bibliothèque exige une authentification"""
+        self.client.credentials()
+        response = self.client.get(self.library_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # === TESTS PROGRESSION EN LOT ===
+    def test_batch_progress_upserts(self):
+        """✅ Le PATCH en lot crée et met à jour la progression"""
+        payload = [
+            {"webtoon": str(self.webtoons[0].id), "chapter_read": 8},
+            {"webtoon": str(self.webtoons[2].id), "chapter_read": 2, "chapter_out": 4},
+            {"webtoon": str(self.webtoons[3].id), "reading_status": "plan_to_read"},
+        ]
+        response = self.client.patch(self.progress_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["created"], response.data["updated"]), (2, 1))
+
+        self.entry.refresh_from_db()
+        self.assertEqual((self.entry.chapter_read, self.entry.chapter_out), (8, 10))
+        created = UserWebtoon.objects.get(user=self.user, webtoon=self.webtoons[2])
+        self.assertEqual((created.chapter_read, created.chapter_out), (2, 4))
+        self.assertEqual(UserWebtoon.objects.filter(user=self.user).count(), 3)
+
+    def test_batch_progress_query_budget(self):
+        """✅ Le lot coûte le même nombre de requêtes quelle que soit sa taille"""
+        self.client.get(self.library_url)  # met l'utilisateur authentifié en cache
+        payload = [
+            {"webtoon": str(webtoon.id), "chapter_read": 1, "chapter_out": 1} for webtoon in self.webtoons
+        ]
+        # Webtoons, lignes verrouillées, upsert, et le SAVEPOINT/RELEASE du bloc atomique dans la transaction du test
+        with self.assertMaxQueries(5):
+            response = self.client.patch(self.progress_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_batch_progress_is_validated_as_a_set(self):
+        """🚫 Une seule ligne invalide rejette tout le lot, en listant chaque ligne fautive"""
+        payload = [
+            {"webtoon": str(self.webtoons[0].id), "chapter_read": 11},
+            {"webtoon": str(self.webtoons[2].id), "chapter_read": 1, "chapter_out": 5},
+            {"webtoon": str(self.webtoons[3].id), "chapter_read": 2},
+        ]
+        response = self.client.patch(self.progress_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        message = str(response.data)
+        self.assertIn(str(self.webtoons[0].id), message)
+        self.assertIn(str(self.webtoons[3].id), message)
+        self.assertFalse(UserWebtoon.objects.filter(webtoon=self.webtoons[2]).exists())
+
+    def test_batch_progress_keeps_other_fields(self):
+        """✅ Une ligne ne réécrit que les champs qu'elle envoie : un autre lot concurrent garde les siens"""
+        payload = [{"webtoon": str(self.webtoons[0].id), "note": "Super"}]
+        with CaptureQueriesContext(connection) as context:
+            self.client.patch(self.progress_url, payload, format="json")
+        upsert = next(query["sql"] for query in context.captured_queries if "ON CONFLICT" in query["sql"])
+        self.assertIn('"note" = EXCLUDED."note"', upsert)
+        self.assertNotIn('"chapter_read" = EXCLUDED', upsert)
+        self.entry.refresh_from_db()
+        self.assertEqual((self.entry.note, self.entry.chapter_read), ("Super", 3))
+
+    def test_batch_progress_constraint(self):
+        """🚫 Ligne créée par un lot concurrent après le verrouillage : la contrainte de la base rejette le lot"""
+        merge = LibraryProgressListSerializer.merge
+        unseen = staticmethod(lambda rows, existing, user_id: merge(rows, {}, user_id))
+        with mock.patch.object(LibraryProgressListSerializer, "merge", unseen):
+            response = self.client.patch(
+                self.progress_url, [{"webtoon": str(self.webtoons[0].id), "chapter_out": 2}], format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.entry.refresh_from_db()
+        self.assertEqual(self.entry.chapter_out, 10)
+
+    def test_batch_progress_unknown_webtoon(self):
+        """🚫 Un webtoon inexistant rejette le lot"""
+        payload = [{"webtoon": str(uuid.uuid4()), "chapter_read": 1}]
+        response = self.client.patch(self.progress_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_progress_duplicates(self):
+        """🚫 Un même webtoon ne peut apparaître qu'une fois par lot"""
+        payload = [{"webtoon": str(self.webtoons[0].id)}, {"webtoon": str(self.webtoons[0].id)}]
+        response = self.client.patch(self.progress_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_progress_requires_list(self):
+        """🚫 Le corps doit être une liste"""
+        response = self.client.patch(self.progress_url, {"webtoon": str(self.webtoons[0].id)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
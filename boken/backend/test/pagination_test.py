@@ -0,0 +1,91 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class KeysetPaginationTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.users_url = "/api/users/"
+
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+
+        # 25 webtoons, dont 5 partagent le même update_at pour tester le départage par id
+        now = timezone.now()
+        Webtoon.objects.bulk_create([
+            Webtoon(
+                title=f"Webtoon {i}",
+                authors="Author",
+                status="Ongoing",
+                add_by=self.admin,
+                update_at=now - timedelta(minutes=max(i, 20)),
+            )
+            for i in range(25)
+        ])
+
+    def walk(self, url):
+        """Suit les liens `next` et retourne les ids dans l'ordre"""
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+        return ids
+
+    def test_list_is_paginated(self):
+        """✅ La liste des webtoons est paginée (20 par défaut)"""
+        response = self.client.get(self.webtoons_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertIsNotNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
+
+    def test_walk_covers_every_row_once(self):
+        """✅ Parcourir les pages retourne chaque webtoon une seule fois, dans l'ordre"""
+        ids = self.walk(f"{self.webtoons_url}?page_size=7")
+        expected = [
+            str(pk) for pk in Webtoon.objects.order_by("-update_at", "-id").values_list("id", flat=True)
+        ]
+        self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_previous_page(self):
+        """✅ Le lien `previous` ramène à la page précédente"""
+        first = self.client.get(f"{self.webtoons_url}?page_size=10")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [row["id"] for row in back.data["results"]],
+            [row["id"] for row in first.data["results"]],
+        )
+
+    def test_page_size_is_capped(self):
+        """✅ page_size est plafonné à 100"""
+        Webtoon.objects.bulk_create([
+            Webtoon(title=f"Extra {i}", authors="Author", status="Ongoing") for i in range(100)
+        ])
+        response = self.client.get(f"{self.webtoons_url}?page_size=1000")
+        self.assertEqual(len(response.data["results"]), 100)
+
+    def test_invalid_cursor(self):
+        """🚫 Un curseur invalide retourne 404"""
+        response = self.client.get(f"{self.webtoons_url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_users_list_is_paginated(self):
+        """✅ La liste des utilisateurs est paginée"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.client.get(f"{self.users_url}?page_size=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
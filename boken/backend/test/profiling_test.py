@@ -0,0 +1,119 @@
+import os
+import re
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.cache import webtoon_cache
+from api.models.webtoon import Webtoon
+from api.profiling import ProfilingMiddleware, metrics
+
+User = get_user_model()
+
+
+def server_timing(response):
+    """`{métrique: (durée en ms, description)}` de l'en-tête Server-Timing"""
+    timings = {}
+    for entry in response["Server-Timing"].split(", "):
+        name, *params = entry.split(";")
+        values = dict(param.split("=", 1) for param in params)
+        timings[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return timings
+
+
+@override_settings(PROFILING=True, PROFILING_SAMPLE_RATE=0)
+class ProfilingTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        webtoon_cache.backend.clear()
+        metrics.reset()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.webtoon = Webtoon.objects.create(
+            title="Webtoon", authors="Author", status="Ongoing", add_by=self.user
+        )
+
+    # === TESTS SERVER-TIMING ===
+    def test_server_timing_header(self):
+        """✅ Chaque réponse porte le temps SQL, le nombre de requêtes, la sérialisation et le rendu"""
+        response = self.client.get(f"{self.webtoons_url}{self.webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        timings = server_timing(response)
+        self.assertEqual(set(timings), {"db", "serialize", "render", "total"})
+        self.assertRegex(timings["db"][1], r"^[1-9]\d* queries$")
+        self.assertGreater(timings["serialize"][0], 0)
+        self.assertGreater(timings["render"][0], 0)
+        self.assertGreaterEqual(timings["total"][0], timings["db"][0])
+
+    def test_cached_response_has_no_queries(self):
+        """✅ Une réponse servie par le cache ne compte aucune requête SQL"""
+        self.client.get(self.webtoons_url)
+        response = self.client.get(self.webtoons_url)
+        self.assertEqual(server_timing(response)["db"], (0.0, "0 queries"))
+
+    def test_async_view(self):
+        """✅ Les vues asynchrones sont profilées aussi, requêtes SQL comprises"""
+        response = self.client.get(f"/api/async/webtoons/{self.webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(server_timing(response)["db"][1], "0 queries")
+
+    # === TESTS MÉTRIQUES ===
+    def test_metrics_per_action(self):
+        """✅ /metrics agrège les requêtes par action DRF"""
+        self.client.get(self.webtoons_url)
+        self.client.get(f"{self.webtoons_url}search/", {"q": "Webtoon"})
+        self.client.get(f"{self.webtoons_url}search/", {"q": "Other"})
+
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        self.assertIn('boken_requests_total{endpoint="WebtoonViewSet.list",method="GET"} 1', body)
+        self.assertIn('boken_requests_total{endpoint="WebtoonViewSet.search",method="GET"} 2', body)
+        self.assertIn(
+            'boken_request_duration_seconds_count{endpoint="WebtoonViewSet.search",method="GET"} 2', body
+        )
+        queries = re.search(r'boken_sql_queries_total\{endpoint="WebtoonViewSet.search",method="GET"\} (\d+)', body)
+        self.assertGreater(int(queries.group(1)), 0)
+
+    def test_metrics_local_only(self):
+        """🚫 /metrics n'est servi qu'aux adresses locales"""
+        response = self.client.get("/metrics", REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(PROFILING_METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        """🚫 Avec un jeton, même une requête locale (proxy) doit le présenter"""
+        self.assertEqual(self.client.get("/metrics").status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get("/metrics", REMOTE_ADDR="10.0.0.1", HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    # === TESTS CPROFILE ===
+    def test_sampled_cprofile(self):
+        """✅ Les requêtes échantillonnées laissent un profil cProfile"""
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(PROFILING_SAMPLE_RATE=1, PROFILING_DIR=directory):
+                self.client.get(self.webtoons_url)
+            files = os.listdir(directory)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith("-WebtoonViewSet.list.prof"))
+
+
+class ProfilingDisabledTests(APITestCase):
+    def test_middleware_not_used(self):
+        """✅ Désactivé, le middleware se retire de la chaîne"""
+        with self.assertRaises(MiddlewareNotUsed):
+            ProfilingMiddleware(lambda request: None)
+
+    def test_no_header_nor_metrics(self):
+        """🚫 Désactivé, ni en-tête Server-Timing ni /metrics"""
+        response = self.client.get("/api/webtoons/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(self.client.get("/metrics").status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,181 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models import Genre, WebtoonGenre
+from api.models.webtoon import Webtoon
+from .utils import QueryBudgetMixin
+
+User = get_user_model()
+
+
+def get_token_for_user(user):
+    """Retourne un JWT valide pour un utilisateur donné"""
+    return str(RefreshToken.for_user(user).access_token)
+
+
+class WebtoonQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user_token = get_token_for_user(self.user)
+        self.admin_token = get_token_for_user(self.admin)
+
+        # Chaque webtoon a un créateur différent : un N+1 sur add_by se verrait tout de suite
+        creators = User.objects.bulk_create([
+            User(email=f"creator{i}@test.com", username=f"creator{i}") for i in range(10)
+        ])
+        webtoons = Webtoon.objects.bulk_create([
+            Webtoon(title=f"Webtoon {i}", authors="Author", status="Ongoing", add_by=creator)
+            for i, creator in enumerate(creators)
+        ])
+        # ... et des genres : un N+1 sur genres aussi
+        genres = Genre.objects.bulk_create([Genre(name=f"Genre {i}") for i in range(3)])
+        WebtoonGenre.objects.bulk_create([
+            WebtoonGenre(webtoon=webtoon, genre=genre) for webtoon in webtoons for genre in genres
+        ])
+        self.webtoon = Webtoon.objects.create(
+            title="User Webtoon", authors="User Author", status="Ongoing", add_by=self.user
+        )
+
+    def test_list_budget(self):
+        # la page, qui porte aussi les validateurs ETag, puis les genres de la page
+        with self.assertMaxQueries(2):
+            response = self.client.get(self.webtoons_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 11)
+
+    def test_retrieve_budget(self):
+        # le webtoon et son créateur, puis ses genres et ses traductions
+        with self.assertMaxQueries(3):
+            response = self.client.get(f"{self.webtoons_url}{self.webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_create_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        data = {"title": "New Webtoon", "authors": "Author", "status": "Ongoing"}
+        # auth, unicité du titre, insert, puis add_by et genres pour la réponse
+        with self.assertMaxQueries(5):
+            response = self.client.post(self.webtoons_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_partial_update_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        # auth, get, unicité du titre, update, puis genres pour la réponse
+        with self.assertMaxQueries(5):
+            response = self.client.patch(
+                f"{self.webtoons_url}{self.webtoon.id}/", {"title": "Renamed"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_update_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        data = {"title": "Renamed", "authors": "Author", "status": "Finished"}
+        with self.assertMaxQueries(5):
+            response = self.client.put(f"{self.webtoons_url}{self.webtoon.id}/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_destroy_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        # auth, get, suppression en cascade (bibliothèque, genres, traductions), le webtoon,
+        # puis son tombstone pour la synchronisation
+        with self.assertMaxQueries(7):
+            response = self.client.delete(f"{self.webtoons_url}{self.webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_rate_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        url = f"{self.webtoons_url}{self.webtoon.id}/rate/"
+        # auth, get, élément de bibliothèque (select puis insert, savepoints compris),
+        # update des agrégats, relecture de la moyenne
+        with self.assertMaxQueries(10):
+            response = self.client.post(url, {"rating": 4}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_bulk_review_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        ids = [str(pk) for pk in Webtoon.objects.values_list("id", flat=True)]
+        # auth, puis un seul UPDATE pour tout le lot
+        with self.assertMaxQueries(2):
+            response = self.client.post(
+                f"{self.webtoons_url}bulk_review/", {"ids": ids, "decision": "approve"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_set_to_public_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        url = f"{self.webtoons_url}{self.webtoon.id}/set_to_public/"
+        # auth, get, update, puis genres pour la réponse
+        with self.assertMaxQueries(4):
+            response = self.client.patch(url, {"is_public": True}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class UserQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        self.users_url = "/api/users/"
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user_token = get_token_for_user(self.user)
+        self.admin_token = get_token_for_user(self.admin)
+        User.objects.bulk_create([
+            User(email=f"other{i}@test.com", username=f"other{i}") for i in range(10)
+        ])
+
+    def test_create_budget(self):
+        data = {"email": "new@test.com", "username": "new", "password": "1234"}
+        with self.assertMaxQueries(3):
+            response = self.client.post(self.users_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_admin_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        data = {"email": "second@test.com", "username": "second", "password": "1234"}
+        with self.assertMaxQueries(5):
+            response = self.client.post(f"{self.users_url}create_admin/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_list_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        # auth puis la page, qui porte aussi les validateurs ETag
+        with self.assertMaxQueries(2):
+            response = self.client.get(self.users_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        with self.assertMaxQueries(2):
+            response = self.client.get(f"{self.users_url}{self.user.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_partial_update_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        with self.assertMaxQueries(4):
+            response = self.client.patch(
+                f"{self.users_url}{self.user.id}/", {"username": "renamed"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_update_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        data = {"username": "renamed", "email": "user@test.com", "password": "1234"}
+        with self.assertMaxQueries(5):
+            response = self.client.put(f"{self.users_url}{self.user.id}/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_destroy_budget(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        # auth, get, retrait des notes, puis le collecteur de suppression
+        # (bibliothèque, webtoons, groupes, permissions, logs admin)
+        with self.assertMaxQueries(9):
+            response = self.client.delete(f"{self.users_url}{self.user.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
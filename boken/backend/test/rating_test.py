@@ -0,0 +1,177 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import UserWebtoon
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class RatingTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.library_url = "/api/library/"
+        webtoon_cache.backend.clear()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.other = User.objects.create_user(
+            email="other@test.com", username="other", password="1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.other_token = str(RefreshToken.for_user(self.other).access_token)
+
+        self.webtoon = Webtoon.objects.create(
+            title="Solo Leveling", authors="Chugong", status="Finished", add_by=self.user
+        )
+        self.rate_url = f"{self.webtoons_url}{self.webtoon.id}/rate/"
+
+    def rate(self, token, rating):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.client.post(self.rate_url, {"rating": rating}, format="json")
+
+    def assertAggregates(self, rating, rating_sum, rating_count):
+        self.webtoon.refresh_from_db()
+        self.assertAlmostEqual(self.webtoon.rating, rating)
+        self.assertAlmostEqual(self.webtoon.rating_sum, rating_sum)
+        self.assertEqual(self.webtoon.rating_count, rating_count)
+
+    # === TESTS VOTE ===
+    def test_rate_updates_average(self):
+        """✅ Chaque vote met à jour la moyenne stockée"""
+        self.rate(self.user_token, 4)
+        response = self.rate(self.other_token, 5)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"rating": 5, "average": 4.5, "rating_count": 2})
+        self.assertAggregates(4.5, 9, 2)
+
+    def test_rate_adds_to_library(self):
+        """✅ Noter un webtoon l'ajoute à la bibliothèque, avec la note en lecture seule"""
+        self.rate(self.user_token, 3.5)
+        response = self.client.get(f"{self.library_url}{self.webtoon.id}/")
+        self.assertEqual(response.data["rating"], 3.5)
+
+    def test_change_vote(self):
+        """✅ Changer sa note remplace l'ancienne sans compter deux votes"""
+        self.rate(self.user_token, 2)
+        self.rate(self.user_token, 4)
+        self.assertAggregates(4, 4, 1)
+
+    def test_withdraw_vote(self):
+        """✅ `null` retire la note"""
+        self.rate(self.user_token, 2)
+        self.rate(self.other_token, 4)
+        self.rate(self.user_token, None)
+        self.assertAggregates(4, 4, 1)
+        self.assertIsNone(UserWebtoon.objects.get(user=self.user).rating)
+
+    def test_withdraw_without_vote(self):
+        """✅ Retirer une note absente ne crée pas d'élément de bibliothèque"""
+        response = self.rate(self.user_token, None)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(UserWebtoon.objects.exists())
+
+    def test_rate_invalidates_cache(self):
+        """✅ Un vote change l'ETag et le détail en cache"""
+        url = f"{self.webtoons_url}{self.webtoon.id}/"
+        etag = self.client.get(url)["ETag"]
+        self.rate(self.user_token, 5)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rating_count"], 1)
+
+    def test_rating_out_of_range(self):
+        """🚫 Une note hors de [0, 5] est refusée"""
+        response = self.rate(self.user_token, 6)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertAggregates(0, 0, 0)
+
+    def test_anonymous_cannot_rate(self):
+        """🚫 Il faut être authentifié pour noter"""
+        response = self.client.post(self.rate_url, {"rating": 5}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rating_is_read_only(self):
+        """🚫 Le créateur ne peut plus écrire la moyenne directement"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.patch(f"{self.webtoons_url}{self.webtoon.id}/", {"rating": 5.0}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rating"], 0.0)
+
+    # === TESTS SUPPRESSION ===
+    def test_library_delete_withdraws_vote(self):
+        """✅ Retirer un webtoon de sa bibliothèque retire sa note"""
+        self.rate(self.user_token, 2)
+        self.rate(self.other_token, 4)
+        response = self.client.delete(f"{self.library_url}{self.webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertAggregates(2, 2, 1)
+
+    def test_user_delete_withdraws_votes(self):
+        """✅ Supprimer un utilisateur retire ses notes"""
+        second = Webtoon.objects.create(title="Tower of God", authors="SIU", status="Ongoing")
+        self.rate(self.user_token, 2)
+        self.rate(self.other_token, 4)
+        self.client.post(f"{self.webtoons_url}{second.id}/rate/", {"rating": 3}, format="json")
+        self.other.delete()
+        self.assertAggregates(2, 2, 1)
+        second.refresh_from_db()
+        self.assertEqual((second.rating, second.rating_count), (0.0, 0))
+
+    # === TESTS CLASSEMENT ===
+    def test_top_rated(self):
+        """✅ Les mieux notés d'abord, à moyenne égale le plus de votes"""
+        Webtoon.objects.bulk_create([
+            Webtoon(title="Few votes", authors="A", status="Ongoing", rating=4.5, rating_sum=4.5, rating_count=1),
+            Webtoon(title="Many votes", authors="A", status="Ongoing", rating=4.5, rating_sum=45, rating_count=10),
+            Webtoon(title="Best", authors="A", status="Finished", rating=5, rating_sum=10, rating_count=2),
+        ])
+        response = self.client.get(f"{self.webtoons_url}top_rated/", {"limit": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["title"] for row in response.data["results"]], ["Best", "Many votes", "Few votes"])
+
+        response = self.client.get(f"{self.webtoons_url}top_rated/", {"status": "Ongoing", "rating_count__gte": 2})
+        self.assertEqual([row["title"] for row in response.data["results"]], ["Many votes"])
+
+    def test_top_rated_never_aggregates(self):
+        """✅ Le classement est une seule requête, sans agrégat sur les votes"""
+        self.rate(self.user_token, 5)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f"{self.webtoons_url}top_rated/", {"fields": "id,title,rating"})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("api_userwebtoon", queries[0]["sql"])
+
+    def test_top_rated_invalid_limit(self):
+        """🚫 Un `limit` non entier retourne 400"""
+        response = self.client.get(f"{self.webtoons_url}top_rated/", {"limit": "many"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # === TESTS RÉCONCILIATION ===
+    def test_reconcile_reports_drift(self):
+        """✅ La commande signale la dérive sans corriger par défaut"""
+        self.rate(self.user_token, 4)
+        Webtoon.objects.filter(pk=self.webtoon.pk).update(rating_count=3)
+        out = StringIO()
+        call_command("reconcile_ratings", stdout=out)
+        self.assertIn("Solo Leveling", out.getvalue())
+        self.assertAggregates(4, 4, 3)
+
+    def test_reconcile_fix(self):
+        """✅ `--fix` réécrit les agrégats depuis les votes"""
+        self.rate(self.user_token, 4)
+        self.rate(self.other_token, 3)
+        Webtoon.objects.filter(pk=self.webtoon.pk).update(rating=1.0, rating_sum=2.0, rating_count=5)
+        call_command("reconcile_ratings", "--fix", stdout=StringIO())
+        self.assertAggregates(3.5, 7, 2)
+
+        out = StringIO()
+        call_command("reconcile_ratings", stdout=out)
+        self.assertIn("Aucune dérive", out.getvalue())
@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import Release
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class ReleaseTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.releases_url = "/api/releases/"
+        webtoon_cache.backend.clear()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.other = User.objects.create_user(
+            email="other@test.com", username="other", password="1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        self.other_token = str(RefreshToken.for_user(self.other).access_token)
+
+        self.webtoon = Webtoon.objects.create(
+            title="Solo Leveling", authors="Chugong", status="Finished", add_by=self.user
+        )
+        self.detail_url = f"{self.webtoons_url}{self.webtoon.id}/"
+        self.fr = Release.objects.create(
+            webtoon=self.webtoon, language="fr", alt_title="Solo Leveling FR",
+            description="Une très longue description. " * 200, total_chapters=179,
+        )
+        self.en = Release.objects.create(
+            webtoon=self.webtoon, language="en", description="A long description. " * 200,
+            total_chapters=200,
+        )
+
+    def captured_sql(self, url, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [query["sql"] for query in queries.captured_queries]
+
+    # === TESTS LECTURE ===
+    def test_webtoon_list_never_reads_releases(self):
+        """✅ La liste des webtoons ne touche pas aux traductions"""
+        response, queries = self.captured_sql(self.webtoons_url)
+        self.assertNotIn("releases", response.data["results"][0])
+        self.assertFalse(any("api_release" in sql for sql in queries))
+
+    def test_release_list_defers_description(self):
+        """✅ La liste des traductions ne lit pas les descriptions"""
+        response, queries = self.captured_sql(self.releases_url, {"webtoon": self.webtoon.id})
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertNotIn("description", response.data["results"][0])
+        self.assertFalse(any('"description"' in sql for sql in queries))
+
+    def test_release_retrieve_has_description(self):
+        """✅ Le détail d'une traduction contient sa description"""
+        response = self.client.get(f"{self.releases_url}{self.fr.id}/")
+        self.assertTrue(response.data["description"].startswith("Une très longue"))
+
+    def test_webtoon_retrieve_includes_releases(self):
+        """✅ Le détail d'un webtoon contient ses traductions, triées par langue"""
+        response = self.client.get(self.detail_url)
+        self.assertEqual([release["language"] for release in response.data["releases"]], ["en", "fr"])
+
+    def test_webtoon_retrieve_lang(self):
+        """✅ `?lang=` ne charge que la traduction demandée"""
+        response, queries = self.captured_sql(self.detail_url, {"lang": "fr"})
+        self.assertEqual([release["language"] for release in response.data["releases"]], ["fr"])
+        release_sql = [sql for sql in queries if "api_release" in sql]
+        self.assertEqual(len(release_sql), 1)
+        self.assertIn('"language" = ', release_sql[0])
+
+    def test_webtoon_retrieve_lang_is_cached_separately(self):
+        """✅ Le cache du détail dépend de `lang`"""
+        self.client.get(self.detail_url, {"lang": "fr"})
+        response = self.client.get(self.detail_url, {"lang": "en"})
+        self.assertEqual([release["language"] for release in response.data["releases"]], ["en"])
+
+    def test_webtoon_retrieve_without_releases_field(self):
+        """✅ Sans `releases` dans `fields`, aucune traduction n'est lue"""
+        response, queries = self.captured_sql(self.detail_url, {"fields": "id,title"})
+        self.assertEqual(set(response.data), {"id", "title"})
+        self.assertFalse(any("api_release" in sql for sql in queries))
+
+    def test_release_change_invalidates_webtoon_detail(self):
+        """✅ Modifier une traduction invalide le détail du webtoon"""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.en.total_chapters = 201
+        self.en.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["releases"][0]["total_chapters"], 201)
+
+    def test_release_delete_invalidates_webtoon_detail(self):
+        """✅ Supprimer une traduction invalide le détail du webtoon"""
+        self.client.get(self.detail_url)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.delete(f"{self.releases_url}{self.en.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = self.client.get(self.detail_url)
+        self.assertEqual([release["language"] for release in response.data["releases"]], ["fr"])
+
+    # === TESTS ÉCRITURE ===
+    def test_creator_adds_release(self):
+        """✅ Le créateur du webtoon ajoute une traduction"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        data = {"webtoon": str(self.webtoon.id), "language": "ko", "total_chapters": 200}
+        response = self.client.post(self.releases_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_duplicate_language(self):
+        """🚫 Une seule traduction par langue"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        data = {"webtoon": str(self.webtoon.id), "language": "fr"}
+        response = self.client.post(self.releases_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_user_cannot_add_release(self):
+        """🚫 Un autre utilisateur ne peut pas ajouter de traduction"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.other_token}")
+        data = {"webtoon": str(self.webtoon.id), "language": "ko"}
+        response = self.client.post(self.releases_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_other_user_cannot_update_release(self):
+        """🚫 Un autre utilisateur ne peut pas modifier une traduction"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.other_token}")
+        response = self.client.patch(f"{self.releases_url}{self.fr.id}/", {"total_chapters": 1}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_anonymous_cannot_add_release(self):
+        """🚫 Il faut être authentifié pour ajouter une traduction"""
+        data = {"webtoon": str(self.webtoon.id), "language": "ko"}
+        response = self.client.post(self.releases_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
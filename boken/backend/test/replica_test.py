@@ -0,0 +1,204 @@
+import time
+import unittest
+import uuid
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from api.cache import VersionedCache, webtoon_cache
+from api.checks import check_replica_pin_cache
+from api.models import User
+from api.models.webtoon import Webtoon
+from api.replicas import PrimaryReplicaRouter, ReplicaRoutingMiddleware, reading_from_replica
+
+router = PrimaryReplicaRouter()
+
+
+@override_settings(REPLICA_DATABASES=["replica"], REPLICA_PIN_SECONDS=60)
+class ReplicaRoutingTests(SimpleTestCase):
+    databases = {"default"}
+
+    def setUp(self):
+        caches[settings.REPLICA_PIN_CACHE_ALIAS].clear()
+        self.factory = RequestFactory()
+
+    def token(self):
+        user = User(id=uuid.uuid4(), email="user@test.com", username="user")
+        return str(AccessToken.for_user(user))
+
+    def handle(self, method, path="/api/webtoons/", token=None, address="10.0.0.1", view=None):
+        """Fait passer une requête par le middleware, renvoie la base choisie pour les lectures de la vue"""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        request = getattr(self.factory, method)(path, REMOTE_ADDR=address, **headers)
+        seen = []
+
+        def get_response(request):
+            seen.append((view or (lambda: router.db_for_read(Webtoon)))())
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(get_response)(request)
+        return seen[0]
+
+    # === TESTS ROUTAGE ===
+    def test_outside_request_reads_primary(self):
+        """✅ Hors requête (commandes, tâches de fond), les lectures vont à la base principale"""
+        self.assertEqual(router.db_for_read(Webtoon), "default")
+
+    def test_safe_request_reads_replica(self):
+        """✅ Un GET lit sur un réplica"""
+        self.assertEqual(self.handle("get"), "replica")
+        self.assertEqual(self.handle("head"), "replica")
+
+    def test_writes_go_to_primary(self):
+        """✅ Les écritures vont toujours à la base principale"""
+        self.assertEqual(self.handle("post"), "default")
+        self.assertEqual(self.handle("get", view=lambda: router.db_for_write(Webtoon)), "default")
+
+    def test_transaction_reads_primary(self):
+        """✅ Dans une transaction, les lectures restent sur la base principale"""
+        def view():
+            with transaction.atomic():
+                return router.db_for_read(Webtoon)
+        self.assertEqual(self.handle("get", view=view), "default")
+
+    def test_instance_hint(self):
+        """✅ Les relations d'un objet se lisent sur la base qui l'a chargé"""
+        webtoon = Webtoon(title="Webtoon")
+        webtoon._state.db = "default"
+        self.assertEqual(self.handle("get", view=lambda: router.db_for_read(Webtoon, instance=webtoon)), "default")
+
+    def test_other_paths_read_primary(self):
+        """✅ Hors de REPLICA_READ_PATHS (admin), tout va à la base principale"""
+        self.assertEqual(self.handle("get", path="/admin/"), "default")
+
+    @override_settings(REPLICA_DATABASES=[])
+    def test_without_replicas(self):
+        """✅ Sans réplica configuré, tout va à la base principale"""
+        self.assertEqual(self.handle("get"), "default")
+
+    def test_async_request_reads_replica(self):
+        """✅ Sous ASGI, le middleware route les lectures de la même façon"""
+        async def get_response(request):
+            return HttpResponse(router.db_for_read(Webtoon))
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        response = async_to_sync(middleware)(self.factory.get("/api/webtoons/", REMOTE_ADDR="10.0.0.1"))
+        self.assertEqual(response.content, b"replica")
+
+    def test_context_is_reset(self):
+        """✅ Le choix du réplica ne survit pas à la requête"""
+        self.handle("get")
+        self.assertFalse(reading_from_replica())
+
+    def test_migrations_only_on_primary(self):
+        """✅ Les migrations ne s'appliquent qu'à la base principale"""
+        self.assertTrue(router.allow_migrate("default", "api"))
+        self.assertFalse(router.allow_migrate("replica", "api"))
+
+    # === TESTS LECTURE DE SES ÉCRITURES ===
+    def test_user_pinned_after_write(self):
+        """✅ Après une écriture, l'utilisateur lit sur la base principale"""
+        token = self.token()
+        self.handle("patch", token=token)
+        self.assertEqual(self.handle("get", token=token, address="10.0.0.2"), "default")
+
+    def test_other_user_not_pinned(self):
+        """✅ Les autres utilisateurs continuent de lire sur les réplicas"""
+        self.handle("patch", token=self.token())
+        self.assertEqual(self.handle("get", token=self.token(), address="10.0.0.2"), "replica")
+
+    def test_anonymous_pinned_by_address(self):
+        """✅ Un client anonyme est épinglé par son adresse"""
+        self.handle("post", path="/api/register/")
+        self.assertEqual(self.handle("get"), "default")
+        self.assertEqual(self.handle("get", address="10.0.0.2"), "replica")
+
+    def test_user_write_does_not_pin_address(self):
+        """✅ L'écriture d'un utilisateur n'épingle pas les autres clients de la même adresse (proxy, NAT)"""
+        self.handle("patch", token=self.token(), address="127.0.0.1")
+        self.assertEqual(self.handle("get", address="127.0.0.1"), "replica")
+        self.assertEqual(self.handle("get", token=self.token(), address="127.0.0.1"), "replica")
+
+    @override_settings(REPLICA_PIN_SECONDS=0.05)
+    def test_pin_expires(self):
+        """✅ Passé REPLICA_PIN_SECONDS, l'utilisateur revient aux réplicas"""
+        token = self.token()
+        self.handle("patch", token=token)
+        time.sleep(0.1)
+        self.assertEqual(self.handle("get", token=token), "replica")
+
+    def test_invalid_token_ignored(self):
+        """✅ Un JWT invalide n'empêche pas la lecture sur un réplica"""
+        self.assertEqual(self.handle("get", token="not-a-token"), "replica")
+
+    # === TESTS CACHE ===
+    @override_settings(REPLICA_PIN_SECONDS=0.05)
+    def test_replica_fill_after_bump_is_short_lived(self):
+        """✅ Un payload lu sur un réplica juste après une invalidation expire avec la fenêtre"""
+        cache = VersionedCache("replica-test", alias="webtoons")
+        cache.bump()
+        self.handle("get", view=lambda: cache.set("key", "payload"))
+        self.assertEqual(cache.get("key"), "payload")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("key"))
+
+    @override_settings(REPLICA_PIN_SECONDS=0.05)
+    def test_primary_fill_keeps_default_timeout(self):
+        """✅ Un payload lu sur la base principale garde la durée de vie du cache"""
+        cache = VersionedCache("replica-test", alias="webtoons")
+        cache.bump()
+        cache.set("key", "payload")
+        time.sleep(0.1)
+        self.assertEqual(cache.get("key"), "payload")
+
+
+    # === TESTS CONFIGURATION ===
+    def test_check_local_pin_cache(self):
+        """🚫 Avec des réplicas, les épinglages doivent vivre dans un cache partagé"""
+        shared = {**settings.CACHES, "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        with override_settings(CACHES={**settings.CACHES, "local": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+                               REPLICA_PIN_CACHE_ALIAS="local"):
+            self.assertEqual([message.id for message in check_replica_pin_cache(None)], ["api.E001"])
+            with override_settings(REPLICA_DATABASES=[]):
+                self.assertEqual(check_replica_pin_cache(None), [])
+        with override_settings(CACHES=shared, REPLICA_PIN_CACHE_ALIAS="shared"):
+            self.assertEqual(check_replica_pin_cache(None), [])
+
+
+@unittest.skipUnless("replica" in settings.DATABASES, "aucun alias `replica` dans DATABASES")
+class ReplicaDatabaseTests(APITransactionTestCase):
+    """Bout en bout, avec un alias `replica` (TEST MIRROR vers `default`)"""
+    # Les tests ignorés déclarent aussi leurs bases : `replica` n'est demandé que s'il existe
+    databases = {alias for alias in ("default", "replica") if alias in settings.DATABASES}
+
+    def setUp(self):
+        caches[settings.REPLICA_PIN_CACHE_ALIAS].clear()
+        webtoon_cache.backend.clear()
+        self.user = User.objects.create_user(email="user@test.com", username="user", password="1234")
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.webtoon = Webtoon.objects.create(title="Webtoon", authors="A", status="Ongoing", add_by=self.user)
+        self.detail_url = f"/api/webtoons/{self.webtoon.id}/"
+
+    def test_list_reads_replica(self):
+        """✅ La liste est lue sur le réplica"""
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get("/api/webtoons/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(len(replica.captured_queries), 0)
+
+    def test_read_your_writes(self):
+        """✅ Le GET qui suit une modification est servi par la base principale"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        response = self.client.patch(self.detail_url, {"title": "Renamed"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["title"], "Renamed")
+        self.assertEqual(len(replica.captured_queries), 0)
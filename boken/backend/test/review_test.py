@@ -0,0 +1,132 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class ReviewTests(APITestCase):
+    def setUp(self):
+        self.queue_url = "/api/webtoons/review_queue/"
+        self.bulk_url = "/api/webtoons/bulk_review/"
+        webtoon_cache.backend.clear()
+
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.admin_token = str(RefreshToken.for_user(self.admin).access_token)
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+
+        self.pending = Webtoon.objects.bulk_create([
+            Webtoon(title=f"Pending {i}", authors="A", status="Ongoing", waiting_review=True, add_by=self.user)
+            for i in range(3)
+        ])
+        self.reviewed = Webtoon.objects.create(title="Reviewed", authors="A", status="Ongoing", is_public=True)
+
+    def review(self, ids, decision):
+        return self.client.post(
+            self.bulk_url, {"ids": [str(pk) for pk in ids], "decision": decision}, format="json"
+        )
+
+    # === TESTS FILE D'ATTENTE ===
+    def test_review_queue(self):
+        """✅ La file ne contient que les webtoons en attente"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.client.get(self.queue_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(row["title"] for row in response.data["results"]), ["Pending 0", "Pending 1", "Pending 2"])
+
+    def test_review_queue_paginates(self):
+        """✅ La file est paginée par curseur"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        first = self.client.get(self.queue_url, {"page_size": 2})
+        second = self.client.get(first.data["next"])
+        titles = [row["title"] for row in first.data["results"] + second.data["results"]]
+        self.assertEqual(sorted(titles), ["Pending 0", "Pending 1", "Pending 2"])
+
+    def test_review_queue_filters_on_waiting_review(self):
+        """✅ La page de la file filtre sur waiting_review (index partiel)"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.queue_url, {"fields": "id,title"})
+        self.assertIn('"waiting_review"', queries.captured_queries[-1]["sql"])
+
+    def test_user_cannot_see_queue(self):
+        """🚫 Un utilisateur simple n'a pas accès à la file"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.get(self.queue_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    # === TESTS MODÉRATION EN LOT ===
+    def test_bulk_approve(self):
+        """✅ Approuver rend les webtoons publics et les sort de la file"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.review([webtoon.id for webtoon in self.pending[:2]], "approve")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"decision": "approve", "requested": 2, "updated": 2, "skipped": 0})
+        approved = Webtoon.objects.filter(title__in=["Pending 0", "Pending 1"])
+        self.assertTrue(all(webtoon.is_public and not webtoon.waiting_review for webtoon in approved))
+        queue = self.client.get(self.queue_url)
+        self.assertEqual([row["title"] for row in queue.data["results"]], ["Pending 2"])
+
+    def test_bulk_reject(self):
+        """✅ Rejeter sort les webtoons de la file sans les publier"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        self.review([self.pending[0].id], "reject")
+        webtoon = Webtoon.objects.get(pk=self.pending[0].id)
+        self.assertFalse(webtoon.is_public)
+        self.assertFalse(webtoon.waiting_review)
+
+    def test_bulk_review_skips_reviewed_and_unknown(self):
+        """✅ Les webtoons déjà modérés ou inconnus sont comptés à part"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.review([self.pending[0].id, self.reviewed.id, uuid.uuid4()], "reject")
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(response.data["skipped"], 2)
+        self.assertTrue(Webtoon.objects.get(pk=self.reviewed.id).is_public)
+
+    def test_bulk_review_single_update_and_invalidation(self):
+        """✅ Tout le lot tient en un UPDATE et une seule invalidation du cache"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        version = webtoon_cache.get_version()
+        with CaptureQueriesContext(connection) as queries:
+            self.review([webtoon.id for webtoon in self.pending], "approve")
+        updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(webtoon_cache.get_version(), version + 1)
+
+    def test_bulk_review_invalidates_list(self):
+        """✅ La liste en cache voit le résultat de la modération"""
+        self.client.get("/api/webtoons/")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        self.review([self.pending[0].id], "approve")
+        response = self.client.get("/api/webtoons/", {"is_public": "true"})
+        self.assertIn("Pending 0", [row["title"] for row in response.data["results"]])
+
+    def test_bulk_review_invalid_decision(self):
+        """🚫 Une décision inconnue retourne 400"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.review([self.pending[0].id], "maybe")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_review_empty(self):
+        """🚫 Une liste d'ids vide retourne 400"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+        response = self.review([], "approve")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_user_cannot_bulk_review(self):
+        """🚫 Un utilisateur simple ne peut pas modérer"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.review([self.pending[0].id], "approve")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,77 @@
+import datetime
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.models.webtoon import Webtoon
+from api.renderers import FastJSONRenderer
+from api.rows import RowSerializer
+from api.serializers import UserSerializer, WebtoonSerializer
+
+User = get_user_model()
+
+
+class RowSerializerParityTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_admin(
+            email="admin@test.com", username="admin", password="admin1234"
+        )
+        self.user = User.objects.create_user(
+            email="élise@test.com", username="Élise", password="1234"
+        )
+        Webtoon.objects.create(
+            title="Solo Leveling", authors="Chugong", status="Finished", rating=4.75,
+            is_public=True, add_by=self.user, release_date=datetime.date(2018, 3, 4),
+        )
+        Webtoon.objects.create(
+            title="L'Héritière   «spéciale»", authors="Ünïcode 作者", status="Ongoing",
+            add_by=self.admin, waiting_review=True,
+        )
+        Webtoon.objects.create(title="Orphan", authors="Nobody", status="Hiatus", rating=0.1)
+
+    def test_rows_match_serializer(self):
+        """✅ Les lignes `.values()` produisent exactement la sortie de WebtoonSerializer"""
+        queryset = Webtoon.objects.select_related("add_by").order_by("title")
+        expected = WebtoonSerializer(queryset, many=True).data
+
+        row_serializer = RowSerializer(WebtoonSerializer())
+        self.assertEqual(row_serializer.serialize(row_serializer.rows(queryset)), expected)
+
+    def test_nested_user_matches_serializer(self):
+        """✅ Les utilisateurs (mot de passe exclu) sont identiques à UserSerializer"""
+        queryset = User.objects.order_by("username")
+        row_serializer = RowSerializer(UserSerializer())
+        rows = row_serializer.serialize(row_serializer.rows(queryset))
+        self.assertEqual(rows, UserSerializer(queryset, many=True).data)
+        self.assertNotIn("password", rows[0])
+
+    def test_renderer_matches_stdlib(self):
+        """✅ FastJSONRenderer produit les mêmes octets que JSONRenderer"""
+        data = WebtoonSerializer(Webtoon.objects.order_by("title"), many=True).data
+        data = {"next": None, "results": data, "ok": True, "count": 3}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_renderer_falls_back_for_other_types(self):
+        """✅ Les types non JSON (dates, etc.) passent par l'encodeur de DRF"""
+        data = {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_list_endpoint_matches_serializer(self):
+        """✅ La liste servie par le chemin rapide est identique à l'ancienne sortie"""
+        response = self.client.get("/api/webtoons/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = WebtoonSerializer(
+            Webtoon.objects.select_related("add_by").order_by("-update_at", "-id"), many=True
+        ).data
+        self.assertEqual(json.loads(response.content)["results"], json.loads(json.dumps(expected)))
+
+    def test_users_list_endpoint_matches_serializer(self):
+        """✅ La liste des utilisateurs passe aussi par le chemin rapide"""
+        token = str(RefreshToken.for_user(self.admin).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.get("/api/users/")
+        expected = UserSerializer(User.objects.order_by("-update_at", "-id"), many=True).data
+        self.assertEqual(response.data["results"], expected)
@@ -0,0 +1,46 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from api.models.webtoon import Webtoon
+
+
+class WebtoonSearchTests(APITestCase):
+    def setUp(self):
+        self.search_url = "/api/webtoons/search/"
+        Webtoon.objects.create(title="Solo Leveling", authors="Chugong", status="Finished")
+        Webtoon.objects.create(title="Tower of God", authors="SIU", status="Ongoing")
+        Webtoon.objects.create(title="The God of High School", authors="Yongje Park", status="Finished")
+        Webtoon.objects.create(title="Omniscient Reader", authors="Sing Shong", status="Ongoing")
+
+    def titles(self, response):
+        return [row["title"] for row in response.data["results"]]
+
+    def test_search_by_title(self):
+        """✅ La recherche trouve un webtoon par son titre"""
+        response = self.client.get(self.search_url, {"q": "solo"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.titles(response), ["Solo Leveling"])
+
+    def test_search_by_author(self):
+        """✅ La recherche trouve un webtoon par ses auteurs"""
+        response = self.client.get(self.search_url, {"q": "chugong"})
+        self.assertEqual(self.titles(response), ["Solo Leveling"])
+
+    def test_search_ranks_best_match_first(self):
+        """✅ Le titre exact est classé avant les correspondances partielles"""
+        response = self.client.get(self.search_url, {"q": "tower of god"})
+        self.assertEqual(self.titles(response)[0], "Tower of God")
+
+    def test_search_every_term_must_match(self):
+        """✅ Tous les mots de la requête doivent correspondre"""
+        response = self.client.get(self.search_url, {"q": "god school"})
+        self.assertEqual(self.titles(response), ["The God of High School"])
+
+    def test_search_limit(self):
+        """✅ Le nombre de résultats est limité par `limit`"""
+        response = self.client.get(self.search_url, {"q": "o", "limit": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_search_requires_query(self):
+        """🚫 Le paramètre `q` est obligatoire"""
+        response = self.client.get(self.search_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from api.cache import webtoon_cache
+from api.models import Genre, Tombstone
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class SyncTests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        self.changes_url = "/api/webtoons/changes/"
+        webtoon_cache.backend.clear()
+
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+        self.user_token = str(RefreshToken.for_user(self.user).access_token)
+        gone = Webtoon.objects.create(title="Gone", authors="A", status="Ongoing")
+        self.gone_id = gone.id
+        gone.delete()
+        self.webtoons = [
+            Webtoon.objects.create(title=f"Webtoon {i}", authors="A", status="Ongoing", add_by=self.user)
+            for i in range(3)
+        ]
+
+    def sync(self, since=None, **params):
+        if since is not None:
+            params["since"] = since
+        response = self.client.get(self.changes_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def titles(self, data):
+        return [row["title"] for row in data["results"]]
+
+    # === TESTS SYNCHRONISATION ===
+    def test_first_sync(self):
+        """✅ Le premier appel rend tout le catalogue, sans les suppressions passées"""
+        data = self.sync()
+        self.assertEqual(self.titles(data), ["Webtoon 0", "Webtoon 1", "Webtoon 2"])
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+
+    def test_nothing_changed(self):
+        """✅ Sans changement, rien n'est renvoyé"""
+        data = self.sync(self.sync()["watermark"])
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["deleted"], [])
+
+    def test_updated_webtoon(self):
+        """✅ Seuls les webtoons modifiés depuis le watermark sont renvoyés"""
+        watermark = self.sync()["watermark"]
+        self.webtoons[1].title = "Renamed"
+        self.webtoons[1].save()
+        data = self.sync(watermark)
+        self.assertEqual(self.titles(data), ["Renamed"])
+        self.assertEqual(self.sync(data["watermark"])["results"], [])
+
+    def test_related_change(self):
+        """✅ Un changement de genres compte comme une modification"""
+        watermark = self.sync()["watermark"]
+        self.webtoons[0].genres.add(Genre.objects.create(name="Action"))
+        self.assertEqual(self.titles(self.sync(watermark)), ["Webtoon 0"])
+
+    def test_deleted_webtoon(self):
+        """✅ Une suppression laisse un tombstone renvoyé une seule fois"""
+        watermark = self.sync()["watermark"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+        response = self.client.delete(f"{self.webtoons_url}{self.webtoons[2].id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        data = self.sync(watermark)
+        self.assertEqual(data["deleted"], [self.webtoons[2].id])
+        self.assertEqual(self.sync(data["watermark"])["deleted"], [])
+
+    def test_tombstone_written_on_delete(self):
+        """✅ Le tombstone garde l'id du webtoon supprimé"""
+        self.assertTrue(Tombstone.objects.filter(model="api.webtoon", object_id=self.gone_id).exists())
+
+    def test_pages(self):
+        """✅ `has_more` invite à rappeler avec le nouveau watermark"""
+        first = self.sync(limit=2)
+        self.assertTrue(first["has_more"])
+        second = self.sync(first["watermark"], limit=2)
+        self.assertFalse(second["has_more"])
+        self.assertEqual(self.titles(first) + self.titles(second), ["Webtoon 0", "Webtoon 1", "Webtoon 2"])
+
+    def test_fields(self):
+        """✅ `fields` s'applique aux lignes renvoyées"""
+        data = self.sync(fields="id,title")
+        self.assertEqual(set(data["results"][0]), {"id", "title"})
+
+    @override_settings(SYNC_SETTLE_SECONDS=60)
+    def test_recent_changes_settle(self):
+        """✅ Les changements trop récents attendent la fin de la fenêtre de stabilisation"""
+        self.assertEqual(self.sync()["results"], [])
+
+    def test_invalid_watermark(self):
+        """🚫 Un watermark illisible retourne 400"""
+        response = self.client.get(self.changes_url, {"since": "not-a-watermark"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # === TESTS RÉTENTION ===
+    def test_prune_keeps_recent_tombstones(self):
+        """✅ La purge ne supprime que les tombstones plus anciens que la rétention"""
+        Tombstone.objects.create(model="api.webtoon", object_id=self.webtoons[0].id,
+                                 update_at=timezone.now() - timedelta(seconds=settings.SYNC_TOMBSTONE_TTL + 60))
+        out = StringIO()
+        call_command("prune_tombstones", batch_size=1, stdout=out)
+        self.assertIn("1 tombstone(s)", out.getvalue())
+        self.assertEqual(list(Tombstone.objects.values_list("object_id", flat=True)), [self.gone_id])
+
+    def test_watermark_older_than_retention(self):
+        """🚫 Un watermark plus ancien que la rétention demande une resynchronisation complète"""
+        watermark = self.sync()["watermark"]
+        with override_settings(SYNC_TOMBSTONE_TTL=0):
+            response = self.client.get(self.changes_url, {"since": watermark})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertTrue(response.data["resync_required"])
+        # Un watermark récent reste valable
+        self.assertEqual(self.sync(watermark)["results"], [])
+
+    def test_paged_tombstones_keep_position(self):
+        """✅ Les suppressions paginées ne marquent comme vu que ce qui a été remis"""
+        watermark = self.sync()["watermark"]
+        for webtoon in self.webtoons:
+            webtoon.delete()
+        first = self.sync(watermark, limit=2)
+        self.assertTrue(first["has_more"])
+        second = self.sync(first["watermark"], limit=2)
+        self.assertEqual(len(first["deleted"]) + len(second["deleted"]), 3)
@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """Ajoute `assertMaxQueries` : échoue si un bloc dépasse un nombre de requêtes SQL"""
+
+    @contextmanager
+    def assertMaxQueries(self, budget, using="default"):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        executed = len(context.captured_queries)
+        if executed > budget:
+            queries = "\n".join(
+                f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f"{executed} requêtes exécutées, budget de {budget} :\n{queries}")
@@ -0,0 +1,109 @@
+import time
+import uuid
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api.cache import webtoon_cache
+from api.models import Genre, Release, Tombstone, UserWebtoon
+from api.models.base_model import uuid7
+from api.models.webtoon import Webtoon
+
+User = get_user_model()
+
+
+class Uuid7Tests(APITestCase):
+    def setUp(self):
+        self.webtoons_url = "/api/webtoons/"
+        webtoon_cache.backend.clear()
+        self.user = User.objects.create_user(
+            email="user@test.com", username="user", password="1234"
+        )
+
+    def legacy_webtoon(self, title):
+        """Un webtoon avec une ancienne clé v4, relié à un genre, une traduction et une bibliothèque"""
+        webtoon = Webtoon.objects.create(id=uuid.uuid4(), title=title, authors="A", status="Ongoing", add_by=self.user)
+        webtoon.genres.add(Genre.objects.get_or_create(name="Action")[0])
+        Release.objects.create(webtoon=webtoon, language="fr")
+        UserWebtoon.objects.create(user=self.user, webtoon=webtoon)
+        return webtoon
+
+    # === TESTS GÉNÉRATION ===
+    def test_uuid7_layout(self):
+        """✅ Version 7, variante RFC, horodatage en millisecondes"""
+        before = time.time_ns() // 1_000_000
+        key = uuid7()
+        self.assertEqual(key.version, 7)
+        self.assertEqual(key.variant, uuid.RFC_4122)
+        self.assertGreaterEqual(key.int >> 80, before)
+        self.assertLessEqual(key.int >> 80, time.time_ns() // 1_000_000)
+
+    def test_uuid7_is_increasing(self):
+        """✅ Les clés d'un process sont strictement croissantes, même dans la même milliseconde"""
+        keys = [uuid7() for _ in range(10000)]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_uuid7_from_timestamp(self):
+        """✅ Une clé peut être datée dans le passé"""
+        self.assertEqual(uuid7(1_600_000_000_000).int >> 80, 1_600_000_000_000)
+
+    def test_new_rows_use_uuid7(self):
+        """✅ Les nouvelles lignes reçoivent des clés v7, exposées telles quelles par l'API"""
+        webtoon = Webtoon.objects.create(title="New", authors="A", status="Ongoing")
+        self.assertEqual(webtoon.id.version, 7)
+        response = self.client.get(f"{self.webtoons_url}{webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], str(webtoon.id))
+
+    # === TESTS MIGRATION DES CLÉS ===
+    def test_rekey(self):
+        """✅ La commande remplace les clés v4 et suit toutes les références"""
+        webtoon = self.legacy_webtoon("Legacy")
+        call_command("rekey_uuid7", "api.Webtoon", stdout=StringIO())
+
+        rekeyed = Webtoon.objects.get(title="Legacy")
+        self.assertEqual(rekeyed.id.version, 7)
+        self.assertEqual(rekeyed.id.int >> 80, int(webtoon.create_at.timestamp() * 1000))
+        self.assertEqual([genre.name for genre in rekeyed.genres.all()], ["Action"])
+        self.assertEqual(rekeyed.releases.count(), 1)
+        self.assertTrue(UserWebtoon.objects.filter(user=self.user, webtoon=rekeyed).exists())
+        self.assertTrue(Tombstone.objects.filter(model="api.webtoon", object_id=webtoon.id).exists())
+
+        response = self.client.get(f"{self.webtoons_url}{webtoon.id}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rekey_in_batches(self):
+        """✅ Plusieurs lots, et une relance ne change plus rien"""
+        for i in range(5):
+            self.legacy_webtoon(f"Legacy {i}")
+        out = StringIO()
+        call_command("rekey_uuid7", "api.Webtoon", "--batch-size", "2", stdout=out)
+        self.assertIn("api.Webtoon: 5", out.getvalue())
+        self.assertTrue(all(pk.version == 7 for pk in Webtoon.objects.values_list("id", flat=True)))
+
+        out = StringIO()
+        call_command("rekey_uuid7", "api.Webtoon", stdout=out)
+        self.assertIn("api.Webtoon: 0", out.getvalue())
+
+    def test_rekey_dry_run(self):
+        """✅ `--dry-run` compte sans modifier"""
+        webtoon = self.legacy_webtoon("Legacy")
+        out = StringIO()
+        call_command("rekey_uuid7", "api.Webtoon", "--dry-run", stdout=out)
+        self.assertIn("api.Webtoon: 1", out.getvalue())
+        self.assertTrue(Webtoon.objects.filter(pk=webtoon.id).exists())
+
+    def test_rekey_skips_users_by_default(self):
+        """✅ Les utilisateurs ne sont renouvelés que sur demande (leurs JWT portent l'ancien id)"""
+        legacy = User.objects.create_user(email="legacy@test.com", username="legacy", password="1234")
+        User.objects.filter(pk=legacy.pk).update(id=uuid.uuid4())
+        call_command("rekey_uuid7", stdout=StringIO())
+        self.assertEqual(User.objects.get(username="legacy").id.version, 4)
+
+    def test_rekey_unknown_model(self):
+        """🚫 Un modèle inconnu est refusé"""
+        with self.assertRaises(Exception):
+            call_command("rekey_uuid7", "api.Nope", stdout=StringIO())
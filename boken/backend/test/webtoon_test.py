@@ -60,7 +60,7 @@ class WebtoonPermissionTests(APITestCase):
         """✅ Tout le monde peut lister les webtoons"""
         response = self.client.get(self.webtoons_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 2)
+        self.assertGreaterEqual(len(response.data["results"]), 2)
 
     def test_user_can_retrieve_own_webtoon(self):
         """✅ Un user peut voir son webtoon"""